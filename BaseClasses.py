@@ -11,7 +11,7 @@ from collections import Counter, deque, defaultdict
 from collections.abc import Collection, MutableSequence
 from enum import IntEnum, IntFlag
 from typing import (AbstractSet, Any, Callable, ClassVar, Dict, Iterable, Iterator, List, Literal, Mapping, NamedTuple,
-                    Optional, Protocol, Set, Tuple, Union, TYPE_CHECKING, Literal, overload)
+                    Optional, Protocol, Set, Tuple, TypeVar, Union, TYPE_CHECKING, Literal, overload)
 import dataclasses
 
 from typing_extensions import NotRequired, TypedDict
@@ -715,11 +715,122 @@ class MultiWorld():
 PathValue = Tuple[str, Optional["PathValue"]]
 
 
+_T = TypeVar("_T")
+
+
+class _CopyOnWriteDict(Dict[int, _T]):
+    """
+    Player -> container of a CollectionState, like prog_items, that shares containers with its copies.
+
+    Looking a player up hands out a container that is owned by this dict and can be modified, copying it first if it
+    may still be in another dict. Copying the dict only shares containers that were never handed out, the others are
+    copied right away, as the references handed out may still be used to modify them. Containers the dict is created
+    with are taken over, so they must not be referenced anywhere else.
+
+    CollectionState itself reads containers through peek() and changes them through own(), neither of which hands them
+    out, so copies keep sharing the containers of players that did not change since.
+    """
+    __slots__ = ("owned", "handed_out")
+    owned: Set[int]
+    """Players whose container is in no other dict, so it can be modified"""
+    handed_out: Set[int]
+    """Players whose container was looked up, so it may be modified without going through this dict"""
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.owned = set(dict.keys(self))
+        self.handed_out = set()
+
+    # returns the container of a player that may be shared, so it must only be read
+    peek = dict.__getitem__
+
+    def own(self, player: int) -> _T:
+        """Returns the container of a player for it to be modified right away, copying it first if it is shared."""
+        container = dict.__getitem__(self, player)
+        if player not in self.owned:
+            container = container.copy()
+            dict.__setitem__(self, player, container)
+            self.owned.add(player)
+        return container
+
+    def __getitem__(self, player: int) -> _T:
+        container = self.own(player)
+        self.handed_out.add(player)
+        return container
+
+    def copy(self) -> _CopyOnWriteDict[_T]:
+        ret: _CopyOnWriteDict[_T] = _CopyOnWriteDict()
+        dict.update(ret, dict.items(self))
+        for player in self.handed_out:
+            dict.__setitem__(ret, player, dict.__getitem__(self, player).copy())
+        ret.owned = set(self.handed_out)
+        self.owned = set(self.handed_out)
+        return ret
+
+    def get(self, player: int, default: Any = None) -> Any:
+        return self[player] if player in self else default
+
+    def __setitem__(self, player: int, container: _T) -> None:
+        self.owned.add(player)
+        self.handed_out.add(player)
+        dict.__setitem__(self, player, container)
+
+    def __delitem__(self, player: int) -> None:
+        dict.__delitem__(self, player)
+        self.owned.discard(player)
+        self.handed_out.discard(player)
+
+    def setdefault(self, player: int, default: Any = None) -> Any:
+        if player in self:
+            return self[player]
+        self[player] = default
+        return default
+
+    def pop(self, player: int, *default: Any) -> Any:
+        if player not in self:
+            return dict.pop(self, player, *default)
+        container = self.own(player)
+        del self[player]
+        return container
+
+    def popitem(self) -> Tuple[int, Any]:
+        if not self:
+            return dict.popitem(self)
+        player = next(reversed(self))
+        return player, self.pop(player)
+
+    def clear(self) -> None:
+        self.owned.clear()
+        self.handed_out.clear()
+        dict.clear(self)
+
+    def update(self, *args: Any, **kwargs: Any) -> None:
+        for player, container in dict(*args, **kwargs).items():
+            self[player] = container
+
+    def __iter__(self) -> Iterator[int]:
+        # not dict's own iterator, so dict(), ** and the like look containers up instead of taking them as they are
+        return dict.__iter__(self)
+
+    def __ior__(self, other: Any) -> _CopyOnWriteDict[_T]:
+        self.update(other)
+        return self
+
+    def values(self) -> Any:
+        return [self[player] for player in self]
+
+    def items(self) -> Any:
+        return [(player, self[player]) for player in self]
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        return _CopyOnWriteDict, (dict(self),)
+
+
 class CollectionState():
-    prog_items: Dict[int, Counter[str]]
+    prog_items: _CopyOnWriteDict[Counter[str]]
     multiworld: MultiWorld
-    reachable_regions: Dict[int, Set[Region]]
-    blocked_connections: Dict[int, Set[Entrance]]
+    reachable_regions: _CopyOnWriteDict[Set[Region]]
+    blocked_connections: _CopyOnWriteDict[Set[Entrance]]
     advancements: Set[Location]
     path: Dict[Union[Region, Entrance], PathValue]
     locations_checked: Set[Location]
@@ -730,10 +841,10 @@ class CollectionState():
 
     def __init__(self, parent: MultiWorld, allow_partial_entrances: bool = False):
         assert parent.worlds, "CollectionState created without worlds initialized in parent"
-        self.prog_items = {player: Counter() for player in parent.get_all_ids()}
+        self.prog_items = _CopyOnWriteDict((player, Counter()) for player in parent.get_all_ids())
         self.multiworld = parent
-        self.reachable_regions = {player: set() for player in parent.get_all_ids()}
-        self.blocked_connections = {player: set() for player in parent.get_all_ids()}
+        self.reachable_regions = _CopyOnWriteDict((player, set()) for player in parent.get_all_ids())
+        self.blocked_connections = _CopyOnWriteDict((player, set()) for player in parent.get_all_ids())
         self.advancements = set()
         self.path = {}
         self.locations_checked = set()
@@ -748,14 +859,14 @@ class CollectionState():
     def update_reachable_regions(self, player: int):
         self.stale[player] = False
         world: AutoWorld.World = self.multiworld.worlds[player]
-        reachable_regions = self.reachable_regions[player]
-        queue = deque(self.blocked_connections[player])
+        reachable_regions = self.reachable_regions.own(player)
+        queue = deque(self.blocked_connections.peek(player))
         start: Region = world.get_region(world.origin_region_name)
 
         # init on first call - this can't be done on construction since the regions don't exist yet
         if start not in reachable_regions:
             reachable_regions.add(start)
-            self.blocked_connections[player].update(start.exits)
+            self.blocked_connections.own(player).update(start.exits)
             queue.extend(start.exits)
 
         if world.explicit_indirect_conditions:
@@ -764,8 +875,8 @@ class CollectionState():
             self._update_reachable_regions_auto_indirect_conditions(player, queue)
 
     def _update_reachable_regions_explicit_indirect_conditions(self, player: int, queue: deque):
-        reachable_regions = self.reachable_regions[player]
-        blocked_connections = self.blocked_connections[player]
+        reachable_regions = self.reachable_regions.own(player)
+        blocked_connections = self.blocked_connections.own(player)
         # run BFS on all connections, and keep track of those blocked by missing items
         while queue:
             connection = queue.popleft()
@@ -788,8 +899,8 @@ class CollectionState():
                         queue.append(new_entrance)
 
     def _update_reachable_regions_auto_indirect_conditions(self, player: int, queue: deque):
-        reachable_regions = self.reachable_regions[player]
-        blocked_connections = self.blocked_connections[player]
+        reachable_regions = self.reachable_regions.own(player)
+        blocked_connections = self.blocked_connections.own(player)
         new_connection: bool = True
         # run BFS on all connections, and keep track of those blocked by missing items
         while new_connection:
@@ -814,11 +925,10 @@ class CollectionState():
 
     def copy(self) -> CollectionState:
         ret = CollectionState(self.multiworld)
-        ret.prog_items = {player: counter.copy() for player, counter in self.prog_items.items()}
-        ret.reachable_regions = {player: region_set.copy() for player, region_set in
-                                 self.reachable_regions.items()}
-        ret.blocked_connections = {player: entrance_set.copy() for player, entrance_set in
-                                   self.blocked_connections.items()}
+        # containers of players that don't change are shared instead of copied, see _CopyOnWriteDict
+        ret.prog_items = self.prog_items.copy()
+        ret.reachable_regions = self.reachable_regions.copy()
+        ret.blocked_connections = self.blocked_connections.copy()
         ret.advancements = self.advancements.copy()
         ret.path = self.path.copy()
         ret.locations_checked = self.locations_checked.copy()
@@ -987,14 +1097,14 @@ class CollectionState():
 
     # item name related
     def has(self, item: str, player: int, count: int = 1) -> bool:
-        return self.prog_items[player][item] >= count
+        return self.prog_items.peek(player)[item] >= count
 
     # for loops are specifically used in all/any/count methods, instead of all()/any()/sum(), to avoid the overhead of
     # creating and iterating generator instances. In `return all(player_prog_items[item] for item in items)`, the
     # argument to all() would be a new generator instance, for example.
     def has_all(self, items: Iterable[str], player: int) -> bool:
         """Returns True if each item name of items is in state at least once."""
-        player_prog_items = self.prog_items[player]
+        player_prog_items = self.prog_items.peek(player)
         for item in items:
             if not player_prog_items[item]:
                 return False
@@ -1002,7 +1112,7 @@ class CollectionState():
 
     def has_any(self, items: Iterable[str], player: int) -> bool:
         """Returns True if at least one item name of items is in state at least once."""
-        player_prog_items = self.prog_items[player]
+        player_prog_items = self.prog_items.peek(player)
         for item in items:
             if player_prog_items[item]:
                 return True
@@ -1010,7 +1120,7 @@ class CollectionState():
 
     def has_all_counts(self, item_counts: Mapping[str, int], player: int) -> bool:
         """Returns True if each item name is in the state at least as many times as specified."""
-        player_prog_items = self.prog_items[player]
+        player_prog_items = self.prog_items.peek(player)
         for item, count in item_counts.items():
             if player_prog_items[item] < count:
                 return False
@@ -1018,19 +1128,19 @@ class CollectionState():
 
     def has_any_count(self, item_counts: Mapping[str, int], player: int) -> bool:
         """Returns True if at least one item name is in the state at least as many times as specified."""
-        player_prog_items = self.prog_items[player]
+        player_prog_items = self.prog_items.peek(player)
         for item, count in item_counts.items():
             if player_prog_items[item] >= count:
                 return True
         return False
 
     def count(self, item: str, player: int) -> int:
-        return self.prog_items[player][item]
+        return self.prog_items.peek(player)[item]
 
     def has_from_list(self, items: Iterable[str], player: int, count: int) -> bool:
         """Returns True if the state contains at least `count` items matching any of the item names from a list."""
         found: int = 0
-        player_prog_items = self.prog_items[player]
+        player_prog_items = self.prog_items.peek(player)
         for item_name in items:
             found += player_prog_items[item_name]
             if found >= count:
@@ -1041,7 +1151,7 @@ class CollectionState():
         """Returns True if the state contains at least `count` items matching any of the item names from a list.
         Ignores duplicates of the same item."""
         found: int = 0
-        player_prog_items = self.prog_items[player]
+        player_prog_items = self.prog_items.peek(player)
         for item_name in items:
             found += player_prog_items[item_name] > 0
             if found >= count:
@@ -1050,7 +1160,7 @@ class CollectionState():
 
     def count_from_list(self, items: Iterable[str], player: int) -> int:
         """Returns the cumulative count of items from a list present in state."""
-        player_prog_items = self.prog_items[player]
+        player_prog_items = self.prog_items.peek(player)
         total = 0
         for item_name in items:
             total += player_prog_items[item_name]
@@ -1058,7 +1168,7 @@ class CollectionState():
 
     def count_from_list_unique(self, items: Iterable[str], player: int) -> int:
         """Returns the cumulative count of items from a list present in state. Ignores duplicates of the same item."""
-        player_prog_items = self.prog_items[player]
+        player_prog_items = self.prog_items.peek(player)
         total = 0
         for item_name in items:
             if player_prog_items[item_name] > 0:
@@ -1069,7 +1179,7 @@ class CollectionState():
     def has_group(self, item_name_group: str, player: int, count: int = 1) -> bool:
         """Returns True if the state contains at least `count` items present in a specified item group."""
         found: int = 0
-        player_prog_items = self.prog_items[player]
+        player_prog_items = self.prog_items.peek(player)
         for item_name in self.multiworld.worlds[player].item_name_groups[item_name_group]:
             found += player_prog_items[item_name]
             if found >= count:
@@ -1081,7 +1191,7 @@ class CollectionState():
         Ignores duplicates of the same item.
         """
         found: int = 0
-        player_prog_items = self.prog_items[player]
+        player_prog_items = self.prog_items.peek(player)
         for item_name in self.multiworld.worlds[player].item_name_groups[item_name_group]:
             found += player_prog_items[item_name] > 0
             if found >= count:
@@ -1090,7 +1200,7 @@ class CollectionState():
 
     def count_group(self, item_name_group: str, player: int) -> int:
         """Returns the cumulative count of items from an item group present in state."""
-        player_prog_items = self.prog_items[player]
+        player_prog_items = self.prog_items.peek(player)
         return sum(
             player_prog_items[item_name]
             for item_name in self.multiworld.worlds[player].item_name_groups[item_name_group]
@@ -1099,7 +1209,7 @@ class CollectionState():
     def count_group_unique(self, item_name_group: str, player: int) -> int:
         """Returns the cumulative count of items from an item group present in state.
         Ignores duplicates of the same item."""
-        player_prog_items = self.prog_items[player]
+        player_prog_items = self.prog_items.peek(player)
         return sum(
             player_prog_items[item_name] > 0
             for item_name in self.multiworld.worlds[player].item_name_groups[item_name_group]
@@ -1128,14 +1238,14 @@ class CollectionState():
         :param count: How many of the item to add.
         """
         assert count > 0
-        self.prog_items[player][item] += count
+        self.prog_items.own(player)[item] += count
 
     def remove(self, item: Item):
         changed = self.multiworld.worlds[item.player].remove(self, item)
         if changed:
             # invalidate caches, nothing can be trusted anymore now
-            self.reachable_regions[item.player] = set()
-            self.blocked_connections[item.player] = set()
+            self.reachable_regions.own(item.player).clear()
+            self.blocked_connections.own(item.player).clear()
             self.stale[item.player] = True
 
     def remove_item(self, item: str, player: int, count: int = 1) -> None:
@@ -1147,9 +1257,10 @@ class CollectionState():
         :param count: How many of the item to remove.
         """
         assert count > 0
-        self.prog_items[player][item] -= count
-        if self.prog_items[player][item] < 1:
-            del (self.prog_items[player][item])
+        player_prog_items = self.prog_items.own(player)
+        player_prog_items[item] -= count
+        if player_prog_items[item] < 1:
+            del (player_prog_items[item])
 
     def set_item(self, item: str, player: int, count: int) -> None:
         """
@@ -1161,9 +1272,9 @@ class CollectionState():
         """
         assert count >= 0
         if count == 0:
-            del (self.prog_items[player][item])
+            del (self.prog_items.own(player)[item])
         else:
-            self.prog_items[player][item] = count
+            self.prog_items.own(player)[item] = count
 
 
 class EntranceType(IntEnum):
@@ -1330,7 +1441,7 @@ class Region:
     def can_reach(self, state: CollectionState) -> bool:
         if state.stale[self.player]:
             state.update_reachable_regions(self.player)
-        return self in state.reachable_regions[self.player]
+        return self in state.reachable_regions.peek(self.player)
 
     @property
     def hint_text(self) -> str:
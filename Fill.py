@@ -1,13 +1,16 @@
 import collections
 import itertools
 import logging
+import math
+import operator
+import time
 import typing
 from collections import Counter, deque
 
 from BaseClasses import CollectionState, Item, Location, LocationProgressType, MultiWorld, PlandoItemBlock
 from Options import Accessibility
 
-from worlds.AutoWorld import call_all
+from worlds.AutoWorld import call_all, perf_logger
 from worlds.generic.Rules import add_item_rule
 
 
@@ -20,8 +23,12 @@ class FillError(RuntimeError):
         super().__init__(*args)
 
 
-def _log_fill_progress(name: str, placed: int, total_items: int) -> None:
-    logging.info(f"Current fill step ({name}) at {placed}/{total_items} items placed.")
+def _log_fill_progress(name: str, placed: int, total_items: int,
+                       swap_state_cache: typing.Optional["_SwapStateCache"] = None) -> None:
+    message = f"Current fill step ({name}) at {placed}/{total_items} items placed."
+    if swap_state_cache and swap_state_cache.hits + swap_state_cache.misses:
+        message += f" Swap state cache: {swap_state_cache.hits} hits, {swap_state_cache.misses} misses."
+    logging.info(message)
 
 
 def sweep_from_pool(base_state: CollectionState, itempool: typing.Sequence[Item] = tuple(),
@@ -33,11 +40,428 @@ def sweep_from_pool(base_state: CollectionState, itempool: typing.Sequence[Item]
     return new_state
 
 
+class _LocationBucket:
+    """The locations of a _LocationIndex with the same progress type and item rules being the default or not."""
+    __slots__ = ("positions", "filled", "start", "removed", "excluded", "default_rules")
+
+    positions: typing.List[int]
+    """Positions in the index of the locations, ascending, including removed ones until compacted"""
+    filled: bytearray
+    """The index's, by position"""
+    start: int
+    """Slot of positions that comes before every location that was not removed"""
+    removed: int
+    """How many locations of positions were removed"""
+    excluded: bool
+    default_rules: bool
+
+    def __init__(self, filled: bytearray, excluded: bool, default_rules: bool) -> None:
+        self.positions = []
+        self.filled = filled
+        self.start = 0
+        self.removed = 0
+        self.excluded = excluded
+        self.default_rules = default_rules
+
+    def count_removed(self, count: int = 1) -> None:
+        self.removed += count
+        if self.removed > 32 and self.removed * 2 > len(self.positions):
+            # compact, so that removed locations don't have to be skipped over anymore
+            self.positions = [position for position in self.positions if not self.filled[position]]
+            self.start = 0
+            self.removed = 0
+
+
+class _LocationIndex:
+    """
+    The unfilled locations of a fill step, to find the first of them that can take an item without going through
+    every location before it.
+
+    The locations are bucketed by progress type and whether they use the default item rules, once for all of them and
+    once for each player. Buckets of locations using the default item rules are decided as a whole, without calling
+    their rules, other than checking reachability; the other buckets are gone through in order. The first location
+    that can take an item is the same as when going through the locations in order, so placements stay the same for a
+    seed. Removing a location only marks it, until the buckets it's in are compacted.
+    """
+    locations: typing.List[Location]
+    """The locations in the order they were given in"""
+    filled: bytearray
+    """Whether each location was removed, by position"""
+    count: int
+    start: int
+    """Position that comes before every location that was not removed"""
+    buckets: typing.List[_LocationBucket]
+    player_buckets: typing.Dict[int, typing.List[_LocationBucket]]
+    position_buckets: typing.List[typing.Tuple[_LocationBucket, _LocationBucket]]
+    """The bucket of buckets and of player_buckets each location is in, by position"""
+
+    def __init__(self, locations: typing.Iterable[Location]) -> None:
+        self.locations = list(locations)
+        self.filled = bytearray(len(self.locations))
+        self.count = len(self.locations)
+        self.start = 0
+        buckets: typing.Dict[typing.Tuple[bool, bool], _LocationBucket] = {}
+        bucket_pairs: typing.Dict[typing.Tuple[int, bool, bool], typing.Tuple[_LocationBucket, _LocationBucket]] = {}
+        self.player_buckets = {}
+        self.position_buckets = []
+        default_can_fill = Location.can_fill
+        default_item_rule = Location.item_rule
+        default_always_allow = Location.always_allow
+        for position, location in enumerate(self.locations):
+            key = (location.player, location.progress_type == LocationProgressType.EXCLUDED,
+                   location.item_rule is default_item_rule and location.always_allow is default_always_allow
+                   and type(location).can_fill is default_can_fill)
+            pair = bucket_pairs.get(key)
+            if pair is None:
+                player, excluded, default_rules = key
+                bucket = buckets.get((excluded, default_rules))
+                if bucket is None:
+                    bucket = buckets[excluded, default_rules] = _LocationBucket(self.filled, excluded, default_rules)
+                player_bucket = _LocationBucket(self.filled, excluded, default_rules)
+                self.player_buckets.setdefault(player, []).append(player_bucket)
+                pair = bucket_pairs[key] = bucket, player_bucket
+            pair[0].positions.append(position)
+            pair[1].positions.append(position)
+            self.position_buckets.append(pair)
+        self.buckets = list(buckets.values())
+
+    def __len__(self) -> int:
+        return self.count
+
+    def pop_first(self, can_fill: typing.Callable[[Location], bool],
+                  default_can_fill: typing.Optional[typing.Callable[[Location], bool]] = None, excluded: bool = True,
+                  player: typing.Optional[int] = None) -> typing.Optional[Location]:
+        """
+        Removes and returns the first location that can take an item, None if no location can.
+
+        :param can_fill: Whether a location can take the item.
+        :param default_can_fill: Whether a location using the default item rules can take the item, None for always.
+        :param excluded: Whether excluded locations using the default item rules can take the item.
+        :param player: Only look at the locations of this player.
+        """
+        checked_position = -1
+        if player is None:
+            # most of the time the first location can take the item
+            position = self.filled.find(0, self.start)
+            if position == -1:
+                return None
+            self.start = position
+            bucket = self.position_buckets[position][0]
+            if bucket.default_rules:
+                if (excluded or not bucket.excluded) \
+                        and (default_can_fill is None or default_can_fill(self.locations[position])):
+                    return self.remove(position)
+            elif can_fill(self.locations[position]):
+                return self.remove(position)
+            checked_position = position
+
+        found_position = len(self.locations)
+        # position, slot, bucket and check of the next location to check in each bucket that can't be decided as whole
+        cursors: typing.List[typing.List[typing.Any]] = []
+        filled = self.filled
+        for bucket in self.buckets if player is None else self.player_buckets.get(player, ()):
+            positions = bucket.positions
+            slot = bucket.start
+            while slot < len(positions) and filled[positions[slot]]:
+                slot += 1
+            bucket.start = slot
+            if slot == len(positions):
+                continue
+            check = can_fill
+            if bucket.default_rules:
+                if bucket.excluded and not excluded:
+                    continue
+                if default_can_fill is None:
+                    found_position = min(found_position, bucket.positions[slot])
+                    continue
+                check = default_can_fill
+            cursors.append([bucket.positions[slot], slot, bucket, check])
+        # merge the other buckets in order, until a location can take the item or they get past the one found
+        locations = self.locations
+        while cursors:
+            cursors.sort(key=operator.itemgetter(0))
+            cursor = cursors[0]
+            position, slot, bucket, check = cursor
+            if position > found_position:
+                break
+            # go through the bucket with the first location until it gets past another bucket's
+            limit = min(found_position, cursors[1][0]) if len(cursors) > 1 else found_position
+            positions = bucket.positions
+            for slot in range(slot, len(positions)):
+                position = positions[slot]
+                if position > limit:
+                    break
+                if not filled[position] and position != checked_position and check(locations[position]):
+                    return self.remove(position)
+            else:
+                cursors.pop(0)
+                continue
+            cursor[0] = position
+            cursor[1] = slot
+        if found_position == len(self.locations):
+            return None
+        return self.remove(found_position)
+
+    def pop_default_run(self, limit: int, excluded: bool = True) -> typing.List[Location]:
+        """
+        Removes and returns the locations from the first one on that use the default item rules, which can take any
+        item without checking reachability, up to limit of them.
+
+        :param limit: The most locations to return.
+        :param excluded: Whether excluded locations can be part of the run.
+        """
+        run: typing.List[Location] = []
+        filled = self.filled
+        locations = self.locations
+        position_buckets = self.position_buckets
+        position = self.filled.find(0, self.start)
+        if position == -1:
+            return run
+        self.start = position
+        removed: typing.Dict[typing.Tuple[_LocationBucket, _LocationBucket], int] = {}
+        while len(run) < limit and position < len(filled):
+            if not filled[position]:
+                buckets = position_buckets[position]
+                if not buckets[0].default_rules or (buckets[0].excluded and not excluded):
+                    break
+                filled[position] = True
+                removed[buckets] = removed.get(buckets, 0) + 1
+                run.append(locations[position])
+            position += 1
+        self.count -= len(run)
+        for buckets, count in removed.items():
+            for bucket in buckets:
+                bucket.count_removed(count)
+        return run
+
+    def remove(self, position: int) -> Location:
+        self.filled[position] = True
+        self.count -= 1
+        for bucket in self.position_buckets[position]:
+            bucket.count_removed()
+        return self.locations[position]
+
+    def remaining(self) -> typing.List[Location]:
+        """Returns the locations that were not removed, in the order they were given in."""
+        return [location for location, filled in zip(self.locations, self.filled) if not filled]
+
+
+def _reserve_next_items(queues: typing.Iterable[typing.Deque[Item]]) -> typing.Set[int]:
+    """Returns the ids of the next few items to be popped from the ends of queues."""
+    queues = [queue for queue in queues if queue]
+    # Reserving about the square root of the longest queue balances rebuilding a state every so many placements
+    # against collecting the reserved items into every state derived from it.
+    reserved_count = math.isqrt(max(map(len, queues), default=0)) or 1
+    return {id(item) for queue in queues for item in itertools.islice(reversed(queue), reserved_count)}
+
+
+class _ExplorationCheckpoint:
+    """
+    A swept state that fill_restrictive derives its maximum exploration states from, instead of collecting the whole
+    item pool into a copy of its base state and sweeping from there every time items are taken out of the pool.
+
+    The checkpoint has collected every item of the pool except the next few in each player's queue. Each maximum
+    exploration state is a copy of it that collects the items of the pool it has not collected and sweeps, so taking
+    one of those items out of the pool only drops the reachability that item could have granted. Once an item the
+    checkpoint collected leaves the pool, or an item is swapped out of a location it may have swept, it is no longer
+    known to be below the maximum exploration state, so it gets rebuilt from the base state.
+    """
+    base_state: CollectionState
+    state: typing.Optional[CollectionState]
+    collected_items: typing.Dict[int, Item]
+    """id -> item, for the items of the pool that were collected into state"""
+
+    def __init__(self, base_state: CollectionState) -> None:
+        self.base_state = base_state
+        self.state = None
+        self.collected_items = {}
+
+    def invalidate(self) -> None:
+        self.state = None
+        self.collected_items = {}
+
+    def maximum_exploration_state(self, pool: typing.List[Item], queues: typing.Iterable[typing.Deque[Item]],
+                                  locations: typing.Optional[typing.List[Location]]) -> CollectionState:
+        """
+        Returns the state of the base state sweeping with pool collected, which must not be modified.
+
+        :param pool: Every item still assumed to be collectable.
+        :param queues: The items of pool to be taken out next, in the order of being popped from their ends.
+        :param locations: The locations to sweep through, defaulting to all locations in the multiworld.
+        """
+        if self.state is not None:
+            uncollected_items = [item for item in pool if id(item) not in self.collected_items]
+            if len(pool) - len(uncollected_items) == len(self.collected_items):
+                # items placed since are collectable from any state above the checkpoint too
+                self.state.sweep_for_advancements(locations)
+                return sweep_from_pool(self.state, uncollected_items, locations) if uncollected_items else self.state
+
+        reserved_items = _reserve_next_items(queues)
+        self.collected_items = {id(item): item for item in pool if id(item) not in reserved_items}
+        self.state = sweep_from_pool(self.base_state, list(self.collected_items.values()), locations)
+        uncollected_items = [item for item in pool if id(item) in reserved_items]
+        return sweep_from_pool(self.state, uncollected_items, locations) if uncollected_items else self.state
+
+
+class _SwapStateEntry:
+    __slots__ = ("state", "collected_items", "uncollected_items", "swapped_count", "swap_state", "event", "weight")
+
+    state: CollectionState
+    """Swept with every item of the pool collected, except the next few in each player's queue"""
+    collected_items: typing.Set[int]
+    """The ids of the items of the pool that were collected into state"""
+    uncollected_items: typing.List[Item]
+    """The items of the pool of the current swap event that state has not collected"""
+    swapped_count: int
+    """How many locations had been swapped when the entry was created"""
+    swap_state: typing.Optional[CollectionState]
+    """state sweeping with the rest of the pool of swap event event collected"""
+    event: int
+    weight: int
+
+
+class _SwapStateCache:
+    """
+    The safe swap states of fill_restrictive, kept across its swap events, to sweep the next swap state from instead of
+    sweeping from the base state each time.
+
+    Entries are keyed by the placement that was taken out for them. Like _ExplorationCheckpoint, each one holds the
+    base state sweeping with the pool collected except for the next few items in each player's queue, so it stays usable
+    while those are placed. An entry can be used to take out another placement as long as it has not swept that
+    location, every item it collected is still in the pool and it has not swept a location that was swapped since.
+    Least recently used entries are evicted once there are more than size of them, or once all of them weigh more than
+    max_weight, weighing a state by the locations it checked and the regions and entrances it has paths for.
+    """
+    default_size: typing.ClassVar[int] = 8
+    default_max_weight: typing.ClassVar[int] = 2_000_000
+
+    base_state: CollectionState
+    locations: typing.Optional[typing.List[Location]]
+    size: int
+    max_weight: int
+    entries: typing.OrderedDict[Location, _SwapStateEntry]
+    """Least recently used first"""
+    swapped_locations: typing.List[Location]
+    event: int
+    pool: typing.List[Item]
+    pool_ids: typing.Set[int]
+    queues: typing.Iterable[typing.Deque[Item]]
+    weight: int
+    hits: int
+    misses: int
+
+    def __init__(self, base_state: CollectionState, size: int = default_size,
+                 max_weight: int = default_max_weight) -> None:
+        self.base_state = base_state
+        self.locations = None
+        self.size = size
+        self.max_weight = max_weight
+        self.entries = collections.OrderedDict()
+        self.swapped_locations = []
+        self.event = 0
+        self.pool = []
+        self.pool_ids = set()
+        self.queues = ()
+        self.weight = 0
+        self.hits = 0
+        self.misses = 0
+
+    def begin_swap_event(self, pool: typing.List[Item], queues: typing.Iterable[typing.Deque[Item]],
+                         locations: typing.Optional[typing.List[Location]]) -> None:
+        """
+        Starts looking for a swap, dropping the entries that can't be used anymore.
+
+        :param pool: The items assumed to be collectable, which must not change until the next swap event.
+        :param queues: The items of pool to be taken out next, in the order of being popped from their ends.
+        :param locations: The locations to sweep through, defaulting to all locations in the multiworld.
+        """
+        self.locations = locations
+        pool_ids = {id(item) for item in pool}
+        if pool_ids != self.pool_ids:
+            # swap states of previous events collected a different pool
+            self.event += 1
+            self.pool_ids = pool_ids
+        self.pool = pool
+        self.queues = queues
+        for location, entry in list(self.entries.items()):
+            if not entry.collected_items <= pool_ids or any(
+                    swapped in entry.state.advancements
+                    for swapped in itertools.islice(self.swapped_locations, entry.swapped_count, None)):
+                self.remove(location)
+            elif entry.event != self.event:
+                entry.swap_state = None
+                entry.uncollected_items = [item for item in pool if id(item) not in entry.collected_items]
+
+    def swap_state(self, location: Location, placed_item: Item, unsafe: bool) -> CollectionState:
+        """
+        Returns the state of the base state sweeping with the pool collected while location, which has been emptied,
+        can't be reached.
+
+        :param location: The location that placed_item was taken out of.
+        :param placed_item: The item that was taken out of location.
+        :param unsafe: Whether placed_item is assumed to be collectable too.
+        """
+        for key, entry in reversed(self.entries.items()):
+            if entry.swap_state is not None and location not in entry.swap_state.advancements:
+                # swap states of this event have collected the whole pool and checked many locations already
+                swap_state = sweep_from_pool(entry.swap_state, (placed_item,) if unsafe else (), self.locations)
+            elif location not in entry.state.advancements:
+                swap_state = sweep_from_pool(entry.state, [placed_item, *entry.uncollected_items]
+                                             if unsafe else entry.uncollected_items, self.locations)
+                if not unsafe:
+                    self.weight -= entry.weight
+                    entry.swap_state = swap_state
+                    entry.event = self.event
+                    entry.weight = self._weigh(entry.state) + self._weigh(swap_state)
+                    self.weight += entry.weight
+            else:
+                continue
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return swap_state
+
+        self.misses += 1
+        if unsafe:
+            # Unsafe states should not be added to the cache because they have collected `placed_item`.
+            return sweep_from_pool(self.base_state, [placed_item, *self.pool], self.locations)
+
+        reserved_items = _reserve_next_items(self.queues)
+        entry = _SwapStateEntry()
+        entry.state = sweep_from_pool(self.base_state, [item for item in self.pool if id(item) not in reserved_items],
+                                      self.locations)
+        entry.collected_items = self.pool_ids - reserved_items
+        entry.uncollected_items = [item for item in self.pool if id(item) in reserved_items]
+        entry.swapped_count = len(self.swapped_locations)
+        entry.swap_state = sweep_from_pool(entry.state, entry.uncollected_items, self.locations) \
+            if entry.uncollected_items else entry.state
+        entry.event = self.event
+        entry.weight = self._weigh(entry.state) + (self._weigh(entry.swap_state)
+                                                   if entry.swap_state is not entry.state else 0)
+        if location in self.entries:
+            self.remove(location)
+        self.entries[location] = entry
+        self.weight += entry.weight
+        while len(self.entries) > self.size or (self.weight > self.max_weight and len(self.entries) > 1):
+            self.remove(next(iter(self.entries)))
+        return entry.swap_state
+
+    def swapped(self, location: Location) -> None:
+        """Marks the item of location as having been swapped."""
+        self.swapped_locations.append(location)
+
+    def remove(self, location: Location) -> None:
+        self.weight -= self.entries.pop(location).weight
+
+    @staticmethod
+    def _weigh(state: CollectionState) -> int:
+        return len(state.locations_checked) + len(state.path)
+
+
 def fill_restrictive(multiworld: MultiWorld, base_state: CollectionState, locations: typing.List[Location],
                      item_pool: typing.List[Item], single_player_placement: bool = False, lock: bool = False,
                      swap: bool = True, on_place: typing.Optional[typing.Callable[[Location], None]] = None,
                      allow_partial: bool = False, allow_excluded: bool = False, one_item_per_player: bool = True,
-                     name: str = "Unknown") -> None:
+                     name: str = "Unknown", swap_state_cache_size: int = _SwapStateCache.default_size) -> None:
     """
     :param multiworld: Multiworld to be filled.
     :param base_state: State assumed before fill.
@@ -50,6 +474,7 @@ def fill_restrictive(multiworld: MultiWorld, base_state: CollectionState, locati
     :param allow_partial: only place what is possible. Remaining items will be in the item_pool list.
     :param allow_excluded: if true and placement fails, it is re-attempted while ignoring excluded on Locations
     :param name: name of this fill step for progress logging purposes
+    :param swap_state_cache_size: how many swap states to keep to sweep later swap states from
     """
     unplaced_items: typing.List[Item] = []
     placements: typing.List[Location] = []
@@ -63,7 +488,11 @@ def fill_restrictive(multiworld: MultiWorld, base_state: CollectionState, locati
     total = min(len(item_pool), len(locations))
     placed = 0
 
-    while any(reachable_items.values()) and locations:
+    checkpoint = _ExplorationCheckpoint(base_state)
+    location_index = _LocationIndex(locations)
+    swap_state_cache = _SwapStateCache(base_state, swap_state_cache_size)
+
+    while any(reachable_items.values()) and location_index:
         if one_item_per_player:
             # grab one item per player
             items_to_place = [items.pop()
@@ -82,15 +511,15 @@ def fill_restrictive(multiworld: MultiWorld, base_state: CollectionState, locati
                     del item_pool[-p]
                     break
 
-        maximum_exploration_state = sweep_from_pool(
-            base_state, item_pool + unplaced_items, multiworld.get_filled_locations(item.player)
+        maximum_exploration_state = checkpoint.maximum_exploration_state(
+            item_pool + unplaced_items, reachable_items.values(), multiworld.get_filled_locations(item.player)
             if single_player_placement else None)
 
         has_beaten_game = multiworld.has_beaten_game(maximum_exploration_state)
 
         while items_to_place:
             # if we have run out of locations to fill,break out of this loop
-            if not locations:
+            if not location_index:
                 unplaced_items += items_to_place
                 break
             item_to_place = items_to_place.pop(0)
@@ -105,23 +534,18 @@ def fill_restrictive(multiworld: MultiWorld, base_state: CollectionState, locati
             else:
                 perform_access_check = True
 
-            for i, location in enumerate(locations):
-                if (not single_player_placement or location.player == item_to_place.player) \
-                        and location.can_fill(maximum_exploration_state, item_to_place, perform_access_check):
-                    # popping by index is faster than removing by content,
-                    spot_to_fill = locations.pop(i)
-                    # skipping a scan for the element
-                    break
+            spot_to_fill = location_index.pop_first(
+                lambda location: location.can_fill(maximum_exploration_state, item_to_place, perform_access_check),
+                (lambda location: location.can_reach(maximum_exploration_state)) if perform_access_check else None,
+                not (item_to_place.advancement or item_to_place.useful),
+                item_to_place.player if single_player_placement else None)
 
-            else:
+            if spot_to_fill is None:
                 # we filled all reachable spots.
                 if swap:
-                    # Keep a cache of previous safe swap states that might be usable to sweep from to produce the next
-                    # swap state, instead of sweeping from `base_state` each time.
-                    previous_safe_swap_state_cache: typing.Deque[CollectionState] = deque()
-                    # Almost never are more than 2 states needed. The rare cases that do are usually highly restrictive
-                    # single_player_placement=True pre-fills which can go through more than 10 states in some seeds.
-                    max_swap_base_state_cache_length = 3
+                    swap_state_cache.begin_swap_event(item_pool, reachable_items.values(),
+                                                      multiworld.get_filled_locations(item.player)
+                                                      if single_player_placement else None)
 
                     # try swapping this item with previously placed items in a safe way then in an unsafe way
                     swap_attempts = ((i, location, unsafe)
@@ -138,29 +562,7 @@ def fill_restrictive(multiworld: MultiWorld, base_state: CollectionState, locati
                         location.item = None
                         placed_item.location = None
 
-                        for previous_safe_swap_state in previous_safe_swap_state_cache:
-                            # If a state has already checked the location of the swap, then it cannot be used.
-                            if location not in previous_safe_swap_state.advancements:
-                                # Previous swap states will have collected all items in `item_pool`, so the new
-                                # `swap_state` can skip having to collect them again.
-                                # Previous swap states will also have already checked many locations, making the sweep
-                                # faster.
-                                swap_state = sweep_from_pool(previous_safe_swap_state, (placed_item,) if unsafe else (),
-                                                             multiworld.get_filled_locations(item.player)
-                                                             if single_player_placement else None)
-                                break
-                        else:
-                            # No previous swap_state was usable as a base state to sweep from, so create a new one.
-                            swap_state = sweep_from_pool(base_state, [placed_item, *item_pool] if unsafe else item_pool,
-                                                         multiworld.get_filled_locations(item.player)
-                                                         if single_player_placement else None)
-                            # Unsafe states should not be added to the cache because they have collected `placed_item`.
-                            if not unsafe:
-                                if len(previous_safe_swap_state_cache) >= max_swap_base_state_cache_length:
-                                    # Remove the oldest cached state.
-                                    previous_safe_swap_state_cache.pop()
-                                # Add the new state to the start of the cache.
-                                previous_safe_swap_state_cache.appendleft(swap_state)
+                        swap_state = swap_state_cache.swap_state(location, placed_item, unsafe)
                         # unsafe means swap_state assumes we can somehow collect placed_item before item_to_place
                         # by continuing to swap, which is not guaranteed. This is unsafe because there is no mechanic
                         # to clean that up later, so there is a chance generation fails.
@@ -176,6 +578,9 @@ def fill_restrictive(multiworld: MultiWorld, base_state: CollectionState, locati
                             reachable_items[placed_item.player].appendleft(
                                 placed_item)
                             item_pool.append(placed_item)
+                            # the checkpoint may have collected placed_item from spot_to_fill
+                            checkpoint.invalidate()
+                            swap_state_cache.swapped(spot_to_fill)
 
                             # cleanup at the end to hopefully get better errors
                             cleanup_required = True
@@ -198,12 +603,17 @@ def fill_restrictive(multiworld: MultiWorld, base_state: CollectionState, locati
             placements.append(spot_to_fill)
             placed += 1
             if not placed % 1000:
-                _log_fill_progress(name, placed, total)
+                _log_fill_progress(name, placed, total, swap_state_cache)
             if on_place:
                 on_place(spot_to_fill)
 
     if total > 1000:
-        _log_fill_progress(name, placed, total)
+        _log_fill_progress(name, placed, total, swap_state_cache)
+    elif swap_state_cache.hits + swap_state_cache.misses:
+        logging.debug(f"Fill step ({name}) swap state cache: {swap_state_cache.hits} hits, "
+                      f"{swap_state_cache.misses} misses.")
+
+    locations[:] = location_index.remaining()
 
     if cleanup_required:
         # validate all placements and remove invalid ones
@@ -272,18 +682,27 @@ def remaining_fill(multiworld: MultiWorld,
         def location_can_fill_item(location_to_fill: Location, item_to_fill: Item):
             return location_to_fill.item_rule(item_to_fill)
 
-    while locations and itempool:
-        item_to_place = itempool.pop()
-        spot_to_fill: typing.Optional[Location] = None
+    location_index = _LocationIndex(locations)
+
+    while location_index and itempool:
+        # Place items at the locations using the default item rules in one go while they come first, which is where the
+        # items would go one by one too.
+        run = location_index.pop_default_run(len(itempool), excluded=not check_location_can_fill)
+        if run:
+            for spot_to_fill in run:
+                multiworld.push_item(spot_to_fill, itempool.pop(), False)
+            placements += run
+            if (placed + len(run)) // 1000 > placed // 1000:
+                _log_fill_progress(name, placed + len(run) - (placed + len(run)) % 1000, total)
+            placed += len(run)
+            continue
 
-        for i, location in enumerate(locations):
-            if location_can_fill_item(location, item_to_place):
-                # popping by index is faster than removing by content,
-                spot_to_fill = locations.pop(i)
-                # skipping a scan for the element
-                break
+        item_to_place = itempool.pop()
+        spot_to_fill: typing.Optional[Location] = location_index.pop_first(
+            lambda location: location_can_fill_item(location, item_to_place),
+            excluded=not (check_location_can_fill and (item_to_place.advancement or item_to_place.useful)))
 
-        else:
+        if spot_to_fill is None:
             # we filled all reachable spots.
             # try swapping this item with previously placed items
 
@@ -328,6 +747,8 @@ def remaining_fill(multiworld: MultiWorld,
     if total > 1000:
         _log_fill_progress(name, placed, total)
 
+    locations[:] = location_index.remaining()
+
     if unplaced_items and locations:
         # There are leftover unplaceable items and locations that won't accept them
         if move_unplaceable_to_start_inventory:
@@ -808,6 +1229,8 @@ def balance_multiworld_progression(multiworld: MultiWorld) -> None:
                         and item_percentage(player, reachables) < threshold_percentages[player])
                 }
                 if balancing_players:
+                    round_start = time.perf_counter()
+                    tested_item_count = 0
                     balancing_state = state.copy()
                     balancing_unchecked_locations = unchecked_locations.copy()
                     balancing_reachables = reachable_locations_count.copy()
@@ -844,23 +1267,31 @@ def balance_multiworld_progression(multiworld: MultiWorld) -> None:
                         if l not in balancing_unchecked_locations:
                             unlocked_locations[l.player].add(l)
                     items_to_replace: typing.List[Location] = []
+                    balancing_beats_game = multiworld.has_beaten_game(balancing_state)
                     for player in balancing_players:
                         locations_to_test = unlocked_locations[player]
                         items_to_test = list(candidate_items[player])
                         items_to_test.sort()
                         multiworld.random.shuffle(items_to_test)
+                        # Each candidate is tested against the state of this sphere with all candidates still
+                        # to be tested collected, so keep a snapshot per prefix of items_to_test instead of
+                        # collecting that prefix again for every candidate.
+                        prefix_states: typing.List[CollectionState] = [state]
+                        for location in items_to_test[:-1]:
+                            prefix_state = prefix_states[-1].copy()
+                            prefix_state.collect(location.item, True, location)
+                            prefix_states.append(prefix_state)
                         while items_to_test:
                             testing = items_to_test.pop()
-                            reducing_state = state.copy()
-                            for location in itertools.chain((
-                                    l for l in items_to_replace
-                                    if l.item.player == player
-                            ), items_to_test):
-                                reducing_state.collect(location.item, True, location)
+                            tested_item_count += 1
+                            reducing_state = prefix_states.pop().copy()
+                            for location in items_to_replace:
+                                if location.item.player == player:
+                                    reducing_state.collect(location.item, True, location)
 
                             reducing_state.sweep_for_advancements(locations=locations_to_test)
 
-                            if multiworld.has_beaten_game(balancing_state):
+                            if balancing_beats_game:
                                 if not multiworld.has_beaten_game(reducing_state):
                                     items_to_replace.append(testing)
                             else:
@@ -903,6 +1334,11 @@ def balance_multiworld_progression(multiworld: MultiWorld) -> None:
                                 reachable_locations_count[location.player] += 1
                             sphere_locations.add(location)
 
+                    perf_logger.info(f"Took {time.perf_counter() - round_start:.4f} seconds balancing sphere "
+                                     f"{sphere_num - 1} for {len(balancing_players)} players, testing "
+                                     f"{tested_item_count} candidate items and moving "
+                                     f"{moved_item_count - old_moved_item_count} items.")
+
             for location in sphere_locations:
                 if location.advancement:
                     state.collect(location.item, True, location)
@@ -1,12 +1,18 @@
 from __future__ import annotations
 
 import argparse
+import concurrent.futures
 import copy
+import hashlib
+import json
 import logging
+import multiprocessing
 import os
+import pickle
 import random
 import string
 import sys
+import time
 import urllib.parse
 import urllib.request
 from collections import Counter
@@ -57,6 +63,17 @@ def mystery_argparse():
     parser.add_argument("--spoiler_only", action="store_true",
                         help="Skips generation assertion and multidata, outputting only a spoiler log. "
                              "Intended for debugging and testing purposes.")
+    parser.add_argument("--seeds", type=lambda value: max(int(value), 1), default=1,
+                        help="Number of seeds to generate from the same rolled options, starting with --seed.")
+    parser.add_argument("--jobs", type=lambda value: max(int(value), 1), default=1,
+                        help="Number of seeds to generate at once in separate processes when generating multiple "
+                             "seeds.")
+    parser.add_argument("--summary",
+                        help="Path to write a JSON line per seed to when generating multiple seeds, "
+                             "defaults to Generate_<seed>.jsonl in the output path.")
+    parser.add_argument("--lazy_worlds", action="store_true",
+                        help="Only import the worlds of the games that are played, using the worlds manifest cached "
+                             "by the last run with this option.")
     args = parser.parse_args()
 
     if args.skip_output and args.spoiler_only:
@@ -88,6 +105,9 @@ def main(args=None) -> tuple[argparse.Namespace, int]:
     seed = get_seed(args.seed)
 
     Utils.init_logging(f"Generate_{seed}", loglevel=args.log_level, add_timestamp=args.log_time)
+    if getattr(args, "lazy_worlds", False):
+        import worlds
+        worlds.set_lazy_loading()
     random.seed(seed)
     seed_name = get_seed_name(random)
 
@@ -181,7 +201,7 @@ def main(args=None) -> tuple[argparse.Namespace, int]:
     erargs.csv_output = args.csv_output
 
     settings_cache: dict[str, tuple[argparse.Namespace, ...]] = \
-        {fname: (tuple(roll_settings(yaml, args.plando) for yaml in yamls) if args.sameoptions else None)
+        {fname: (tuple(cached_roll_settings(yaml, args.plando) for yaml in yamls) if args.sameoptions else None)
          for fname, yamls in weights_cache.items()}
 
     if meta_weights:
@@ -213,7 +233,7 @@ def main(args=None) -> tuple[argparse.Namespace, int]:
         if path:
             try:
                 settings: tuple[argparse.Namespace, ...] = settings_cache[path] if settings_cache[path] else \
-                    tuple(roll_settings(yaml, args.plando) for yaml in weights_cache[path])
+                    tuple(cached_roll_settings(yaml, args.plando) for yaml in weights_cache[path])
                 for settingsObject in settings:
                     for k, v in vars(settingsObject).items():
                         if v is not None:
@@ -246,6 +266,153 @@ def main(args=None) -> tuple[argparse.Namespace, int]:
     return erargs, seed
 
 
+_batch_args: argparse.Namespace | None = None
+"""The arguments of the seeds generated by generate_seeds, inherited by its worker processes"""
+
+
+def _generate_batch_seed(seed: int, log_level: str | None, log_time: bool) -> dict[str, Any]:
+    from Main import main as ERmain
+
+    # worlds may modify their options while generating, so every seed gets its own
+    args = copy.deepcopy(_batch_args)
+    args.outputname = get_seed_name(random.Random(seed))
+    if log_level is not None:
+        Utils.init_logging(f"Generate_{seed}", loglevel=log_level, add_timestamp=log_time)
+    result: dict[str, Any] = {"seed": seed, "seed_name": args.outputname, "success": True, "error": None}
+    start = time.perf_counter()
+    try:
+        ERmain(args, seed)
+    except Exception as e:
+        logging.exception(f"Generating seed {seed} failed.")
+        result["success"] = False
+        result["error"] = f"{type(e).__name__}: {e}"
+    result["seconds"] = round(time.perf_counter() - start, 3)
+    return result
+
+
+def generate_seeds(erargs: argparse.Namespace, seed: int, count: int, jobs: int = 1, summary_path: str | None = None,
+                   log_level: str = "info", log_time: bool = False) -> list[dict[str, Any]]:
+    """
+    Generates count seeds from erargs as returned by main, one of them being seed and the others derived from it.
+
+    With more than one job, worlds stay imported and options stay rolled in this process, and the seeds are generated
+    in forked processes sharing them, each logging to its own file with log_level and log_time. A JSON line with the
+    seed, its name, whether it succeeded, its error if not and the seconds it took is written to summary_path for each
+    seed as it finishes, in the order they finish.
+    """
+    global _batch_args
+
+    seed_random = random.Random(seed)
+    seeds = [seed, *(seed_random.randint(0, pow(10, seeddigits) - 1) for _ in range(count - 1))]
+    if jobs > 1 and "fork" not in multiprocessing.get_all_start_methods():
+        logging.warning("Generating seeds in separate processes needs fork, generating them one after another.")
+        jobs = 1
+    if summary_path is None:
+        summary_path = os.path.join(erargs.outputpath or "", f"Generate_{seed}.jsonl")
+    if os.path.dirname(summary_path):
+        os.makedirs(os.path.dirname(summary_path), exist_ok=True)
+    logging.info(f"Generating {count} seeds with {jobs} job{'s' if jobs > 1 else ''}, summary in {summary_path}")
+
+    _batch_args = erargs
+    results: list[dict[str, Any]] = []
+    start = time.perf_counter()
+    try:
+        with open(summary_path, "w", encoding="utf-8") as summary:
+            def report(result: dict[str, Any]) -> None:
+                results.append(result)
+                summary.write(json.dumps(result) + "\n")
+                summary.flush()
+                logging.info(f"Seed {result['seed']} {'succeeded' if result['success'] else 'failed'} "
+                             f"in {result['seconds']:.2f} seconds ({len(results)}/{count}).")
+
+            if jobs == 1:
+                for batch_seed in seeds:
+                    report(_generate_batch_seed(batch_seed, None, False))
+            else:
+                with concurrent.futures.ProcessPoolExecutor(jobs, multiprocessing.get_context("fork")) as pool:
+                    futures = [pool.submit(_generate_batch_seed, batch_seed, log_level, log_time)
+                               for batch_seed in seeds]
+                    for future in concurrent.futures.as_completed(futures):
+                        report(future.result())
+    finally:
+        _batch_args = None
+    succeeded = sum(result["success"] for result in results)
+    logging.info(f"Generated {succeeded}/{count} seeds successfully in {time.perf_counter() - start:.2f} seconds.")
+    return results
+
+
+generate_cache_max_age = 7 * 24 * 60 * 60  # seconds an entry of the generate caches is kept without being used
+_cleaned_generate_caches: set[str] = set()
+
+
+def _load_generate_cache(kind: str, digest: str) -> Any:
+    """Returns what was stored for digest with _store_generate_cache, None if nothing usable was."""
+    path = Utils.cache_path("generate", kind, f"{digest}.pickle")
+    try:
+        with open(path, "rb") as f:
+            data = Utils.restricted_loads(f.read())
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        logging.debug(f"Could not load cached {kind} {digest}: {e}")
+        return None
+    try:
+        os.utime(path)  # used, so _clean_generate_cache keeps it
+    except OSError:
+        pass
+    return data
+
+
+def _clean_generate_cache(kind: str) -> None:
+    """
+    Deletes the entries of a generate cache that were not used within generate_cache_max_age, once per process.
+    Entries of older Archipelago versions are never used again, so they are deleted this way as well.
+    """
+    if kind in _cleaned_generate_caches:
+        return
+    _cleaned_generate_caches.add(kind)
+    oldest = time.time() - generate_cache_max_age
+    try:
+        entries = list(os.scandir(Utils.cache_path("generate", kind)))
+    except OSError:
+        return
+    for entry in entries:
+        try:
+            if entry.stat().st_mtime < oldest:
+                os.unlink(entry.path)
+        except OSError as e:
+            logging.debug(f"Could not delete old cached {kind} {entry.name}: {e}")
+
+
+def _store_generate_cache(kind: str, digest: str, data: Any) -> None:
+    _clean_generate_cache(kind)
+    folder = Utils.cache_path("generate", kind)
+    try:
+        dumped = Utils.restricted_dumps(data)
+        os.makedirs(folder, exist_ok=True)
+        # write next to the target first, so that concurrent generations never read a partial file
+        temp_path = os.path.join(folder, f"{digest}.{os.getpid()}.tmp")
+        with open(temp_path, "wb") as f:
+            f.write(dumped)
+        os.replace(temp_path, os.path.join(folder, f"{digest}.pickle"))
+    except Exception as e:
+        logging.debug(f"Could not store cached {kind} {digest}: {e}")
+
+
+def parse_weights_yamls(yaml: str) -> tuple[Any, ...]:
+    """
+    Parses the yaml documents of weights, caching the parsed documents under Utils.cache_path by the text and the
+    Archipelago version.
+    """
+    digest = hashlib.sha256(f"{__version__}\n{yaml}".encode("utf-8")).hexdigest()
+    cached = _load_generate_cache("weights", digest)
+    if isinstance(cached, tuple):
+        return cached
+    weights = tuple(parse_yamls(yaml))
+    _store_generate_cache("weights", digest, weights)
+    return weights
+
+
 def read_weights_yamls(path) -> tuple[Any, ...]:
     try:
         if urllib.parse.urlparse(path).scheme in ('https', 'file'):
@@ -258,7 +425,7 @@ def read_weights_yamls(path) -> tuple[Any, ...]:
 
     from yaml.error import MarkedYAMLError
     try:
-        return tuple(parse_yamls(yaml))
+        return parse_weights_yamls(yaml)
     except MarkedYAMLError as ex:
         if ex.problem_mark:
             lines = yaml.splitlines()
@@ -555,6 +722,56 @@ def roll_settings(weights: dict, plando_options: PlandoOptions = PlandoOptions.b
     return ret
 
 
+def _world_stamp(game: str) -> list[int] | None:
+    from worlds import AutoWorldRegister, world_sources
+
+    world_type = AutoWorldRegister.world_types.get(game)
+    if world_type is None:
+        return None
+    # the modification time and size of the apworld or world folder, like the worlds manifest uses
+    module_name = world_type.__module__.split(".")[1] if world_type.__module__.startswith("worlds.") else None
+    for world_source in world_sources:
+        if world_source.module_name == module_name:
+            try:
+                return world_source.stamp
+            except OSError:
+                return None
+    return None
+
+
+def cached_roll_settings(weights: dict, plando_options: PlandoOptions = PlandoOptions.bosses) -> argparse.Namespace:
+    """
+    roll_settings, reusing the options rolled from the same weights before if rolling them took no random numbers.
+
+    The rolled options are cached under Utils.cache_path by the weights, plando_options and the Archipelago version.
+    They are only reused if the rolled game's world still has the same options, and its apworld or folder still has the
+    same modification time and size.
+    """
+    from worlds import AutoWorldRegister
+
+    try:
+        digest = hashlib.sha256(f"{__version__}\n{plando_options.value}\n".encode("utf-8") +
+                                pickle.dumps(weights, 4)).hexdigest()
+    except Exception as e:
+        logging.debug(f"Could not hash weights to cache rolled options: {e}")
+        return roll_settings(weights, plando_options)
+
+    cached = _load_generate_cache("options", digest)
+    if isinstance(cached, dict):
+        game, stamp, options = cached.get("game"), cached.get("stamp"), cached.get("options")
+        world_type = AutoWorldRegister.world_types.get(game)
+        if world_type and stamp == _world_stamp(game) and isinstance(options, dict) \
+                and all(option_key in options for option_key in world_type.options_dataclass.type_hints):
+            return argparse.Namespace(**options)
+
+    random_state = random.getstate()
+    ret = roll_settings(weights, plando_options)
+    if random.getstate() == random_state:
+        _store_generate_cache("options", digest,
+                              {"game": ret.game, "stamp": _world_stamp(ret.game), "options": vars(ret)})
+    return ret
+
+
 def roll_alttp_settings(ret: argparse.Namespace, weights):
     ret.sprite_pool = weights.get('sprite_pool', [])
     ret.sprite = get_choice_legacy('sprite', weights, "Link")
@@ -583,10 +800,14 @@ def roll_alttp_settings(ret: argparse.Namespace, weights):
 if __name__ == '__main__':
     import atexit
     confirmation = atexit.register(input, "Press enter to close.")
-    erargs, seed = main()
-    from Main import main as ERmain
-    multiworld = ERmain(erargs, seed)
-    if __debug__:
+    args = mystery_argparse()
+    erargs, seed = main(args)
+    if args.seeds > 1:
+        generate_seeds(erargs, seed, args.seeds, args.jobs, args.summary, args.log_level, args.log_time)
+    else:
+        from Main import main as ERmain
+        multiworld = ERmain(erargs, seed)
+    if __debug__ and args.seeds == 1:
         import gc
         import sys
         import weakref
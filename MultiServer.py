@@ -124,6 +124,125 @@ def get_saving_second(seed_name: str, interval: int = 60) -> int:
     return int(hashlib.sha256(seed_name.encode()).hexdigest(), 16) % interval
 
 
+class SaveJournal:
+    """
+    Tracks changes to a Context since its save was written, so only those have to be written as journal records.
+    Records are applied on top of the save with apply_save_journal.
+    """
+    location_checks: typing.Dict[team_slot, typing.Set[int]]  # new checks, see add_location_checks
+    stored_data_keys: typing.Set[str]  # changed keys, see add_stored_data_key
+    lock: threading.Lock  # guards the two above, as they are filled in on the event loop but collected while saving
+    received_lengths: typing.Dict[typing.Tuple[int, int, bool], int]
+    hints: typing.Dict[team_slot, typing.FrozenSet[Hint]]
+    state: typing.Dict[str, typing.Any]  # copy of the last written Context.get_save_state
+    snapshot_size: int  # size of the save the journal is based on
+    size: int  # size of the records written since
+
+    def __init__(self, ctx: Context) -> None:
+        self.location_checks = collections.defaultdict(set)
+        self.stored_data_keys = set()
+        self.lock = threading.Lock()
+        self.received_lengths = {key: len(items) for key, items in ctx.received_items.items()}
+        self.hints = {key: frozenset(hints) for key, hints in ctx.hints.items()}
+        self.state = copy.deepcopy(ctx.get_save_state())
+        self.snapshot_size = 0
+        self.size = 0
+
+    @property
+    def should_compact(self) -> bool:
+        """If rewriting the save is better than making the journal longer than the save itself."""
+        return self.size > self.snapshot_size
+
+    def add_location_checks(self, team_and_slot: team_slot, locations: typing.AbstractSet[int]) -> None:
+        with self.lock:
+            self.location_checks[team_and_slot] |= locations
+
+    def add_stored_data_key(self, key: str) -> None:
+        with self.lock:
+            self.stored_data_keys.add(key)
+
+    def collect(self, ctx: Context) -> typing.List[typing.Tuple[typing.Any, ...]]:
+        """
+        Returns the records of what changed since the last call and starts tracking from there.
+        Called from the auto save thread, so the records hold copies of anything the event loop may still change.
+        """
+        records: typing.List[typing.Tuple[typing.Any, ...]] = []
+        for key, items in ctx.received_items.items():
+            known = self.received_lengths.get(key, 0)
+            if len(items) > known:
+                records.append(("received_items", key, known, items[known:]))
+                self.received_lengths[key] = len(items)
+        with self.lock:
+            location_checks, self.location_checks = self.location_checks, collections.defaultdict(set)
+            stored_data_keys, self.stored_data_keys = self.stored_data_keys, set()
+        for key, locations in location_checks.items():
+            records.append(("location_checks", key, set(locations)))
+        for key, hints in ctx.hints.items():
+            if self.hints.get(key) != hints:
+                self.hints[key] = frozenset(hints)
+                records.append(("hints", key, self.hints[key]))
+        for key in stored_data_keys:
+            records.append(("stored_data", key, copy.deepcopy(ctx.stored_data.get(key))))
+        state = {key: value for key, value in ctx.get_save_state().items() if self.state.get(key) != value}
+        if state:
+            state = copy.deepcopy(state)
+            records.append(("state", state))
+            self.state.update(state)
+        return records
+
+
+def apply_save_journal(savedata: typing.Dict[str, typing.Any],
+                       records: typing.Iterable[typing.Tuple[typing.Any, ...]]) -> typing.Dict[str, typing.Any]:
+    """Applies journal records, as made by SaveJournal.collect, in order to savedata. Returns savedata."""
+    for record in records:
+        kind = record[0]
+        if kind == "received_items":
+            _, key, index, items = record
+            savedata["received_items"].setdefault(key, [])[index:] = items
+        elif kind == "location_checks":
+            _, key, locations = record
+            savedata["location_checks"].setdefault(key, set()).update(locations)
+        elif kind == "hints":
+            _, key, hints = record
+            savedata["hints"][key] = set(hints)
+        elif kind == "stored_data":
+            _, key, value = record
+            savedata.setdefault("stored_data", {})[key] = value
+        elif kind == "state":
+            savedata.update(record[1])
+        else:
+            raise ValueError(f"Unknown save journal record {kind}")
+    return savedata
+
+
+def read_save_journal(path: str, generation: typing.Optional[int]) -> typing.List[typing.Tuple[typing.Any, ...]]:
+    """
+    Returns the records of the journal at path if it belongs to the save of generation.
+    An incomplete last write, for example from a crash, is ignored.
+    """
+    records: typing.List[typing.Tuple[typing.Any, ...]] = []
+    try:
+        with open(path, "rb") as f:
+            data = f.read()
+    except FileNotFoundError:
+        return records
+    position = 0
+    journal_generation = None
+    while position + 4 <= len(data):
+        size = int.from_bytes(data[position:position + 4], "big")
+        frame = data[position + 4:position + 4 + size]
+        if len(frame) < size:
+            break
+        position += 4 + size
+        if journal_generation is None:
+            journal_generation = restricted_loads(zlib.decompress(frame))
+            if journal_generation != generation:
+                return records
+        else:
+            records.extend(restricted_loads(zlib.decompress(frame)))
+    return records
+
+
 class Client(Endpoint):
     version = Version(0, 0, 0)
     tags: typing.List[str]
@@ -165,6 +284,29 @@ class Client(Endpoint):
         return "Deallocated"
 
 
+class NetworkStats:
+    """Counters of the messages sent through Context.queue_msgs."""
+    encode_time: float  # seconds spent encoding messages
+    encoded_msgs: int  # messages encoded
+    reused_msgs: int  # messages sent again without encoding them again
+    frames: int  # websocket frames sent
+    start: float
+
+    def __init__(self) -> None:
+        self.encode_time = 0.0
+        self.encoded_msgs = self.reused_msgs = self.frames = 0
+        self.start = time.monotonic()
+
+    @property
+    def frames_per_second(self) -> float:
+        return self.frames / max(time.monotonic() - self.start, 1e-9)
+
+    def __str__(self) -> str:
+        return (f"{self.frames} frames sent, {self.frames_per_second:.2f} per second. "
+                f"{self.encoded_msgs} messages encoded in {self.encode_time:.3f} seconds, "
+                f"{self.reused_msgs} reused.")
+
+
 team_slot = typing.Tuple[int, int]
 
 
@@ -232,6 +374,13 @@ class Context:
         self.server = None
         self.countdown_timer = 0
         self.received_items = {}
+        self.new_item_receivers: typing.Set[team_slot] = set()  # slots with items not sent to their clients yet
+        self.new_items_handle: typing.Optional[asyncio.Handle] = None
+        # encoded messages to send to each endpoint at the end of this event loop iteration
+        self.queued_msgs: typing.Dict[Endpoint, typing.List[str]] = {}
+        self.queued_msgs_handle: typing.Optional[asyncio.Handle] = None
+        self.encoded_msgs: typing.Dict[int, typing.Tuple[dict, str]] = {}  # id(msg) -> msg, encoded msg
+        self.network_stats = NetworkStats()
         self.start_inventory = {}
         self.name_aliases: typing.Dict[team_slot, str] = {}
         self.location_checks = collections.defaultdict(set)
@@ -239,6 +388,9 @@ class Context:
         self.location_check_points = location_check_points
         self.hints_used = collections.defaultdict(int)
         self.hints: typing.Dict[team_slot, typing.Set[Hint]] = collections.defaultdict(set)
+        # (team, finding_player, location) -> (team, slot)s that have a hint for it in their hints
+        self.hint_index: typing.Dict[typing.Tuple[int, int, int], typing.Set[team_slot]] = \
+            collections.defaultdict(set)
         self.release_mode: str = release_mode
         self.remaining_mode: str = remaining_mode
         self.collect_mode: str = collect_mode
@@ -257,6 +409,8 @@ class Context:
         self.auto_save_interval = 60  # in seconds
         self.auto_saver_thread: typing.Optional[threading.Thread] = None
         self.save_dirty = False
+        self.save_journal_enabled = False  # write changes as journal records between full saves
+        self.save_journal: typing.Optional[SaveJournal] = None
         self.tags = ['AP']
         self.games: typing.Dict[int, str] = {}
         self.minimum_client_versions: typing.Dict[int, Version] = {}
@@ -331,7 +485,7 @@ class Context:
     async def send_msgs(self, endpoint: Endpoint, msgs: typing.Iterable[dict]) -> bool:
         if not endpoint.socket or not endpoint.socket.open:
             return False
-        msg = self.dumper(msgs)
+        msg = self.take_queued_msgs(endpoint, self.dumper(msgs))
         try:
             await endpoint.socket.send(msg)
         except websockets.ConnectionClosed:
@@ -346,6 +500,7 @@ class Context:
     async def send_encoded_msgs(self, endpoint: Endpoint, msg: str) -> bool:
         if not endpoint.socket or not endpoint.socket.open:
             return False
+        msg = self.take_queued_msgs(endpoint, msg)
         try:
             await endpoint.socket.send(msg)
         except websockets.ConnectionClosed:
@@ -372,15 +527,75 @@ class Context:
                 self.logger.info(f"Outgoing broadcast: {msg}")
             return True
 
+    def encode_msg(self, msg: dict) -> str:
+        """Returns msg encoded as an element of a message list, encoding each msg once per event loop iteration."""
+        cached = self.encoded_msgs.get(id(msg))
+        if cached and cached[0] is msg:
+            self.network_stats.reused_msgs += 1
+            return cached[1]
+        start = time.perf_counter()
+        encoded = self.dumper([msg])[1:-1]
+        self.network_stats.encode_time += time.perf_counter() - start
+        self.network_stats.encoded_msgs += 1
+        self.encoded_msgs[id(msg)] = msg, encoded  # keeps msg alive, so its id can't be reused
+        return encoded
+
+    def queue_msgs(self, endpoints: typing.Iterable[Endpoint], msgs: typing.Iterable[dict]):
+        """Sends msgs to endpoints at the end of this event loop iteration,
+        together with everything else queued for each endpoint in a single frame."""
+        encoded_msgs = [self.encode_msg(msg) for msg in msgs]
+        if not encoded_msgs:
+            return
+        for endpoint in endpoints:
+            if endpoint.socket and endpoint.socket.open:
+                self.queued_msgs.setdefault(endpoint, []).extend(encoded_msgs)
+        # flushing also clears the encoded msgs, so it's needed even if no endpoint got anything
+        if self.queued_msgs_handle is None:
+            try:
+                loop = asyncio.get_running_loop()
+            except RuntimeError:  # no loop to wait on
+                self.send_queued_msgs()
+            else:
+                self.queued_msgs_handle = loop.call_soon(self.send_queued_msgs)
+
+    def send_queued_msgs(self):
+        if self.queued_msgs_handle:
+            self.queued_msgs_handle.cancel()
+            self.queued_msgs_handle = None
+        queued_msgs, self.queued_msgs = self.queued_msgs, {}
+        self.encoded_msgs.clear()
+        # endpoints that get the same messages share the frame
+        frames: typing.Dict[typing.Tuple[str, ...], typing.List["ServerConnection"]] = {}
+        for endpoint, encoded_msgs in queued_msgs.items():
+            frames.setdefault(tuple(encoded_msgs), []).append(endpoint.socket)
+        for encoded_msgs, sockets in frames.items():
+            frame = f"[{','.join(encoded_msgs)}]"
+            try:
+                websockets.broadcast(sockets, frame)
+            except RuntimeError:
+                self.logger.exception("Exception during send_queued_msgs")
+            else:
+                self.network_stats.frames += len(sockets)
+                if self.log_network:
+                    self.logger.info(f"Outgoing broadcast: {frame}")
+
+    def take_queued_msgs(self, endpoint: Endpoint, msg: str) -> str:
+        """Prepends the messages queued for endpoint to the encoded message list msg, to keep them in order."""
+        queued_msgs = self.queued_msgs.pop(endpoint, None)
+        if not queued_msgs:
+            return msg
+        if msg != "[]":
+            queued_msgs.append(msg[1:-1])
+        return f"[{','.join(queued_msgs)}]"
+
     def broadcast_all(self, msgs: typing.List[dict]):
         msg_is_text = all(msg["cmd"] == "PrintJSON" for msg in msgs)
-        data = self.dumper(msgs)
         endpoints = (
             endpoint
             for endpoint in self.endpoints
             if endpoint.auth and not (msg_is_text and endpoint.no_text)
         )
-        async_start(self.broadcast_send_encoded_msgs(endpoints, data))
+        self.queue_msgs(endpoints, msgs)
 
     def broadcast_text_all(self, text: str, additional_arguments: dict = {}):
         self.logger.info("Notice (all): %s" % text)
@@ -388,17 +603,15 @@ class Context:
 
     def broadcast_team(self, team: int, msgs: typing.List[dict]):
         msg_is_text = all(msg["cmd"] == "PrintJSON" for msg in msgs)
-        data = self.dumper(msgs)
         endpoints = (
             endpoint
             for endpoint in itertools.chain.from_iterable(self.clients[team].values())
             if not (msg_is_text and endpoint.no_text)
         )
-        async_start(self.broadcast_send_encoded_msgs(endpoints, data))
+        self.queue_msgs(endpoints, msgs)
 
     def broadcast(self, endpoints: typing.Iterable[Client], msgs: typing.List[dict]):
-        msgs = self.dumper(msgs)
-        async_start(self.broadcast_send_encoded_msgs(endpoints, msgs))
+        self.queue_msgs(endpoints, msgs)
 
     async def disconnect(self, endpoint: Client):
         if endpoint in self.endpoints:
@@ -500,6 +713,7 @@ class Context:
 
         for slot, hints in decoded_obj["precollected_hints"].items():
             self.hints[0, slot].update(hints)
+            self.index_hints(0, slot, hints)
 
         # declare slots that aren't players as done
         for slot, slot_info in self.slot_info.items():
@@ -546,11 +760,31 @@ class Context:
 
     def _save(self, exit_save: bool = False) -> bool:
         try:
-            # Does not use Utils.restricted_dumps because we'd rather make a save than not make one
-            encoded_save = pickle.dumps(self.get_save())
-            with open(self.save_filename, "wb") as f:
-                f.write(zlib.compress(encoded_save))
+            if not self.save_journal_enabled:
+                # Does not use Utils.restricted_dumps because we'd rather make a save than not make one
+                encoded_save = pickle.dumps(self.get_save())
+                with open(self.save_filename, "wb") as f:
+                    f.write(zlib.compress(encoded_save))
+            elif self.save_journal and not exit_save and not self.save_journal.should_compact:
+                encoded_records = zlib.compress(pickle.dumps(self.save_journal.collect(self)))
+                with open(self.save_filename + ".journal", "ab") as f:
+                    f.write(len(encoded_records).to_bytes(4, "big") + encoded_records)
+                self.save_journal.size += len(encoded_records)
+            else:
+                # compact: write the full save and start a new journal on top of it
+                self.save_journal = SaveJournal(self)
+                generation = random.getrandbits(64)  # ties the journal to this save
+                save_data = self.get_save()
+                save_data["save_journal"] = generation
+                encoded_save = zlib.compress(pickle.dumps(save_data))
+                with open(self.save_filename, "wb") as f:
+                    f.write(encoded_save)
+                encoded_generation = zlib.compress(pickle.dumps(generation))
+                with open(self.save_filename + ".journal", "wb") as f:
+                    f.write(len(encoded_generation).to_bytes(4, "big") + encoded_generation)
+                self.save_journal.snapshot_size = len(encoded_save)
         except Exception as e:
+            self.save_journal = None  # records may be lost, so the next save has to be a full one
             self.logger.exception(e)
             return False
         else:
@@ -567,7 +801,10 @@ class Context:
             try:
                 with open(self.save_filename, 'rb') as f:
                     save_data = restricted_loads(zlib.decompress(f.read()))
-                    self.set_save(save_data)
+                if "save_journal" in save_data:
+                    apply_save_journal(save_data, read_save_journal(self.save_filename + ".journal",
+                                                                    save_data["save_journal"]))
+                self.set_save(save_data)
             except FileNotFoundError:
                 self.logger.error('No save data found, starting a new game')
             except Exception as e:
@@ -606,14 +843,22 @@ class Context:
                 atexit.register(self._save, True)  # make sure we save on exit too
 
     def get_save(self) -> dict:
-        self.recheck_hints()
         d = {
             "version": self.save_version,
             "connect_names": self.connect_names,
             "received_items": self.received_items,
-            "hints_used": dict(self.hints_used),
             "hints": dict(self.hints),
             "location_checks": dict(self.location_checks),
+            "stored_data": self.stored_data,
+            **self.get_save_state()
+        }
+
+        return d
+
+    def get_save_state(self) -> dict:
+        """The parts of the save that are small enough to be written in full with every save journal record."""
+        return {
+            "hints_used": dict(self.hints_used),
             "name_aliases": self.name_aliases,
             "client_game_state": dict(self.client_game_state),
             "client_activity_timers": tuple(
@@ -622,17 +867,13 @@ class Context:
                 (key, value.timestamp()) for key, value in self.client_connection_timers.items()),
             "random_state": self.random.getstate(),
             "group_collected": dict(self.group_collected),
-            "stored_data": self.stored_data,
             "game_options": {"hint_cost": self.hint_cost, "location_check_points": self.location_check_points,
                              "server_password": self.server_password, "password": self.password,
                              "release_mode": self.release_mode,
                              "remaining_mode": self.remaining_mode, "collect_mode": self.collect_mode,
                              "item_cheat": self.item_cheat, "compatibility": self.compatibility}
-
         }
 
-        return d
-
     def set_save(self, savedata: dict):
         if self.connect_names != savedata["connect_names"]:
             raise Exception("This savegame does not appear to match the loaded multiworld.")
@@ -641,6 +882,8 @@ class Context:
         self.received_items = savedata["received_items"]
         self.hints_used.update(savedata["hints_used"])
         self.hints.update(savedata["hints"])
+        for (team, slot), hints in savedata["hints"].items():
+            self.index_hints(team, slot, hints)
 
         self.name_aliases.update(savedata["name_aliases"])
         self.client_game_state.update(savedata["client_game_state"])
@@ -651,6 +894,7 @@ class Context:
             {tuple(key): datetime.datetime.fromtimestamp(value, datetime.timezone.utc) for key, value
              in savedata["client_activity_timers"]})
         self.location_checks.update(savedata["location_checks"])
+        self.recheck_hints()  # hints are kept up to date by location checks from here on
         self.random.setstate(savedata["random_state"])
 
         if "game_options" in savedata:
@@ -687,7 +931,11 @@ class Context:
         will refresh all teams or all slots respectively. If a set is passed for 'changed', each (team,slot)
         pair that has at least one hint modified will be added to the set.
         """
-        for hint_team, hint_slot in self.hints:
+        if team is not None and slot is not None:
+            hint_keys = [(team, slot)] if (team, slot) in self.hints else []
+        else:
+            hint_keys = list(self.hints)
+        for hint_team, hint_slot in hint_keys:
             if team != hint_team and team is not None:
                 continue  # Check specified team only, all if team is None
             if slot != hint_slot and slot is not None:
@@ -705,6 +953,29 @@ class Context:
                         self.replace_hint(hint_team, player, hint, new_hint)
             self.hints[hint_team, hint_slot] = new_hints
 
+    def recheck_location_hints(self, team: int, finding_player: int, locations: typing.Iterable[int],
+                               changed: typing.Optional[typing.Set[team_slot]] = None) -> None:
+        """Refreshes the hints for the specified locations of finding_player, using hint_index to only touch the
+        (team, slot)s that have hints for them. Fills 'changed' like recheck_hints.
+        """
+        for location in locations:
+            for hint_team, hint_slot in self.hint_index.get((team, finding_player, location), ()):
+                hints = self.hints[hint_team, hint_slot]
+                for hint in [hint for hint in hints
+                             if hint.location == location and hint.finding_player == finding_player]:
+                    new_hint = hint.re_check(self, hint_team)
+                    if hint == new_hint:
+                        continue
+                    hints.remove(hint)
+                    hints.add(new_hint)
+                    if changed is not None:
+                        changed.add((hint_team, hint_slot))
+
+    def index_hints(self, team: int, slot: int, hints: typing.Iterable[Hint]) -> None:
+        """Adds hints that were added to the hints of (team, slot) to hint_index."""
+        for hint in hints:
+            self.hint_index[team, hint.finding_player, hint.location].add((team, slot))
+
     def get_rechecked_hints(self, team: int, slot: int):
         self.recheck_hints(team, slot)
         return self.hints[team, slot]
@@ -775,9 +1046,11 @@ class Context:
                 # we can check once if hint already exists
                 if hint not in self.hints[team, hint.finding_player]:
                     self.hints[team, hint.finding_player].add(hint)
+                    self.index_hints(team, hint.finding_player, (hint,))
                     new_hint_events.add(hint.finding_player)
                     for player in self.slot_set(hint.receiving_player):
                         self.hints[team, player].add(hint)
+                        self.index_hints(team, player, (hint,))
                         new_hint_events.add(player)
 
             self.logger.info("Notice (Team #%d): %s" % (team + 1, format_hint(self, team, hint)))
@@ -789,8 +1062,7 @@ class Context:
                 if not clients:
                     continue
                 client_hints = [datum[1] for datum in sorted(hint_data, key=lambda x: x[0].finding_player != slot)]
-                for client in clients:
-                    async_start(self.send_msgs(client, client_hints))
+                self.queue_msgs(clients, client_hints)
 
     def get_hint(self, team: int, finding_player: int, seeked_location: int) -> typing.Optional[Hint]:
         for hint in self.hints[team, finding_player]:
@@ -836,12 +1108,7 @@ class Context:
 
 
 def update_aliases(ctx: Context, team: int):
-    cmd = ctx.dumper([{"cmd": "RoomUpdate",
-                       "players": ctx.get_players_package()}])
-
-    for clients in ctx.clients[team].values():
-        for client in clients:
-            async_start(ctx.send_encoded_msgs(client, cmd))
+    ctx.broadcast_team(team, [{"cmd": "RoomUpdate", "players": ctx.get_players_package()}])
 
 
 async def server(websocket: "ServerConnection", path: str = "/", ctx: Context = None) -> None:
@@ -1024,20 +1291,35 @@ def get_start_inventory(ctx: Context, player: int, remote_start_inventory: bool)
 
 
 def send_new_items(ctx: Context):
-    for team, clients in ctx.clients.items():
-        for slot, clients in clients.items():
-            for client in clients:
-                if client.no_items:
-                    continue
-                start_inventory = get_start_inventory(ctx, slot, client.remote_start_inventory)
-                items = get_received_items(ctx, team, slot, client.remote_items)
-                if len(start_inventory) + len(items) > client.send_index:
-                    first_new_item = max(0, client.send_index - len(start_inventory))
-                    async_start(ctx.send_msgs(client, [{
-                        "cmd": "ReceivedItems",
-                        "index": client.send_index,
-                        "items": start_inventory[client.send_index:] + items[first_new_item:]}]))
-                    client.send_index = len(start_inventory) + len(items)
+    """Sends new items to the clients of the slots in ctx.new_item_receivers."""
+    if ctx.new_items_handle:
+        ctx.new_items_handle.cancel()
+        ctx.new_items_handle = None
+    receivers, ctx.new_item_receivers = ctx.new_item_receivers, set()
+    for team, slot in receivers:
+        for client in ctx.clients.get(team, {}).get(slot, ()):
+            if client.no_items:
+                continue
+            start_inventory = get_start_inventory(ctx, slot, client.remote_start_inventory)
+            items = get_received_items(ctx, team, slot, client.remote_items)
+            if len(start_inventory) + len(items) > client.send_index:
+                first_new_item = max(0, client.send_index - len(start_inventory))
+                async_start(ctx.send_msgs(client, [{
+                    "cmd": "ReceivedItems",
+                    "index": client.send_index,
+                    "items": start_inventory[client.send_index:] + items[first_new_item:]}]))
+                client.send_index = len(start_inventory) + len(items)
+
+
+def queue_new_items(ctx: Context):
+    """Sends new items at the end of this event loop iteration, so items of all checks in it go out together."""
+    if ctx.new_items_handle is None:
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:  # no loop to wait on
+            send_new_items(ctx)
+        else:
+            ctx.new_items_handle = loop.call_soon(send_new_items, ctx)
 
 
 def update_checked_locations(ctx: Context, team: int, slot: int):
@@ -1085,6 +1367,7 @@ def send_items_to(ctx: Context, team: int, target_slot: int, *items: NetworkItem
             if item.player != target_slot:
                 get_received_items(ctx, team, target, False).append(item)
             get_received_items(ctx, team, target, True).append(item)
+        ctx.new_item_receivers.add((team, target))
 
 
 def register_location_checks(ctx: Context, team: int, slot: int, locations: typing.Iterable[int],
@@ -1122,14 +1405,16 @@ def register_location_checks(ctx: Context, team: int, slot: int, locations: typi
         del sortable
 
         ctx.location_checks[team, slot] |= new_locations
-        send_new_items(ctx)
+        if ctx.save_journal:
+            ctx.save_journal.add_location_checks((team, slot), new_locations)
+        queue_new_items(ctx)
         ctx.broadcast(ctx.clients[team][slot], [{
             "cmd": "RoomUpdate",
             "hint_points": get_slot_points(ctx, team, slot),
             "checked_locations": new_locations,  # send back new checks only
         }])
         updated_slots: typing.Set[tuple[int, int]] = set()
-        ctx.recheck_hints(team, slot, updated_slots)
+        ctx.recheck_location_hints(team, slot, new_locations, updated_slots)
         for hint_team, hint_slot in updated_slots:
             ctx.on_changed_hints(hint_team, hint_slot)
         ctx.save()
@@ -1594,6 +1879,7 @@ class ClientMessageProcessor(CommonCommandProcessor):
                 new_item = NetworkItem(names[item_name], -1, self.client.slot)
                 get_received_items(self.ctx, self.client.team, self.client.slot, False).append(new_item)
                 get_received_items(self.ctx, self.client.team, self.client.slot, True).append(new_item)
+                self.ctx.new_item_receivers.add((self.client.team, self.client.slot))
                 self.ctx.broadcast_text_all(
                     'Cheat console: sending "' + item_name + '" to ' + self.ctx.get_aliased_name(self.client.team,
                                                                                                  self.client.slot),
@@ -2060,13 +2346,10 @@ async def process_client_cmd(ctx: Context, client: Client, args: dict):
             tags = set(args.get("tags", []))
             slots = set(args.get("slots", []))
             args["cmd"] = "Bounced"
-            msg = ctx.dumper([args])
-
-            for bounceclient in ctx.endpoints:
-                if client.team == bounceclient.team and (ctx.games[bounceclient.slot] in games or
-                                                         set(bounceclient.tags) & tags or
-                                                         bounceclient.slot in slots):
-                    await ctx.send_encoded_msgs(bounceclient, msg)
+            ctx.queue_msgs((bounceclient for bounceclient in ctx.endpoints
+                            if client.team == bounceclient.team and (ctx.games[bounceclient.slot] in games or
+                                                                     set(bounceclient.tags) & tags or
+                                                                     bounceclient.slot in slots)), [args])
 
         elif cmd == "Get":
             if "keys" not in args or type(args["keys"]) != list:
@@ -2096,6 +2379,8 @@ async def process_client_cmd(ctx: Context, client: Client, args: dict):
                 func = modify_functions[operation["operation"]]
                 value = func(value, operation["value"])
             ctx.stored_data[args["key"]] = args["value"] = value
+            if ctx.save_journal:
+                ctx.save_journal.add_stored_data_key(args["key"])
             targets = set(ctx.stored_data_notification_clients[args["key"]])
             if args.get("want_reply", False):
                 targets.add(client)
@@ -2438,6 +2723,11 @@ class ServerCommandProcessor(CommonCommandProcessor):
             self.ctx.broadcast_all([{"cmd": "RoomUpdate", option_name: getattr(self.ctx, option_name)}])
         return True
 
+    def _cmd_network(self) -> bool:
+        """Debug Tool: show how many frames were sent and how long encoding the broadcast messages took."""
+        self.output(str(self.ctx.network_stats))
+        return True
+
     def _cmd_datastore(self):
         """Debug Tool: list writable datastorage keys and approximate the size of their values with pickle."""
         total: int = 0
@@ -2483,6 +2773,8 @@ def parse_args() -> argparse.Namespace:
     parser.add_argument('--password', default=defaults["password"])
     parser.add_argument('--savefile', default=defaults["savefile"])
     parser.add_argument('--disable_save', default=defaults["disable_save"], action='store_true')
+    parser.add_argument('--save_journal', default=defaults["save_journal"], action='store_true',
+                        help="Append changes to a journal between full saves.")
     parser.add_argument('--cert', help="Path to a SSL Certificate for encryption.")
     parser.add_argument('--cert_key', help="Path to SSL Certificate Key file")
     parser.add_argument('--loglevel', default=defaults["loglevel"],
@@ -2606,6 +2898,7 @@ async def main(args: argparse.Namespace):
         logging.exception(f"Failed to read multiworld data ({e})")
         raise
 
+    ctx.save_journal_enabled = args.save_journal
     ctx.init_save(not args.disable_save)
 
     ssl_context = load_server_cert(args.cert, args.cert_key) if args.cert else None
@@ -6,6 +6,11 @@ import enum
 import warnings
 from json import JSONEncoder, JSONDecoder
 
+try:
+    import orjson
+except ImportError:  # optional, the standard library codec is used without it
+    orjson = None
+
 if typing.TYPE_CHECKING:
     from websockets import WebSocketServerProtocol as ServerConnection
 
@@ -135,10 +140,6 @@ _encode = JSONEncoder(
 ).encode
 
 
-def encode(obj: typing.Any) -> str:
-    return _encode(_scan_for_TypedTuples(obj))
-
-
 def get_any_version(data: dict) -> Version:
     data = {key.lower(): value for key, value in data.items()}  # .NET version classes have capitalized keys
     return Version(int(data["major"]), int(data["minor"]), int(data["build"]))
@@ -170,7 +171,103 @@ def _object_hook(o: typing.Any) -> typing.Any:
     return o
 
 
-decode = JSONDecoder(object_hook=_object_hook).decode
+_decode = JSONDecoder(object_hook=_object_hook).decode
+
+
+def _apply_object_hook(obj: typing.Dict[str, typing.Any]) -> typing.Any:
+    """Does what _object_hook does to a decoded dict and all dicts in it, innermost first like JSONDecoder."""
+    for key, value in obj.items():
+        if type(value) is dict:
+            obj[key] = _apply_object_hook(value)
+        elif type(value) is list:
+            obj[key] = _apply_list_object_hook(value)
+    class_name = obj.get("class", None)
+    if class_name is None or class_name in custom_hooks:
+        return _object_hook(obj)
+    cls = allowlist.get(class_name, None)
+    if cls:
+        del obj["class"]
+        try:
+            return cls(**obj)
+        except TypeError:  # unknown fields
+            return cls(**{key: value for key, value in obj.items() if key in cls._fields})
+    return obj
+
+
+def _apply_list_object_hook(obj: typing.List[typing.Any]) -> typing.List[typing.Any]:
+    return [_apply_object_hook(o) if type(o) is dict else _apply_list_object_hook(o) if type(o) is list else o
+            for o in obj]
+
+
+class JSONCodec:
+    """Encodes and decodes messages of the network protocol with the standard library json module."""
+    name: typing.ClassVar[str] = "json"
+
+    def encode(self, obj: typing.Any) -> str:
+        return _encode(_scan_for_TypedTuples(obj))
+
+    def decode(self, data: str) -> typing.Any:
+        return _decode(data)
+
+
+class OrjsonCodec(JSONCodec):
+    """
+    Encodes and decodes with orjson, which serializes NamedTuples like _scan_for_TypedTuples in the same pass.
+    Anything orjson can't handle the same way, like integers beyond 64 bit, falls back to JSONCodec.
+    """
+    name = "orjson"
+    options: typing.ClassVar[int] = orjson.OPT_NON_STR_KEYS if orjson else 0
+
+    @staticmethod
+    def _default(obj: typing.Any) -> typing.Any:
+        if isinstance(obj, tuple):
+            if hasattr(obj, "_fields"):  # NamedTuple is not actually a parent class
+                data = obj._asdict()
+                data["class"] = obj.__class__.__name__
+                return data
+            return list(obj)
+        if isinstance(obj, (set, frozenset)):
+            return list(obj)
+        raise TypeError
+
+    def encode(self, obj: typing.Any) -> str:
+        try:
+            return orjson.dumps(obj, default=self._default, option=self.options).decode()
+        except orjson.JSONEncodeError:
+            return super().encode(obj)
+
+    def decode(self, data: str) -> typing.Any:
+        try:
+            obj = orjson.loads(data)
+        except orjson.JSONDecodeError:
+            return super().decode(data)
+        if '"class"' not in data:  # nothing for _object_hook to do
+            return obj
+        if type(obj) is dict:
+            return _apply_object_hook(obj)
+        if type(obj) is list:
+            return _apply_list_object_hook(obj)
+        return obj
+
+
+codecs: typing.Dict[str, typing.Type[JSONCodec]] = {JSONCodec.name: JSONCodec}
+if orjson:
+    codecs[OrjsonCodec.name] = OrjsonCodec
+codec: JSONCodec = codecs["orjson" if orjson else "json"]()
+
+
+def set_codec(name: str) -> None:
+    """Switches the codec used by encode and decode to one of codecs."""
+    global codec
+    codec = codecs[name]()
+
+
+def encode(obj: typing.Any) -> str:
+    return codec.encode(obj)
+
+
+def decode(data: str) -> typing.Any:
+    return codec.decode(data)
 
 
 class Endpoint:
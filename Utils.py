@@ -239,7 +239,8 @@ def open_file(filename: typing.Union[str, "pathlib.Path"]) -> None:
 
 
 # from https://gist.github.com/pypt/94d747fe5180851196eb#gistcomment-4015118 with some changes
-class UniqueKeyLoader(SafeLoader):
+class UniqueKeyConstructorMixin:
+    """Rejects mappings with duplicate keys, or with both a key and the same key prefixed with +."""
     def construct_mapping(self, node, deep=False):
         mapping = set()
         for key_node, value_node in node.value:
@@ -247,13 +248,18 @@ class UniqueKeyLoader(SafeLoader):
             if key in mapping:
                 logging.error(f"YAML duplicates sanity check failed{key_node.start_mark}")
                 raise KeyError(f"Duplicate key {key} found in YAML. Already found keys: {mapping}.")
-            if (str(key).startswith("+") and (str(key)[1:] in mapping)) or (f"+{key}" in mapping):
+            name = key if type(key) is str else str(key)
+            if (name.startswith("+") and name[1:] in mapping) or "+" + name in mapping:
                 logging.error(f"YAML merge duplicates sanity check failed{key_node.start_mark}")
                 raise KeyError(f"Equivalent key {key} found in YAML. Already found keys: {mapping}.")
             mapping.add(key)
         return super().construct_mapping(node, deep)
 
 
+class UniqueKeyLoader(UniqueKeyConstructorMixin, SafeLoader):
+    """SafeLoader checking for duplicate keys, parsing with libyaml if it's available."""
+
+
 parse_yaml = functools.partial(load, Loader=UniqueKeyLoader)
 parse_yamls = functools.partial(load_all, Loader=UniqueKeyLoader)
 unsafe_parse_yaml = functools.partial(load, Loader=UnsafeLoader)
@@ -525,6 +531,78 @@ class KeyedDefaultDict(collections.defaultdict):
         return value
 
 
+class PendingDict(dict):
+    """
+    dict that can also hold pending keys, which are loaded by their loader in pending the first time they're looked up.
+    A loader returns the value, or None if it set the key itself. Going over all keys loads every pending key.
+    """
+    pending: typing.Dict[typing.Any, typing.Callable[[], typing.Any]]
+    prepare: typing.Optional[typing.Callable[[], None]]
+    """Called once before the first key that isn't in the dict yet is looked up, to add keys or pending keys"""
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.pending = {}
+        self.prepare = None
+
+    def ensure_prepared(self) -> None:
+        """Calls prepare, unless it was called already."""
+        if self.prepare is not None:
+            prepare, self.prepare = self.prepare, None
+            prepare()
+
+    def load(self, key: Any) -> bool:
+        """Loads key if it's pending, returns if key is in this dict afterwards."""
+        self.ensure_prepared()
+        loader = self.pending.pop(key, None)
+        if loader is not None:
+            value = loader()
+            if value is not None:
+                dict.__setitem__(self, key, value)
+        return dict.__contains__(self, key)
+
+    def load_all(self) -> None:
+        self.ensure_prepared()
+        while self.pending:
+            self.load(next(iter(self.pending)))
+
+    def loaded(self) -> Dict[Any, Any]:
+        """Returns a copy of the keys and values that are loaded so far, without loading pending keys."""
+        self.ensure_prepared()
+        return dict(dict.items(self))
+
+    def __missing__(self, key: Any) -> Any:
+        if self.load(key):
+            return dict.__getitem__(self, key)
+        raise KeyError(key)
+
+    def __contains__(self, key: Any) -> bool:
+        return dict.__contains__(self, key) or self.load(key)
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        return self[key] if key in self else default
+
+    def __iter__(self) -> typing.Iterator[Any]:
+        self.load_all()
+        return super().__iter__()
+
+    def __len__(self) -> int:
+        self.load_all()
+        return super().__len__()
+
+    def keys(self) -> typing.KeysView[Any]:
+        self.load_all()
+        return super().keys()
+
+    def values(self) -> typing.ValuesView[Any]:
+        self.load_all()
+        return super().values()
+
+    def items(self) -> typing.ItemsView[Any, Any]:
+        self.load_all()
+        return super().items()
+
+
 def get_text_between(text: str, start: str, end: str) -> str:
     return text[text.index(start) + len(start): text.rindex(end)]
 
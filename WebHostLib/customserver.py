@@ -19,10 +19,11 @@ from pony.orm import commit, db_session, select
 
 import Utils
 
-from MultiServer import Context, server, auto_shutdown, ServerCommandProcessor, ClientMessageProcessor, load_server_cert
+from MultiServer import Context, server, auto_shutdown, ServerCommandProcessor, ClientMessageProcessor, \
+    load_server_cert, SaveJournal
 from Utils import restricted_loads, cache_argsless
 from .locker import Locker
-from .models import Command, GameDataPackage, Room, db
+from .models import Command, GameDataPackage, Room, RoomSaveDelta, db, get_room_save
 
 
 class CustomClientMessageProcessor(ClientMessageProcessor):
@@ -68,6 +69,8 @@ class WebHostContext(Context):
                                              40, True, "enabled", "enabled",
                                              "enabled", 0, 2, logger=logger)
         del self.static_server_data
+        # off unless enabled in the host's server_options, like MultiServer's --save_journal
+        self.save_journal_enabled = bool(Utils.get_settings().server_options.save_journal)
         self.main_loop = asyncio.get_running_loop()
         self.video = {}
         self.tags = ["AP", "WebHost"]
@@ -150,24 +153,44 @@ class WebHostContext(Context):
     def init_save(self, enabled: bool = True):
         self.saving = enabled
         if self.saving:
-            savegame_data = Room.get(id=self.room_id).multisave
-            if savegame_data:
-                self.set_save(restricted_loads(Room.get(id=self.room_id).multisave))
+            room = Room.get(id=self.room_id)
+            if room.multisave:
+                self.set_save(get_room_save(room))
+                if not self.save_journal_enabled and not room.save_deltas.is_empty():
+                    # left from when the journal was enabled, nothing would compact them anymore
+                    room.multisave = pickle.dumps(self.get_save())
+                    room.save_deltas.select().delete(bulk=True)
             self._start_async_saving(atexit_save=False)
         threading.Thread(target=self.listen_to_db_commands, daemon=True).start()
 
     @db_session
     def _save(self, exit_save: bool = False) -> bool:
         room = Room.get(id=self.room_id)
-        # Does not use Utils.restricted_dumps because we'd rather make a save than not make one
-        room.multisave = pickle.dumps(self.get_save())
-        # saving only occurs on activity, so we can "abuse" this information to mark this as last_activity
-        if not exit_save:  # we don't want to count a shutdown as activity, which would restart the server again
-            room.last_activity = datetime.datetime.utcnow()
+        try:
+            if not self.save_journal_enabled:
+                # Does not use Utils.restricted_dumps because we'd rather make a save than not make one
+                room.multisave = pickle.dumps(self.get_save())
+            elif self.save_journal and not exit_save and not self.save_journal.should_compact:
+                encoded_records = pickle.dumps(self.save_journal.collect(self))
+                RoomSaveDelta(room=room, data=encoded_records)
+                self.save_journal.size += len(encoded_records)
+            else:
+                self.save_journal = SaveJournal(self)
+                encoded_save = pickle.dumps(self.get_save())
+                room.multisave = encoded_save
+                room.save_deltas.select().delete(bulk=True)
+                self.save_journal.snapshot_size = len(encoded_save)
+            # saving only occurs on activity, so we can "abuse" this information to mark this as last_activity
+            if not exit_save:  # we don't want to count a shutdown as activity, which would restart the server again
+                room.last_activity = datetime.datetime.utcnow()
+            commit()
+        except Exception:
+            self.save_journal = None  # records may be lost, so the next save has to be a full one
+            raise
         return True
 
-    def get_save(self) -> dict:
-        d = super(WebHostContext, self).get_save()
+    def get_save_state(self) -> dict:
+        d = super(WebHostContext, self).get_save_state()
         d["video"] = [(tuple(playerslot), videodata) for playerslot, videodata in self.video.items()]
         return d
 
@@ -24,6 +24,7 @@ class Room(db.Entity):
     creation_time = Required(datetime, default=lambda: datetime.utcnow(), index=True)  # index used by landing page
     owner = Required(UUID, index=True)
     commands = Set('Command')
+    save_deltas = Set('RoomSaveDelta')  # changes written on top of multisave
     seed = Required('Seed', index=True)
     multisave = Optional(buffer, lazy=True)
     show_spoiler = Required(int, default=0)  # 0 -> never, 1 -> after completion, -> 2 always
@@ -50,6 +51,12 @@ class Command(db.Entity):
     commandtext = Required(str)
 
 
+class RoomSaveDelta(db.Entity):
+    id = PrimaryKey(int, auto=True)
+    room = Required(Room, index=True)
+    data = Required(buffer, lazy=True)  # pickled save journal records
+
+
 class Generation(db.Entity):
     id = PrimaryKey(UUID, default=uuid4)
     owner = Required(UUID)
@@ -61,3 +68,16 @@ class Generation(db.Entity):
 class GameDataPackage(db.Entity):
     checksum = PrimaryKey(str)
     data = Required(bytes)
+
+
+def get_room_save(room: Room) -> dict:
+    """Returns the multisave of a room with its save deltas applied, empty if it has none."""
+    from MultiServer import apply_save_journal
+    from Utils import restricted_loads
+
+    if not room.multisave:
+        return {}
+    save_data = restricted_loads(room.multisave)
+    for delta in room.save_deltas.select().order_by(RoomSaveDelta.id):
+        apply_save_journal(save_data, restricted_loads(delta.data))
+    return save_data
@@ -20,7 +20,7 @@ OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 SOFTWARE.
 ]]
 
-local SCRIPT_VERSION = 1
+local SCRIPT_VERSION = 2
 
 -- Set to log incoming requests
 -- Will cause lag due to large console output
@@ -37,6 +37,27 @@ field `type`. The value of `type` determines what other fields may exist.
 To get the script version, instead of JSON, send "VERSION" to get the script
 version directly (e.g. "2").
 
+Clients may also tag a message with an id and send several independent lists
+of requests in it, as an object with the fields `id` and `groups`. The
+response is an object with the same `id` and one list of responses per group,
+in the same order. A failed `GUARD` only skips the remaining requests of its
+own group. Every message that has arrived is answered on the same frame, so a
+client does not have to wait for a response before sending its next message.
+
+#### Ex. 5
+
+Request:
+
+```json
+{"id": 7, "groups": [[{"type": "PING"}], [{"type": "HASH"}]]}
+```
+
+Response:
+
+```json
+{"id": 7, "groups": [[{"type": "PONG"}], [{"type": "HASH_RESPONSE", "value": "F7D18982"}]]}
+```
+
 #### Ex. 1
 
 Request: `[{"type": "PING"}]`
@@ -143,6 +164,17 @@ Response:
     - `domain` (`string`): The name of the memory domain the address
     corresponds to
 
+- `HASH_GUARD`  
+    Checks the hash of the currently loaded ROM against `expected_hash`. Like
+    a `GUARD`, if they don't match, the response will have `value` set to
+    `false`, and all subsequent requests will not be executed and receive the
+    same `GUARD_RESPONSE`.
+
+    Expected Response Type: `GUARD_RESPONSE`
+
+    Additional Fields:
+    - `expected_hash` (`string`): The hash the loaded ROM is expected to have
+
 - `LOCK`  
     Halts emulation and blocks on incoming requests until an `UNLOCK` request
     is received or the client times out. All requests processed while locked
@@ -231,13 +263,14 @@ Response:
     - `value` (`number`): The size of the domain in bytes
 
 - `GUARD_RESPONSE`  
-    The result of an attempted `GUARD` request.
+    The result of an attempted `GUARD` or `HASH_GUARD` request.
 
     Additional Fields:
-    - `value` (`boolean`): true if the memory was validated, false if not
+    - `value` (`boolean`): true if the memory or ROM hash was validated, false
+    if not
     - `address` (`int`): The address of the memory that was invalid (the same
     address provided by the `GUARD`, not the address of the individual invalid
-    byte)
+    byte). Not set for `HASH_GUARD`.
 
 - `LOCKED`  
     Acknowledges `LOCK`.
@@ -415,6 +448,15 @@ request_handlers = {
         return res
     end,
 
+    ["HASH_GUARD"] = function (req)
+        local res = {}
+
+        res["type"] = "GUARD_RESPONSE"
+        res["value"] = rom_hash == req["expected_hash"]
+
+        return res
+    end,
+
     ["LOCK"] = function (req)
         local res = {}
 
@@ -487,7 +529,33 @@ function process_request (req)
     end
 end
 
+function process_requests (data)
+    local res = {}
+    local failed_guard_response = nil
+    for i, req in ipairs(data) do
+        if failed_guard_response ~= nil then
+            res[i] = failed_guard_response
+        else
+            -- An error is more likely to cause an NLua exception than to return an error here
+            local status, response = pcall(process_request, req)
+            if status then
+                res[i] = response
+
+                -- If the GUARD validation failed, skip the remaining commands
+                if response["type"] == "GUARD_RESPONSE" and not response["value"] then
+                    failed_guard_response = response
+                end
+            else
+                if type(response) ~= "string" then response = "Unknown error" end
+                res[i] = {type = "ERROR", err = response}
+            end
+        end
+    end
+    return res
+end
+
 -- Receive data from AP client and send message back
+-- Returns true if a message was handled
 function send_receive ()
     local message, err = client_socket:receive()
 
@@ -497,15 +565,15 @@ function send_receive ()
             print("Connection to client closed")
         end
         current_state = STATE_NOT_CONNECTED
-        return
+        return false
     elseif err == "timeout" then
         unlock()
-        return
+        return false
     elseif err ~= nil then
         print(err)
         current_state = STATE_NOT_CONNECTED
         unlock()
-        return
+        return false
     end
 
     -- Reset timeout timer
@@ -519,31 +587,19 @@ function send_receive ()
     if message == "VERSION" then
         client_socket:send(tostring(SCRIPT_VERSION).."\n")
     else
-        local res = {}
         local data = json.decode(message)
-        local failed_guard_response = nil
-        for i, req in ipairs(data) do
-            if failed_guard_response ~= nil then
-                res[i] = failed_guard_response
-            else
-                -- An error is more likely to cause an NLua exception than to return an error here
-                local status, response = pcall(process_request, req)
-                if status then
-                    res[i] = response
-
-                    -- If the GUARD validation failed, skip the remaining commands
-                    if response["type"] == "GUARD_RESPONSE" and not response["value"] then
-                        failed_guard_response = response
-                    end
-                else
-                    if type(response) ~= "string" then response = "Unknown error" end
-                    res[i] = {type = "ERROR", err = response}
-                end
+        if data["id"] ~= nil then
+            local groups = {}
+            for i, group in ipairs(data["groups"]) do
+                groups[i] = process_requests(group)
             end
+            client_socket:send(json.encode({id = data["id"], groups = groups}).."\n")
+        else
+            client_socket:send(json.encode(process_requests(data)).."\n")
         end
-
-        client_socket:send(json.encode(res).."\n")
     end
+
+    return true
 end
 
 function initialize_server ()
@@ -609,9 +665,10 @@ function main ()
                 end
             end
         else
+            -- Answer every message that has arrived this frame, and keep blocking while locked
             repeat
-                send_receive()
-            until not locked
+                local received = send_receive()
+            until not locked and (not received or current_state == STATE_NOT_CONNECTED)
 
             if timeout_timer <= 0 then
                 print("Client timed out")
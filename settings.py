@@ -37,15 +37,29 @@ def _update_cache() -> None:
 
     try:
         from worlds.AutoWorld import AutoWorldRegister
-        for world in AutoWorldRegister.world_types.values():
-            annotation = world.__annotations__.get("settings", None)
-            if annotation is None or annotation == "ClassVar[Optional['Group']]":
-                continue
-            _world_settings_name_cache[world.settings_key] = f"{world.__module__}.{world.__name__}"
+        _world_settings_name_cache.update(world_settings_names(AutoWorldRegister.world_types.values()))
     finally:
         _world_settings_name_cache_updated = True
 
 
+def world_settings_names(worlds: typing.Iterable[type]) -> dict[str, str]:
+    """Returns settings_key -> qualified name of the world class for worlds that define settings"""
+    names: dict[str, str] = {}
+    for world in worlds:
+        annotation = world.__annotations__.get("settings", None)
+        if annotation is None or annotation == "ClassVar[Optional['Group']]":
+            continue
+        names[getattr(world, "settings_key")] = f"{world.__module__}.{world.__name__}"
+    return names
+
+
+def add_world_settings_names(names: dict[str, str]) -> None:
+    """Fills the world settings cache from names of worlds that are known, but not imported, see worlds.lazy_loading"""
+    global _world_settings_name_cache_updated
+    _world_settings_name_cache.update(names)
+    _world_settings_name_cache_updated = True
+
+
 def fmt_doc(cls: type, level: int) -> str:
     comment = cls.__doc__
     assert comment, f"{cls} has no __doc__"
@@ -598,12 +612,20 @@ class ServerOptions(Group):
         OFF = 0
         ON = 1
 
+    class SaveJournal(Bool):
+        """
+        Write only what changed since the last save to a journal next to the savefile,
+        rewriting the full savefile once the journal grows larger than it.
+        Also applies to rooms hosted by the WebHost, which keep their journal in the database.
+        """
+
     host: str | None = None
     port: int = 38281
     password: str | None = None
     multidata: str | None = None
     savefile: str | None = None
     disable_save: bool = False
+    save_journal: SaveJournal | bool = False
     loglevel: str = "info"
     logtime: bool = False
     server_password: ServerPassword | None = None
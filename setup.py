@@ -57,7 +57,9 @@ if __name__ == "__main__":
     import ModuleUpdate
     ModuleUpdate.update(yes="--yes" in sys.argv or "-y" in sys.argv)
 
+import worlds
 from worlds.LauncherComponents import components, icon_paths
+worlds.load_worlds()  # worlds register their components on import
 from Utils import version_tuple, is_windows, is_linux
 from Cython.Build import cythonize
 
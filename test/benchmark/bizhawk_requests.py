@@ -0,0 +1,42 @@
+def run_bizhawk_requests_benchmark():
+    """Measure requests per second against a fake connector answering once per emulated frame, with 1 and 8 coroutines
+    sending requests concurrently."""
+    import asyncio
+    import logging
+
+    from time_it import TimeIt
+
+    from Utils import init_logging
+    from test.bizhawk import FakeConnector
+    from worlds._bizhawk import BizHawkContext, disconnect, read
+
+    init_logging("Benchmark Runner")
+    logger = logging.getLogger("Benchmark")
+
+    requests_per_coroutine = 60
+    frame_time = 1 / 60
+
+    async def worker(ctx: BizHawkContext, address: int) -> None:
+        for _ in range(requests_per_coroutine):
+            await read(ctx, [(address, 16, "RAM")])
+
+    async def main() -> None:
+        for coroutines in (1, 8):
+            connector = FakeConnector({"RAM": bytearray(0x1000)}, frame_time=frame_time)
+            ctx = BizHawkContext()
+            await connector.connect(ctx)
+            with TimeIt(f"{coroutines} concurrent coroutines", logger) as t:
+                await asyncio.gather(*(worker(ctx, 16 * i) for i in range(coroutines)))
+            logger.info(f"{coroutines} concurrent coroutines: "
+                        f"{coroutines * requests_per_coroutine / t.dif:.1f} requests per second, "
+                        f"{connector.messages} messages for {connector.requests} requests.")
+            disconnect(ctx)
+            await connector.stop()
+
+    asyncio.run(main())
+
+
+if __name__ == "__main__":
+    from path_change import change_home
+    change_home()
+    run_bizhawk_requests_benchmark()
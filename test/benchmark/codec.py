@@ -0,0 +1,62 @@
+def run_codec_benchmark():
+    """Time encoding and decoding typical protocol traffic, like large ReceivedItems syncs and DataPackage responses,
+    with each of the available NetUtils codecs."""
+    import logging
+    import random
+
+    from time_it import TimeIt
+
+    from Utils import init_logging, Version
+    from NetUtils import codecs, JSONCodec, NetworkItem, NetworkPlayer, NetworkSlot, SlotType
+    from worlds import network_data_package
+
+    init_logging("Benchmark Runner")
+    logger = logging.getLogger("Benchmark")
+
+    rng = random.Random(0)
+    players = 100
+    traffic = {
+        "RoomInfo": [{"cmd": "RoomInfo", "version": Version(0, 6, 4), "tags": ["AP"], "password": False,
+                      "games": {"Archipelago"}, "datapackage_checksums": {
+                          game: data["checksum"] for game, data in network_data_package["games"].items()}}],
+        "DataPackage": [{"cmd": "DataPackage", "data": network_data_package}],
+        "Connected": [{"cmd": "Connected", "team": 0, "slot": 1,
+                       "players": [NetworkPlayer(0, slot, f"Player{slot}", f"Player{slot}")
+                                   for slot in range(1, players + 1)],
+                       "slot_info": {slot: NetworkSlot(f"Player{slot}", "Game", SlotType.player)
+                                     for slot in range(1, players + 1)},
+                       "missing_locations": list(range(1000)), "checked_locations": list(range(1000, 1500))}],
+        "ReceivedItems": [{"cmd": "ReceivedItems", "index": 0,
+                           "items": [NetworkItem(rng.randrange(1000), rng.randrange(5000), rng.randint(1, players),
+                                                 rng.choice((0, 1, 2, 4))) for _ in range(5000)]}],
+        "PrintJSON": [{"cmd": "PrintJSON", "type": "ItemSend", "receiving": rng.randint(1, players),
+                       "item": NetworkItem(rng.randrange(1000), location, 1, 1),
+                       "data": [{"text": "1", "type": "player_id"}, {"text": " sent "},
+                                {"text": "5", "player": 2, "flags": 1, "type": "item_id"},
+                                {"text": " to "}, {"text": "2", "type": "player_id"}, {"text": " ("},
+                                {"text": str(location), "player": 1, "type": "location_id"}, {"text": ")"}]}
+                      for location in range(140)],
+        "LocationChecks": [{"cmd": "LocationChecks", "locations": list(range(200))}],
+    }
+
+    reference = JSONCodec()
+    for name, msgs in traffic.items():
+        encoded = reference.encode(msgs)
+        times = {}
+        for codec_name, codec_type in codecs.items():
+            codec = codec_type()
+            assert codec.decode(codec.encode(msgs)) == reference.decode(encoded), f"{codec_name} differs for {name}"
+            runs = max(1, 2_000_000 // len(encoded))
+            with TimeIt(f"{runs} {name} round trips ({len(encoded)} characters) with {codec_name}", logger) as timer:
+                for _ in range(runs):
+                    codec.decode(codec.encode(msgs))
+            times[codec_name] = timer.dif / runs
+        logger.info(f"{name}: " + ", ".join(f"{codec_name} {time * 1000:.3f} ms "
+                                            f"({times[reference.name] / time:.2f}x)"
+                                            for codec_name, time in times.items()))
+
+
+if __name__ == "__main__":
+    from path_change import change_home
+    change_home()
+    run_codec_benchmark()
@@ -0,0 +1,50 @@
+def run_filler_benchmark():
+    """Time remaining_fill placing filler at 100k locations, where some of the locations have item rules, checking
+    that the same seed places the same way each time."""
+    import logging
+    import typing
+
+    from time_it import TimeIt
+
+    from Utils import init_logging
+    from BaseClasses import MultiWorld
+    from test.general import generate_items, generate_locations, generate_test_multiworld
+    from Fill import remaining_fill
+
+    init_logging("Benchmark Runner")
+    logger = logging.getLogger("Benchmark")
+
+    players = 10
+    locations_per_player = 10_000
+
+    def fill(restricted_share: float) -> typing.Tuple[float, typing.List[typing.Tuple[str, str]]]:
+        multiworld: MultiWorld = generate_test_multiworld(players)
+        multiworld.random.seed(0)
+        locations = []
+        items = []
+        restricted_every = round(1 / restricted_share) if restricted_share else 0
+        for player in multiworld.player_ids:
+            player_locations = generate_locations(locations_per_player, player, multiworld.get_region("Menu", player))
+            if restricted_every:
+                # only this player's own items
+                for location in player_locations[::restricted_every]:
+                    location.item_rule = lambda item, player=player: item.player == player
+            locations += player_locations
+            items += generate_items(locations_per_player, player)
+        multiworld.random.shuffle(locations)
+        multiworld.random.shuffle(items)
+        with TimeIt(f"{len(locations)} locations with {restricted_share:.0%} restricted", logger) as t:
+            remaining_fill(multiworld, locations, items)
+        return t.dif, [(location.name, location.item.name) for location in multiworld.get_filled_locations()]
+
+    for restricted_share in (0, 0.01, 0.1):
+        time, placements = fill(restricted_share)
+        if fill(restricted_share)[1] != placements:
+            logger.warning(f"Placements with {restricted_share:.0%} restricted differed for the same seed.")
+        logger.info(f"{restricted_share:.0%} restricted: {time:.2f}s, {time / len(placements) * 1e6:.2f}us per item")
+
+
+if __name__ == "__main__":
+    from path_change import change_home
+    change_home()
+    run_filler_benchmark()
@@ -0,0 +1,66 @@
+def run_slot_data_benchmark():
+    """Time Vagrant Story fill_slot_data for a growing number of Vagrant Story slots in a large multiworld,
+    with the location index shared by all slots versus one walk of the multiworld per slot."""
+    import argparse
+    import logging
+
+    from time_it import TimeIt
+
+    from Utils import init_logging
+    from BaseClasses import MultiWorld, CollectionState
+    from worlds import AutoWorld
+    from worlds.AutoWorld import call_all
+    from worlds.vagrantstory.Locations import build_location_index
+
+    init_logging("Benchmark Runner")
+    logger = logging.getLogger("Benchmark")
+
+    total_players = 500
+    background_game = "ArchipIDLE"
+    vagrant_story = "Vagrant Story"
+
+    def setup(vs_slots: int) -> MultiWorld:
+        multiworld = MultiWorld(total_players)
+        multiworld.game = {player: vagrant_story if player <= vs_slots else background_game
+                           for player in multiworld.player_ids}
+        multiworld.player_name = {player: f"Tester{player}" for player in multiworld.player_ids}
+        multiworld.set_seed(0)
+        args = argparse.Namespace()
+        for player in multiworld.player_ids:
+            world_type = AutoWorld.AutoWorldRegister.world_types[multiworld.game[player]]
+            for name, option in world_type.options_dataclass.type_hints.items():
+                updated_options = getattr(args, name, {})
+                updated_options[player] = option.from_any(option.default)
+                setattr(args, name, updated_options)
+        multiworld.set_options(args)
+        multiworld.state = CollectionState(multiworld)
+        for step in ("generate_early", "create_regions", "create_items", "set_rules"):
+            call_all(multiworld, step)
+        # logic is irrelevant here, only the amount of filled locations matters
+        locations = multiworld.get_unfilled_locations()
+        multiworld.random.shuffle(locations)
+        for location, item in zip(locations, multiworld.itempool):
+            location.place_locked_item(item)
+        return multiworld
+
+    for vs_slots in (1, 10, 50):
+        multiworld = setup(vs_slots)
+        worlds = multiworld.get_game_worlds(vagrant_story)
+        with TimeIt(f"{vs_slots} slots fill_slot_data without index", logger) as unindexed:
+            unindexed_data = []
+            for world in worlds:
+                world.location_index = build_location_index(multiworld, [world.player])
+                unindexed_data.append(world.fill_slot_data())
+        for world in worlds:
+            world.location_index = None
+        with TimeIt(f"{vs_slots} slots fill_slot_data with index", logger) as indexed:
+            indexed_data = [world.fill_slot_data() for world in worlds]
+        assert unindexed_data == indexed_data
+        logger.info(f"{vs_slots} Vagrant Story slots in {total_players} players: "
+                    f"{unindexed.dif / indexed.dif:.2f}x faster with index.")
+
+
+if __name__ == "__main__":
+    from path_change import change_home
+    change_home()
+    run_slot_data_benchmark()
@@ -0,0 +1,47 @@
+def run_yaml_parse_benchmark():
+    """Time parsing the option templates of all worlds, as rendered from data/options.yaml, with and without libyaml,
+    checking that they parse the same."""
+    import logging
+    import os
+    import tempfile
+
+    import yaml
+    from time_it import TimeIt
+
+    import Utils
+    from Utils import init_logging, UniqueKeyConstructorMixin, UniqueKeyLoader
+    from Options import generate_yaml_templates
+
+    init_logging("Benchmark Runner")
+    logger = logging.getLogger("Benchmark")
+
+    class PythonUniqueKeyLoader(UniqueKeyConstructorMixin, yaml.SafeLoader):
+        pass
+
+    with tempfile.TemporaryDirectory() as templates_folder:
+        generate_yaml_templates(templates_folder)
+        texts = []
+        for name in sorted(os.listdir(templates_folder)):
+            if name.endswith(".yaml"):
+                with open(os.path.join(templates_folder, name), encoding="utf-8-sig") as f:
+                    texts.append(f.read())
+
+    loaders = {"UniqueKeyLoader": UniqueKeyLoader, "UniqueKeyLoader on the Python parser": PythonUniqueKeyLoader,
+               "SafeLoader without key checks": Utils.SafeLoader}
+    logger.info(f"Parsing {len(texts)} files of {sum(map(len, texts))} characters, "
+                f"libyaml {'available' if yaml.__with_libyaml__ else 'not available'}.")
+    expected = None
+    for name, loader in loaders.items():
+        with TimeIt(name, logger):
+            for _ in range(5):
+                documents = [list(yaml.load_all(text, Loader=loader)) for text in texts]
+        if expected is None:
+            expected = documents
+        elif documents != expected:
+            logger.warning(f"{name} parsed differently.")
+
+
+if __name__ == "__main__":
+    from path_change import change_home
+    change_home()
+    run_yaml_parse_benchmark()
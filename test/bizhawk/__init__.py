@@ -0,0 +1,161 @@
+import asyncio
+import base64
+import json
+from typing import Any
+
+from worlds._bizhawk import BizHawkContext, ConnectionStatus, get_script_version
+
+
+class FakeConnector:
+    """Stand-in for `connector_bizhawk_generic.lua` serving memory domains from bytearrays over a local socket, so
+    BizHawk clients can be tested and benchmarked without an emulator.
+
+    Like the real script, if `frame_time` is set, every message that arrived is answered once per emulated frame."""
+
+    domains: dict[str, bytearray]
+    system: str
+    rom_hash: str
+    frame_time: float
+    messages: int
+    """Number of messages received, excluding VERSION"""
+    requests: int
+    """Number of individual requests received"""
+
+    script_version: int
+
+    def __init__(self, domains: dict[str, bytearray], system: str = "NULL", rom_hash: str = "00000000",
+                 frame_time: float = 0.0, script_version: int = 2) -> None:
+        self.domains = domains
+        self.script_version = script_version
+        self.system = system
+        self.rom_hash = rom_hash
+        self.frame_time = frame_time
+        self.messages = 0
+        self.requests = 0
+        self._server: asyncio.Server | None = None
+        self._connections: set[asyncio.Task[None]] = set()
+
+    async def start(self) -> int:
+        """Starts listening on a free local port and returns it."""
+        self._server = await asyncio.start_server(self._handle_connection, "127.0.0.1", 0)
+        return self._server.sockets[0].getsockname()[1]
+
+    async def stop(self) -> None:
+        if self._server is not None:
+            self._server.close()
+            self._server = None
+        for task in self._connections:
+            task.cancel()
+        await asyncio.gather(*self._connections, return_exceptions=True)
+
+    async def connect(self, ctx: BizHawkContext) -> None:
+        """Starts the connector if necessary and connects `ctx` to it, like `worlds._bizhawk.connect` and the version
+        check of the game watcher would."""
+        port = await self.start() if self._server is None else self._server.sockets[0].getsockname()[1]
+        ctx.streams = await asyncio.open_connection("127.0.0.1", port)
+        ctx.connection_status = ConnectionStatus.TENTATIVE
+        ctx._port = port
+        await get_script_version(ctx)
+
+    async def _handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        task = asyncio.current_task()
+        assert task is not None
+        self._connections.add(task)
+        lines: asyncio.Queue[bytes] = asyncio.Queue()
+
+        async def read_lines() -> None:
+            while True:
+                line = await reader.readline()
+                lines.put_nowait(line)
+                if not line:
+                    break
+
+        reading = asyncio.create_task(read_lines())
+        try:
+            while True:
+                frame = [await lines.get()]
+                if self.frame_time:
+                    await asyncio.sleep(self.frame_time)
+                # everything else that arrived during this frame is answered with it
+                while not lines.empty():
+                    frame.append(lines.get_nowait())
+                for line in frame:
+                    if not line:
+                        return
+                    writer.write(self.process_line(line) + b"\n")
+                await writer.drain()
+        except (ConnectionResetError, asyncio.CancelledError):
+            pass
+        finally:
+            reading.cancel()
+            writer.close()
+            self._connections.discard(task)
+
+    def process_line(self, line: bytes) -> bytes:
+        if line.strip() == b"VERSION":
+            return str(self.script_version).encode("utf-8")
+        self.messages += 1
+        message = json.loads(line)
+        if isinstance(message, dict):
+            if self.script_version < 2:
+                raise ValueError("Tagged message sent to a version 1 connector")
+            response: Any = {"id": message["id"], "groups": [self.process_message(group)
+                                                             for group in message["groups"]]}
+        else:
+            response = self.process_message(message)
+        return json.dumps(response).encode("utf-8")
+
+    def process_message(self, requests: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        responses: list[dict[str, Any]] = []
+        failed_guard_response: dict[str, Any] | None = None
+        for request in requests:
+            self.requests += 1
+            if failed_guard_response is not None:
+                responses.append(failed_guard_response)
+                continue
+            try:
+                response = self.process_request(request)
+            except Exception as exc:
+                response = {"type": "ERROR", "err": str(exc)}
+            if response["type"] == "GUARD_RESPONSE" and not response["value"]:
+                failed_guard_response = response
+            responses.append(response)
+        return responses
+
+    def process_request(self, request: dict[str, Any]) -> dict[str, Any]:
+        request_type = request["type"]
+        if request_type == "PING":
+            return {"type": "PONG"}
+        if request_type == "SYSTEM":
+            return {"type": "SYSTEM_RESPONSE", "value": self.system}
+        if request_type == "PREFERRED_CORES":
+            return {"type": "PREFERRED_CORES_RESPONSE", "value": {}}
+        if request_type == "HASH":
+            return {"type": "HASH_RESPONSE", "value": self.rom_hash}
+        if request_type == "MEMORY_SIZE":
+            return {"type": "MEMORY_SIZE_RESPONSE", "value": len(self.domains[request["domain"]])}
+        if request_type == "GUARD":
+            expected_data = base64.b64decode(request["expected_data"])
+            address = request["address"]
+            actual_data = self.domains[request["domain"]][address:address + len(expected_data)]
+            return {"type": "GUARD_RESPONSE", "value": actual_data == expected_data, "address": address}
+        if request_type == "HASH_GUARD" and self.script_version >= 2:
+            return {"type": "GUARD_RESPONSE", "value": self.rom_hash == request["expected_hash"]}
+        if request_type == "LOCK":
+            return {"type": "LOCKED"}
+        if request_type == "UNLOCK":
+            return {"type": "UNLOCKED"}
+        if request_type == "READ":
+            address = request["address"]
+            data = self.domains[request["domain"]][address:address + request["size"]]
+            return {"type": "READ_RESPONSE", "value": base64.b64encode(data).decode("ascii")}
+        if request_type == "WRITE":
+            data = base64.b64decode(request["value"])
+            address = request["address"]
+            self.domains[request["domain"]][address:address + len(data)] = data
+            return {"type": "WRITE_RESPONSE"}
+        if request_type == "DISPLAY_MESSAGE":
+            return {"type": "DISPLAY_MESSAGE_RESPONSE"}
+        if request_type == "SET_MESSAGE_INTERVAL":
+            return {"type": "SET_MESSAGE_INTERVAL_RESPONSE"}
+        return {"type": "ERROR", "err": f"Unknown command: {request_type}"}
@@ -0,0 +1,121 @@
+import asyncio
+import unittest
+
+from worlds._bizhawk import BizHawkContext, ConnectionStatus, NotConnectedError, RequestFailedError, disconnect, \
+    get_hash, get_script_version, guarded_read, guarded_write, ping, read
+from . import FakeConnector
+
+
+class TestMultiplexing(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self) -> None:
+        self.memory = bytearray(range(256))
+        self.connector = FakeConnector({"RAM": self.memory}, rom_hash="ABCD1234")
+        self.ctx = BizHawkContext()
+        await self.connector.connect(self.ctx)
+
+    async def asyncTearDown(self) -> None:
+        disconnect(self.ctx)
+        await self.connector.stop()
+
+    async def test_version(self) -> None:
+        self.assertEqual(await get_script_version(self.ctx), 2)
+        self.assertTrue(self.ctx.pipelined)
+        self.assertEqual(self.ctx.connection_status, ConnectionStatus.CONNECTED)
+
+    async def test_same_tick_coalesced(self) -> None:
+        """Tests that requests from coroutines in the same event loop tick share one message and get their own
+        responses back."""
+        results = await asyncio.gather(
+            read(self.ctx, [(0, 2, "RAM")]),
+            get_hash(self.ctx),
+            read(self.ctx, [(10, 1, "RAM"), (20, 1, "RAM")]),
+            ping(self.ctx),
+        )
+        self.assertEqual(results, [[b"\x00\x01"], "ABCD1234", [b"\x0a", b"\x14"], None])
+        self.assertEqual(self.connector.messages, 1)
+        self.assertEqual(self.ctx.messages_sent, 1)
+        self.assertEqual(self.ctx.requests_sent, 5)
+
+    async def test_guard_scoped_to_caller(self) -> None:
+        """Tests that a failed guard only skips the requests of the coroutine that sent it."""
+        failed, passed = await asyncio.gather(
+            guarded_read(self.ctx, [(0, 1, "RAM")], [(5, [0], "RAM")]),
+            guarded_read(self.ctx, [(1, 1, "RAM")], [(5, [5], "RAM")]),
+        )
+        self.assertIsNone(failed)
+        self.assertEqual(passed, [b"\x01"])
+
+    async def test_write_checks_hash(self) -> None:
+        """Tests that writes are refused once the loaded ROM isn't the expected one anymore, within the same message."""
+        self.ctx.expected_hash = "ABCD1234"
+        self.assertTrue(await guarded_write(self.ctx, [(0, [9], "RAM")], []))
+        self.assertEqual(self.memory[0], 9)
+        self.assertEqual(self.connector.messages, 1)
+        self.connector.rom_hash = "FFFF0000"
+        self.assertFalse(await guarded_write(self.ctx, [(0, [7], "RAM")], []))
+        self.assertEqual(self.memory[0], 9)
+        self.assertTrue(self.ctx.hash_mismatch)
+
+    async def test_pipelined(self) -> None:
+        """Tests that messages sent in later ticks don't wait for earlier responses."""
+        self.connector.frame_time = 0.05
+        first = asyncio.create_task(read(self.ctx, [(0, 1, "RAM")]))
+        await asyncio.sleep(0)
+        second = asyncio.create_task(read(self.ctx, [(1, 1, "RAM")]))
+        self.assertEqual(await asyncio.gather(first, second), [[b"\x00"], [b"\x01"]])
+        self.assertEqual(self.connector.messages, 2)
+
+    async def test_disconnect_fails_waiting(self) -> None:
+        self.connector.frame_time = 1
+        request = asyncio.create_task(ping(self.ctx))
+        await asyncio.sleep(0.01)
+        disconnect(self.ctx)
+        with self.assertRaises(NotConnectedError):
+            await request
+        with self.assertRaises(NotConnectedError):
+            await ping(self.ctx)
+
+    async def test_connection_closed(self) -> None:
+        await self.connector.stop()
+        with self.assertRaises(RequestFailedError):
+            await ping(self.ctx)
+        self.assertEqual(self.ctx.connection_status, ConnectionStatus.NOT_CONNECTED)
+
+    async def test_write_error_fails_waiting(self) -> None:
+        """Tests that a failed write fails the requests right away instead of waiting for the timeout."""
+        def fail(data: bytes) -> None:
+            raise ConnectionResetError("reset")
+
+        self.ctx.streams[1].write = fail
+        with self.assertRaises(RequestFailedError):
+            await asyncio.wait_for(ping(self.ctx), timeout=1)
+        self.assertEqual(self.ctx.connection_status, ConnectionStatus.NOT_CONNECTED)
+
+
+class TestVersion1Fallback(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self) -> None:
+        self.memory = bytearray(range(256))
+        self.connector = FakeConnector({"RAM": self.memory}, rom_hash="ABCD1234", script_version=1)
+        self.ctx = BizHawkContext()
+        await self.connector.connect(self.ctx)
+
+    async def asyncTearDown(self) -> None:
+        disconnect(self.ctx)
+        await self.connector.stop()
+
+    async def test_one_at_a_time(self) -> None:
+        """Tests that a version 1 script gets every request list as an untagged message of its own."""
+        self.assertFalse(self.ctx.pipelined)
+        results = await asyncio.gather(
+            read(self.ctx, [(0, 2, "RAM")]),
+            get_hash(self.ctx),
+            ping(self.ctx),
+        )
+        self.assertEqual(results, [[b"\x00\x01"], "ABCD1234", None])
+        self.assertEqual(self.connector.messages, 3)
+
+    async def test_write_without_hash_guard(self) -> None:
+        """Tests that writes to a version 1 script don't use the HASH_GUARD it doesn't know."""
+        self.ctx.expected_hash = "ABCD1234"
+        self.assertTrue(await guarded_write(self.ctx, [(0, [9], "RAM")], []))
+        self.assertEqual(self.memory[0], 9)
@@ -0,0 +1,74 @@
+import unittest
+
+from worlds._bizhawk import BizHawkContext
+from worlds._bizhawk.context import PollScheduler
+
+
+class TestPollScheduler(unittest.TestCase):
+    def setUp(self) -> None:
+        self.bizhawk_ctx = BizHawkContext()
+        self.scheduler = PollScheduler(0.5, 4)
+
+    def test_backoff(self) -> None:
+        """Tests that idle cycles back off exponentially up to the maximum interval."""
+        intervals = []
+        for cycle in range(6):
+            self.scheduler.end_cycle(self.bizhawk_ctx, cycle)
+            intervals.append(self.scheduler.interval)
+        self.assertEqual(intervals, [1, 2, 4, 4, 4, 4])
+
+    def test_activity(self) -> None:
+        """Tests that notified activity and changed reads return to the minimum interval."""
+        for cycle in range(3):
+            self.scheduler.end_cycle(self.bizhawk_ctx, cycle)
+        self.scheduler.notify_activity()
+        self.scheduler.end_cycle(self.bizhawk_ctx, 3)
+        self.assertEqual(self.scheduler.interval, 0.5)
+
+        self.scheduler.end_cycle(self.bizhawk_ctx, 4)
+        self.assertEqual(self.scheduler.interval, 1)
+        self.bizhawk_ctx.read_digest = hash((0, "changed"))
+        self.scheduler.end_cycle(self.bizhawk_ctx, 5)
+        self.assertEqual(self.scheduler.interval, 0.5)
+        # the same reads again are idle
+        self.scheduler.end_cycle(self.bizhawk_ctx, 6)
+        self.assertEqual(self.scheduler.interval, 1)
+
+    def test_fixed_bounds(self) -> None:
+        self.scheduler.set_bounds(0.125, 0.125)
+        for cycle in range(3):
+            self.scheduler.end_cycle(self.bizhawk_ctx, cycle)
+            self.assertEqual(self.scheduler.interval, 0.125)
+
+    def test_hash_cached(self) -> None:
+        """Tests that the ROM hash is only due again after it got stale or invalidated."""
+        self.assertTrue(self.scheduler.hash_due(0))
+        self.assertFalse(self.scheduler.hash_due(1))
+        self.assertTrue(self.scheduler.hash_due(self.scheduler.hash_refresh_interval))
+        self.scheduler.invalidate_hash()
+        self.assertTrue(self.scheduler.hash_due(self.scheduler.hash_refresh_interval + 1))
+        self.assertEqual(self.scheduler.hashes_skipped, 1)
+
+    def test_hash_fixed_interval(self) -> None:
+        """Tests that the ROM hash is due every cycle while polling at a fixed interval."""
+        self.scheduler.set_bounds(0.5, 0.5)
+        self.assertTrue(self.scheduler.hash_due(0))
+        self.assertTrue(self.scheduler.hash_due(0.5))
+        self.assertEqual(self.scheduler.hashes_skipped, 0)
+
+    def test_ping_skipped(self) -> None:
+        """Tests that no ping is due if the connector responded since the previous cycle started."""
+        self.scheduler.begin_cycle(10)
+        self.scheduler.begin_cycle(11)
+        self.bizhawk_ctx.last_response_time = 10.5
+        self.assertFalse(self.scheduler.ping_due(self.bizhawk_ctx))
+        self.scheduler.begin_cycle(12)
+        self.assertTrue(self.scheduler.ping_due(self.bizhawk_ctx))
+
+    def test_requests_per_minute(self) -> None:
+        for second in range(0, 121, 10):
+            self.bizhawk_ctx.messages_sent = second
+            self.bizhawk_ctx.requests_sent = second * 3
+            self.scheduler.end_cycle(self.bizhawk_ctx, second)
+        self.assertAlmostEqual(self.scheduler.messages_per_minute, 60)
+        self.assertAlmostEqual(self.scheduler.requests_per_minute, 180)
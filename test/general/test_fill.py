@@ -1,10 +1,12 @@
+from collections import deque
 from typing import List, Iterable
 import unittest
 
 from Options import Accessibility
 from test.general import generate_items, generate_locations, generate_test_multiworld
 from Fill import FillError, balance_multiworld_progression, fill_restrictive, \
-    distribute_early_items, distribute_items_restrictive
+    distribute_early_items, distribute_items_restrictive, sweep_from_pool, _ExplorationCheckpoint, _LocationIndex, \
+    _SwapStateCache
 from BaseClasses import Entrance, LocationProgressType, MultiWorld, Region, Item, Location, \
     ItemClassification
 from worlds.generic.Rules import CollectionRule, add_item_rule, locality_rules, set_rule
@@ -464,6 +466,109 @@ class TestFillRestrictive(unittest.TestCase):
         self.assertIsNot(loc0.item, player1.prog_items[0], "Filled item was still present in item pool")
 
 
+    def test_exploration_checkpoint(self):
+        """Tests that the maximum exploration states derived from a checkpoint match sweeping from the base state"""
+        multiworld = generate_test_multiworld(2)
+        players = [generate_player_data(multiworld, player, 40, 20) for player in (1, 2)]
+        for player in players:
+            # each pair of locations needs an item, of the other player for odd numbers
+            for number, location in enumerate(player.locations[2:]):
+                owner = players[number % 2 - player.id]
+                set_rule(location, lambda state, item=owner.prog_items[number // 2]: state.has(item.name, item.player))
+        pool = [item for player in players for item in player.prog_items]
+        locations = [location for player in players for location in player.locations]
+        queues = [deque(player.prog_items) for player in players]
+        checkpoint = _ExplorationCheckpoint(multiworld.state)
+
+        while pool:
+            items_to_place = [queue.pop() for queue in queues if queue]
+            for item in items_to_place:
+                pool.remove(item)
+            state = checkpoint.maximum_exploration_state(pool, queues, None)
+            expected_state = sweep_from_pool(multiworld.state, pool)
+            self.assertEqual(state.prog_items, expected_state.prog_items)
+            self.assertEqual(state.advancements, expected_state.advancements)
+            for item in items_to_place:
+                location = next(location for location in locations if location.can_fill(expected_state, item))
+                locations.remove(location)
+                multiworld.push_item(location, item, False)
+
+
+    def test_swap_state_cache(self):
+        """Tests that the swap states derived from the cache match sweeping from the base state"""
+        multiworld = generate_test_multiworld(2)
+        players = [generate_player_data(multiworld, player, 40, 20) for player in (1, 2)]
+        for player in players:
+            # each pair of locations needs an item, of the other player for odd numbers
+            for number, location in enumerate(player.locations[2:]):
+                owner = players[number % 2 - player.id]
+                set_rule(location, lambda state, item=owner.prog_items[number // 2]: state.has(item.name, item.player))
+        pool = [item for player in players for item in player.prog_items]
+        locations = [location for player in players for location in player.locations]
+        queues = [deque(player.prog_items) for player in players]
+        placements = []
+        cache = _SwapStateCache(multiworld.state, size=3)
+
+        while pool:
+            items_to_place = [queue.pop() for queue in queues if queue]
+            for item in items_to_place:
+                pool.remove(item)
+            cache.begin_swap_event(pool, queues, None)
+            for number, location in enumerate(placements[-8:]):
+                placed_item = location.item
+                location.item = None
+                unsafe = number % 3 == 2
+                state = cache.swap_state(location, placed_item, unsafe)
+                expected_state = sweep_from_pool(multiworld.state, [placed_item, *pool] if unsafe else pool)
+                self.assertEqual(state.prog_items, expected_state.prog_items)
+                self.assertEqual(state.advancements, expected_state.advancements)
+                location.item = placed_item
+            if len(placements) > 4 and len(pool) % 3 == 0:
+                # swap two placements the way a successful swap changes their items
+                first, second = placements[-4], placements[-2]
+                first.item, second.item = second.item, first.item
+                first.item.location, second.item.location = first, second
+                cache.swapped(first)
+                cache.swapped(second)
+            expected_state = sweep_from_pool(multiworld.state, pool)
+            for item in items_to_place:
+                location = next(location for location in locations if location.can_fill(expected_state, item))
+                locations.remove(location)
+                multiworld.push_item(location, item, False)
+                placements.append(location)
+        self.assertTrue(cache.hits, "Cache was never used - Test flawed")
+
+    def test_location_index(self):
+        """Tests that the location index finds the same locations as going through the locations in order"""
+        multiworld = generate_test_multiworld(3)
+        players = [generate_player_data(multiworld, player, 30, 10, 20) for player in (1, 2, 3)]
+        locations = [location for player in players for location in player.locations]
+        items = [item for player in players for item in player.prog_items + player.basic_items]
+        multiworld.random.shuffle(locations)
+        multiworld.random.shuffle(items)
+        for number, location in enumerate(locations):
+            if number % 3 == 0:
+                location.progress_type = LocationProgressType.EXCLUDED
+            if number % 4 == 0:
+                location.item_rule = lambda item, player=location.player: item.player == player
+            if number % 5 == 0:
+                set_rule(location, lambda state: False)
+        location_index = _LocationIndex(locations)
+
+        for number, item in enumerate(items):
+            player = item.player if number % 2 else None
+            def can_fill(location: Location) -> bool:
+                return location.can_fill(multiworld.state, item)
+            expected = next((location for location in locations
+                             if (player is None or location.player == player) and can_fill(location)), None)
+            found = location_index.pop_first(can_fill, lambda location: location.can_reach(multiworld.state),
+                                             not (item.advancement or item.useful), player)
+            self.assertIs(found, expected)
+            if found:
+                locations.remove(found)
+            self.assertEqual(location_index.remaining(), locations)
+
+
 class TestDistributeItemsRestrictive(unittest.TestCase):
     def test_basic_distribute(self):
         """Test that distribute_items_restrictive is deterministic"""
@@ -2,7 +2,7 @@ import unittest
 
 from BaseClasses import MultiWorld
 from worlds.AutoWorld import AutoWorldRegister
-from . import setup_solo_multiworld
+from . import generate_test_multiworld, setup_solo_multiworld
 
 
 class TestWorldMemory(unittest.TestCase):
@@ -19,3 +19,42 @@ class TestWorldMemory(unittest.TestCase):
         for game_name, weak in refs.items():
             with self.subTest("Game cleanup", game_name=game_name):
                 self.assertFalse(weak(), "World leaked a reference")
+
+    def test_state_copies(self) -> None:
+        """Tests that copies of a state share the containers of players that did not change since."""
+        import tracemalloc
+        from BaseClasses import CollectionState
+
+        players = 500
+        multiworld = generate_test_multiworld(players)
+        state = CollectionState(multiworld)
+        for player in multiworld.player_ids:
+            for item_number in range(20):
+                state.add_item(f"Item {item_number}", player)
+            state.update_reachable_regions(player)
+
+        def copy_all() -> None:
+            # what copying a state used to take
+            for containers in (state.prog_items, state.reachable_regions, state.blocked_connections):
+                copies.append({player: containers.peek(player).copy() for player in containers})
+
+        def copy_state() -> None:
+            # a copy that one player collects on, like during fill
+            copy = state.copy()
+            copy.add_item("Item", 1)
+            copy.update_reachable_regions(1)
+            copies.append(copy)
+
+        usage: dict[str, int] = {}
+        for name, function in (("containers", copy_all), ("state", copy_state)):
+            copies: list[object] = []
+            tracemalloc.start()
+            for _ in range(20):
+                function()
+            usage[name] = tracemalloc.get_traced_memory()[0]
+            tracemalloc.stop()
+            del copies
+        self.assertLess(usage["state"], usage["containers"] / 4,
+                        "Copying a state copied containers of players that did not change")
+        self.assertEqual(state.count("Item", 1), 0)
+        self.assertEqual(state.count("Item 0", 2), 1)
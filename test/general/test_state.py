@@ -27,3 +27,32 @@ class TestBase(unittest.TestCase):
                     with self.subTest("Step", step=step):
                         call_all(multiworld, step)
                         self.assertTrue(multiworld.get_all_state(False, allow_partial_entrances=True))
+
+
+class TestCopyOnWriteDict(unittest.TestCase):
+    def test_modifications_stay_in_their_copy(self):
+        """Tests that modifying a container, also through a reference from before copying, only changes its own dict."""
+        from BaseClasses import _CopyOnWriteDict
+        original = _CopyOnWriteDict({1: {"a"}, 2: {"b"}})
+        held = original[1]
+        clone = original.copy()
+        held.add("held")
+        original.own(2).add("original")
+        clone[1].add("clone")
+        clone.own(2).add("clone")
+        self.assertEqual(original, {1: {"a", "held"}, 2: {"b", "original"}})
+        self.assertEqual(clone, {1: {"a", "clone"}, 2: {"b", "clone"}})
+        self.assertIs(original[1], held)
+
+    def test_unchanged_containers_are_shared(self):
+        """Tests that copies share containers until they are changed or handed out."""
+        from BaseClasses import _CopyOnWriteDict
+        original = _CopyOnWriteDict({1: {"a"}, 2: {"b"}})
+        clone = original.copy()
+        self.assertIs(clone.peek(1), original.peek(1))
+        self.assertIs(clone.peek(2), original.peek(2))
+        clone.own(1).add("clone")
+        self.assertIsNot(clone.peek(1), original.peek(1))
+        # handed out containers are copied right away
+        handed_out = clone[2]
+        self.assertIsNot(clone.copy().peek(2), handed_out)
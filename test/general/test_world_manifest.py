@@ -0,0 +1,71 @@
+import os
+import unittest
+import unittest.mock
+from tempfile import TemporaryDirectory
+
+import Utils
+import worlds
+from worlds import network_data_package
+from worlds.AutoWorld import AutoWorldRegister
+
+
+class TestWorldManifest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.original_cache_path = getattr(Utils.cache_path, "cached_path", None)
+        self.original_manifest_path = worlds.manifest_path
+        self.cache_tempdir = TemporaryDirectory(prefix="AP_cache_")
+        Utils.cache_path.cached_path = self.cache_tempdir.name
+        worlds.manifest_path = os.path.join(self.cache_tempdir.name, "worlds_manifest.json")
+
+    def tearDown(self) -> None:
+        if self.original_cache_path is None:
+            del Utils.cache_path.cached_path
+        else:
+            Utils.cache_path.cached_path = self.original_cache_path
+        worlds.manifest_path = self.original_manifest_path
+        self.cache_tempdir.cleanup()
+
+    def test_manifest_games(self) -> None:
+        """Every loaded world has to be found in the manifest, with the checksum of its data package."""
+        manifest = worlds.build_manifest()
+        games = {game: checksum for source in manifest["sources"].values() for game, checksum in source["games"].items()}
+        for game, world_type in AutoWorldRegister.world_types.items():
+            if world_type.__module__.startswith("worlds."):
+                with self.subTest(game=game):
+                    self.assertEqual(games.get(game), network_data_package["games"][game]["checksum"])
+
+    def test_manifest_round_trip(self) -> None:
+        self.assertIsNone(worlds.load_manifest())
+        manifest = worlds.build_manifest()
+        worlds.store_manifest(manifest)
+        self.assertEqual(worlds.load_manifest(), manifest)
+        generic = next(source for source in manifest["sources"].values() if "Archipelago" in source["games"])
+        self.assertEqual(Utils.load_data_package_for_checksum("Archipelago", generic["games"]["Archipelago"]),
+                         network_data_package["games"]["Archipelago"])
+
+        generic["stamp"][0] -= 1
+        worlds.store_manifest(manifest)
+        self.assertIsNone(worlds.load_manifest(), "changed world source did not invalidate the manifest")
+
+    def test_retry_failed_source(self) -> None:
+        """World sources that failed when the manifest was built are imported again instead of staying failed."""
+        import dataclasses
+
+        generic = next(source for source in worlds.world_sources if source.module_name == "generic")
+        missing = worlds.WorldSource("missing_world_for_test")
+        with unittest.mock.patch.dict(network_data_package["games"]), \
+                unittest.mock.patch.object(worlds, "failed_world_loads", ["generic"]), \
+                unittest.mock.patch("logging.exception"), \
+                unittest.mock.patch("settings.add_world_settings_names"):
+            self.assertTrue(worlds._retry_world_source(dataclasses.replace(generic, loaded=False)))
+            self.assertNotIn("generic", worlds.failed_world_loads)
+            self.assertIn("Archipelago", network_data_package["games"])
+
+            self.assertFalse(worlds._retry_world_source(missing))
+            self.assertIn("missing_world_for_test", worlds.failed_world_loads)
+
+    def test_lazy_loading_set_too_late(self) -> None:
+        """Worlds are already loaded here, so only setting the mode they were loaded with is allowed."""
+        worlds.set_lazy_loading(worlds.lazy_loading)
+        with self.assertRaises(RuntimeError):
+            worlds.set_lazy_loading(not worlds.lazy_loading)
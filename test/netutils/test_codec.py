@@ -0,0 +1,45 @@
+# Tests for the codecs behind NetUtils.encode and NetUtils.decode
+import json
+import unittest
+
+from NetUtils import (ClientStatus, codecs, Hint, HintStatus, JSONCodec, NetworkItem, NetworkPlayer, NetworkSlot,
+                      SlotType)
+from Utils import Version
+
+sample_msgs = [
+    {"cmd": "RoomInfo", "version": Version(0, 6, 4), "tags": ["AP"], "games": {"Archipelago"}, "time": 1.5},
+    {"cmd": "Connected", "team": 0, "slot": 1, "players": [NetworkPlayer(0, 1, "Alias", "Name")],
+     "slot_info": {1: NetworkSlot("Name", "Game", SlotType.player), 2: NetworkSlot("Group", "Game", SlotType.group,
+                                                                                   [1, 3])},
+     "missing_locations": [1, 2, 3], "checked_locations": frozenset({4}), "hint_points": 0},
+    {"cmd": "ReceivedItems", "index": 0, "items": [NetworkItem(i, -i, i % 3, 1) for i in range(100)]},
+    {"cmd": "PrintJSON", "data": [{"text": "ünïcode ✓"}], "type": "Hint", "receiving": 1,
+     "item": NetworkItem(1, 2, 3, 0), "found": False},
+    {"cmd": "SetReply", "key": "_read_hints_0_1", "value": [Hint(1, 2, 3, 4, False, "", 0, HintStatus.HINT_AVOID)],
+     "status": ClientStatus.CLIENT_GOAL},
+    {"cmd": "Bounced", "data": {"big": 2 ** 70, "nested": {"list": [[1, (2, 3)], None, True]}}},
+]
+
+
+class TestCodecs(unittest.TestCase):
+    def test_wire_compatible(self) -> None:
+        reference = JSONCodec()
+        for name, codec_type in codecs.items():
+            codec = codec_type()
+            with self.subTest(codec=name):
+                for msg in sample_msgs:
+                    encoded = codec.encode([msg])
+                    self.assertEqual(json.loads(encoded), json.loads(reference.encode([msg])))
+                    self.assertEqual(codec.decode(encoded), reference.decode(encoded))
+                    self.assertEqual(reference.decode(encoded), reference.decode(reference.encode([msg])))
+
+    def test_round_trip(self) -> None:
+        for name, codec_type in codecs.items():
+            codec = codec_type()
+            with self.subTest(codec=name):
+                decoded = codec.decode(codec.encode(sample_msgs))
+                self.assertEqual(decoded[1]["players"], [NetworkPlayer(0, 1, "Alias", "Name")])
+                self.assertIsInstance(decoded[2]["items"][5], NetworkItem)
+                self.assertEqual(decoded[2]["items"], sample_msgs[2]["items"])
+                self.assertEqual(decoded[0]["version"], Version(0, 6, 4))
+                self.assertEqual(decoded[5]["data"]["big"], 2 ** 70)
@@ -1,9 +1,13 @@
 # Tests for Generate.py (ArchipelagoGenerate.exe)
 
+import json
 import unittest
+import unittest.mock
 import os
 import os.path
 import sys
+import zipfile
+import zlib
 
 from pathlib import Path
 from tempfile import TemporaryDirectory
@@ -72,6 +76,62 @@ class TestGenerateMain(unittest.TestCase):
 
         self.assertOutput(self.output_tempdir.name)
 
+    def test_generate_seeds(self):
+        sys.argv = [sys.argv[0], '--seed', '0',
+                    '--player_files_path', str(self.abs_input_dir),
+                    '--outputpath', self.output_tempdir.name]
+        summary_path = os.path.join(self.output_tempdir.name, 'summary.jsonl')
+        erargs, seed = Generate.main()
+        results = Generate.generate_seeds(erargs, seed, 2, 2, summary_path)
+
+        self.assertEqual([result["success"] for result in results], [True, True])
+        self.assertEqual(len({result["seed"] for result in results}), 2)
+        with open(summary_path, encoding="utf-8") as summary:
+            self.assertEqual([json.loads(line) for line in summary], results)
+        self.assertEqual(len(list(Path(self.output_tempdir.name).glob('*.zip'))), 2)
+
+    def test_generate_seeds_match_standalone(self):
+        """Tests that the seeds of a batch are generated like they would be on their own."""
+        sys.argv = [sys.argv[0], '--seed', '0',
+                    '--player_files_path', str(self.abs_input_dir),
+                    '--outputpath', self.output_tempdir.name]
+        erargs, seed = Generate.main()
+        results = Generate.generate_seeds(erargs, seed, 2, 1, os.path.join(self.output_tempdir.name, 'summary.jsonl'))
+        batch_seed = results[-1]["seed"]
+
+        with TemporaryDirectory(prefix='AP_out_') as standalone_dir:
+            erargs, _ = Generate.main()
+            erargs.outputpath = standalone_dir
+            erargs.outputname = results[-1]["seed_name"]
+            Main.main(erargs, batch_seed)
+            zip_name = f"AP_{results[-1]['seed_name']}.zip"
+            multidata_name = f"AP_{results[-1]['seed_name']}.archipelago"
+            # compared decompressed, as the playthrough paths in the spoiler and the order of sets in the multidata
+            # can differ between any two runs
+            with zipfile.ZipFile(os.path.join(self.output_tempdir.name, zip_name)) as batch_zip, \
+                    zipfile.ZipFile(os.path.join(standalone_dir, zip_name)) as standalone_zip:
+                self.assertEqual(sorted(batch_zip.namelist()), sorted(standalone_zip.namelist()))
+                batch_multidata, standalone_multidata = (
+                    Generate.Utils.restricted_loads(zlib.decompress(output_zip.read(multidata_name)[1:]))
+                    for output_zip in (batch_zip, standalone_zip))
+                self.assertEqual(batch_multidata, standalone_multidata)
+
+    def test_generate_seeds_own_options(self):
+        """Tests that options modified while generating one seed of a batch don't carry over to the next."""
+        sys.argv = [sys.argv[0], '--seed', '0',
+                    '--player_files_path', str(self.abs_input_dir),
+                    '--outputpath', self.output_tempdir.name]
+        erargs, seed = Generate.main()
+        accessibility = []
+
+        def modify_options(args, seed):
+            accessibility.append(args.accessibility[1].value)
+            args.accessibility[1].value = args.accessibility[1].value + 1
+
+        with unittest.mock.patch.object(Main, "main", modify_options):
+            Generate.generate_seeds(erargs, seed, 2, 1, os.path.join(self.output_tempdir.name, 'summary.jsonl'))
+        self.assertEqual(accessibility, [erargs.accessibility[1].value] * 2)
+
     def test_generate_yaml(self):
         # override host.yaml
         from settings import get_settings
@@ -108,6 +168,9 @@ class TestGenerateWeights(TestGenerateMain):
     # don't need to run these tests
     test_generate_absolute = None
     test_generate_relative = None
+    test_generate_seeds = None
+    test_generate_seeds_match_standalone = None
+    test_generate_seeds_own_options = None
 
     def test_generate_yaml(self):
         from settings import get_settings
@@ -137,3 +200,71 @@ class TestGenerateWeights(TestGenerateMain):
                     result, getattr(namespace, option_name)[player].value,
                     "Generated results from weights file did not match expected value."
                 )
+
+
+class TestGenerateCache(unittest.TestCase):
+    """Tests the caches of parsed yamls and rolled options in Generate.py"""
+
+    def setUp(self):
+        self.original_cache_path = getattr(Generate.Utils.cache_path, "cached_path", None)
+        self.cache_tempdir = TemporaryDirectory(prefix='AP_cache_')
+        Generate.Utils.cache_path.cached_path = self.cache_tempdir.name
+
+    def tearDown(self):
+        if self.original_cache_path is None:
+            del Generate.Utils.cache_path.cached_path
+        else:
+            Generate.Utils.cache_path.cached_path = self.original_cache_path
+        self.cache_tempdir.cleanup()
+
+    def test_weights_cached(self):
+        path = Path(__file__).parent / "data" / "one_player" / "test.yaml"
+        weights = Generate.read_weights_yamls(str(path))
+        with unittest.mock.patch("Generate.parse_yamls", side_effect=AssertionError("yaml was parsed again")):
+            self.assertEqual(Generate.read_weights_yamls(str(path)), weights)
+
+    def test_unused_entries_deleted(self):
+        weights = {"game": "Timespinner", "name": "Player", "Timespinner": {"progression_balancing": 30}}
+        Generate.cached_roll_settings(weights)
+        folder = Generate.Utils.cache_path("generate", "options")
+        kept_path = os.path.join(folder, os.listdir(folder)[0])
+        old_path = os.path.join(folder, "old.pickle")
+        Path(old_path).touch()
+        old_time = os.stat(old_path).st_mtime - Generate.generate_cache_max_age - 1
+        os.utime(old_path, (old_time, old_time))
+        os.utime(kept_path, (old_time, old_time))
+        Generate.cached_roll_settings(weights)  # a cache hit marks the entry as used
+
+        weights["Timespinner"]["progression_balancing"] = 31
+        with unittest.mock.patch.object(Generate, "_cleaned_generate_caches", set()):
+            Generate.cached_roll_settings(weights)
+        self.assertFalse(os.path.exists(old_path))
+        self.assertTrue(os.path.exists(kept_path))
+        self.assertEqual(len(os.listdir(folder)), 2)
+
+    def test_rolled_options_cached(self):
+        weights = {"game": "Timespinner", "name": "Player", "Timespinner": {"progression_balancing": 30}}
+        options = Generate.cached_roll_settings(weights)
+        with unittest.mock.patch("Generate.roll_settings", side_effect=AssertionError("options were rolled again")):
+            cached_options = Generate.cached_roll_settings(weights)
+        self.assertEqual({key: getattr(value, "value", value) for key, value in vars(cached_options).items()},
+                         {key: getattr(value, "value", value) for key, value in vars(options).items()})
+
+        # rolling takes random numbers here, so the result can't be reused
+        weights["Timespinner"]["progression_balancing"] = "random"
+        Generate.cached_roll_settings(weights)
+        with unittest.mock.patch("Generate.roll_settings", return_value=options) as roll_settings:
+            Generate.cached_roll_settings(weights)
+        roll_settings.assert_called_once()
+
+    def test_rolled_options_world_changed(self):
+        from worlds import WorldSource
+
+        weights = {"game": "Timespinner", "name": "Player", "Timespinner": {"progression_balancing": 30}}
+        options = Generate.cached_roll_settings(weights)
+        self.assertIsNotNone(Generate._world_stamp("Timespinner"))
+        # the world's folder was modified since
+        with unittest.mock.patch.object(WorldSource, "stamp", [0, 0]), \
+                unittest.mock.patch("Generate.roll_settings", return_value=options) as roll_settings:
+            Generate.cached_roll_settings(weights)
+        roll_settings.assert_called_once()
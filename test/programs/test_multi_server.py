@@ -1,5 +1,11 @@
+import asyncio
+import os
+import tempfile
 import unittest
-from MultiServer import Context, ServerCommandProcessor
+import unittest.mock
+
+from MultiServer import Client, Context, ServerCommandProcessor, queue_new_items, send_items_to, send_new_items
+from NetUtils import Hint, HintStatus, NetworkItem, decode
 
 
 class TestResolvePlayerName(unittest.TestCase):
@@ -38,3 +44,207 @@ class TestResolvePlayerName(unittest.TestCase):
         assert p.resolve_player("ABC") == (1, 2, "abc"), "case insensitive resolves when 1 match"
         assert p.resolve_player("abcd") == (1, 3, "abCD"), "case insensitive resolves when 1 match"
         assert not p.resolve_player("aB"), "partial name shouldn't resolve to player"
+
+
+class TestItemDelivery(unittest.IsolatedAsyncioTestCase):
+    def setUp(self) -> None:
+        # loading game data alters the shared data packages and isn't needed here
+        with unittest.mock.patch.object(Context, "_load_game_data"):
+            self.ctx = Context("", 0, "", "", 0, 0, False)
+        self.sent: list[tuple[Client, list[dict]]] = []
+
+        async def send_msgs(endpoint: Client, msgs: list[dict]) -> bool:
+            self.sent.append((endpoint, msgs))
+            return True
+
+        self.ctx.send_msgs = send_msgs  # type: ignore[method-assign]
+        self.ctx.clients = {0: {}}
+        for slot in (1, 2, 3):
+            client = Client(None, self.ctx)  # type: ignore[arg-type]
+            client.team, client.slot, client.items_handling = 0, slot, 0b111
+            self.ctx.clients[0][slot] = [client]
+
+    async def test_only_receivers(self) -> None:
+        send_items_to(self.ctx, 0, 2, NetworkItem(1, 1, 1, 0))
+        send_new_items(self.ctx)
+        await asyncio.sleep(0)
+        self.assertEqual([client.slot for client, _ in self.sent], [2])
+        self.assertEqual(self.sent[0][1], [{"cmd": "ReceivedItems", "index": 0, "items": [NetworkItem(1, 1, 1, 0)]}])
+        self.assertFalse(self.ctx.new_item_receivers)
+
+    async def test_coalesced(self) -> None:
+        send_items_to(self.ctx, 0, 2, NetworkItem(1, 1, 1, 0))
+        queue_new_items(self.ctx)
+        send_items_to(self.ctx, 0, 2, NetworkItem(2, 2, 3, 0))
+        queue_new_items(self.ctx)
+        self.assertEqual(self.sent, [], "items sent before the end of the event loop iteration")
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)
+        self.assertEqual(len(self.sent), 1)
+        self.assertEqual(self.sent[0][1][0]["items"], [NetworkItem(1, 1, 1, 0), NetworkItem(2, 2, 3, 0)])
+        self.assertEqual(self.ctx.clients[0][2][0].send_index, 2)
+
+
+class TestMessageFanOut(unittest.IsolatedAsyncioTestCase):
+    def setUp(self) -> None:
+        with unittest.mock.patch.object(Context, "_load_game_data"):
+            self.ctx = Context("", 0, "", "", 0, 0, False)
+        self.clients = []
+        for slot in (1, 2, 3):
+            socket = unittest.mock.Mock(open=True)
+            client = Client(socket, self.ctx)
+            client.team, client.slot = 0, slot
+            self.clients.append(client)
+        self.ctx.clients = {0: {client.slot: [client] for client in self.clients}}
+
+    async def test_batched(self) -> None:
+        hint = {"cmd": "PrintJSON", "data": [{"text": "hint"}], "item": NetworkItem(1, 2, 3, 0)}
+        with unittest.mock.patch("websockets.broadcast") as broadcast, \
+                unittest.mock.patch.object(self.ctx, "dumper", wraps=self.ctx.dumper) as dumper:
+            self.ctx.broadcast_team(0, [{"cmd": "RoomUpdate", "hint_points": 1}])
+            self.ctx.queue_msgs(self.clients[:2], [hint])
+            self.ctx.queue_msgs(self.clients[1:], [hint])
+            broadcast.assert_not_called()
+            await asyncio.sleep(0)
+        self.assertEqual(dumper.call_count, 2, "messages not encoded once")
+        self.assertEqual(broadcast.call_count, 2, "same frame not shared")
+        frames = {frame: sockets for (sockets, frame), _ in broadcast.call_args_list}
+        self.assertEqual(sum(len(sockets) for sockets in frames.values()), 3, "more than one frame per client")
+        self.assertEqual([client.socket for client in self.clients[1:2]],
+                         [socket for frame, sockets in frames.items() if frame.count("PrintJSON") == 2
+                          for socket in sockets])
+        for frame in frames:
+            msgs = decode(frame)
+            self.assertEqual(msgs[0], {"cmd": "RoomUpdate", "hint_points": 1})
+            self.assertEqual(msgs[1:], [hint] * (len(msgs) - 1))
+        self.assertEqual(self.ctx.network_stats.frames, 3)
+        self.assertEqual(self.ctx.network_stats.encoded_msgs, 2)
+
+    async def test_cache_cleared_without_endpoints(self) -> None:
+        for client in self.clients:
+            client.socket.open = False
+        self.ctx.queue_msgs(self.clients, [{"cmd": "RoomUpdate", "hint_points": 1}])
+        self.assertTrue(self.ctx.encoded_msgs)
+        await asyncio.sleep(0)
+        self.assertEqual(self.ctx.encoded_msgs, {}, "encoded messages kept past the event loop iteration")
+
+    async def test_order_kept(self) -> None:
+        sent = []
+
+        async def send(msg: str) -> None:
+            sent.append(decode(msg))
+
+        self.clients[0].socket.send = send
+        with unittest.mock.patch("websockets.broadcast") as broadcast:
+            self.ctx.broadcast(self.clients[:1], [{"cmd": "RoomUpdate"}])
+            await self.ctx.send_msgs(self.clients[0], [{"cmd": "ReceivedItems"}])
+            await asyncio.sleep(0)
+        broadcast.assert_not_called()
+        self.assertEqual(sent, [[{"cmd": "RoomUpdate"}, {"cmd": "ReceivedItems"}]])
+
+
+class TestHintIndex(unittest.TestCase):
+    def test_recheck_location_hints(self) -> None:
+        with unittest.mock.patch.object(Context, "_load_game_data"):
+            ctx = Context("", 0, "", "", 0, 0, False)
+        checked = Hint(2, 1, 10, 1, False)
+        unchecked = Hint(3, 1, 11, 1, False)
+        for hint in (checked, unchecked):
+            for slot in (hint.finding_player, hint.receiving_player):
+                ctx.hints[0, slot].add(hint)
+                ctx.index_hints(0, slot, (hint,))
+
+        ctx.location_checks[0, 1].add(10)
+        changed: set[tuple[int, int]] = set()
+        ctx.recheck_location_hints(0, 1, (10,), changed)
+        found = checked._replace(found=True, status=HintStatus.HINT_FOUND)
+        self.assertEqual(changed, {(0, 1), (0, 2)})
+        self.assertEqual(ctx.hints[0, 1], {found, unchecked})
+        self.assertEqual(ctx.hints[0, 2], {found})
+        self.assertEqual(ctx.hints[0, 3], {unchecked})
+
+
+class TestSaveJournal(unittest.TestCase):
+    def setUp(self) -> None:
+        self.directory = tempfile.TemporaryDirectory()
+        self.ctx = self.make_context()
+        self.ctx.save_journal_enabled = True
+
+    def tearDown(self) -> None:
+        self.directory.cleanup()
+
+    def make_context(self) -> Context:
+        # loading game data alters the shared data packages and isn't needed here
+        with unittest.mock.patch.object(Context, "_load_game_data"):
+            ctx = Context("", 0, "", "", 0, 0, False)
+        ctx.connect_names = {"Player1": (0, 1), "Player2": (0, 2)}
+        ctx.save_filename = os.path.join(self.directory.name, "test.apsave")
+        return ctx
+
+    def load_save(self) -> Context:
+        ctx = self.make_context()
+        with unittest.mock.patch.object(Context, "_start_async_saving"):
+            ctx.init_save()
+        return ctx
+
+    def change(self, item: NetworkItem, location: int, key: str) -> None:
+        send_items_to(self.ctx, 0, 2, item)
+        self.ctx.location_checks[0, 1].add(location)
+        self.ctx.save_journal.add_location_checks((0, 1), {location})
+        self.ctx.stored_data[key] = location
+        self.ctx.save_journal.add_stored_data_key(key)
+
+    def test_journal_replay(self) -> None:
+        self.assertTrue(self.ctx._save())
+        snapshot_size = os.path.getsize(self.ctx.save_filename)
+        self.change(NetworkItem(1, 1, 1, 0), 1, "a")
+        self.ctx.hints[0, 1].add(Hint(2, 1, 5, 1, False, "", 0, HintStatus.HINT_PRIORITY))
+        self.ctx.client_game_state[0, 2] = 30
+        self.assertTrue(self.ctx._save())
+        self.change(NetworkItem(2, 2, 1, 0), 2, "b")
+        self.assertTrue(self.ctx._save())
+        self.assertEqual(os.path.getsize(self.ctx.save_filename), snapshot_size, "journal rewrote the save")
+
+        loaded = self.load_save()
+        self.assertEqual(loaded.received_items, self.ctx.received_items)
+        self.assertEqual(loaded.location_checks, self.ctx.location_checks)
+        self.assertEqual(loaded.hints, self.ctx.hints)
+        self.assertEqual(loaded.stored_data, {"a": 1, "b": 2})
+        self.assertEqual(loaded.client_game_state[0, 2], 30)
+
+    def test_stale_journal(self) -> None:
+        self.assertTrue(self.ctx._save())
+        self.change(NetworkItem(1, 1, 1, 0), 1, "a")
+        self.assertTrue(self.ctx._save())
+        with open(self.ctx.save_filename + ".journal", "ab") as f:
+            f.write(b"\0\0\1\0 incomplete")
+        self.assertEqual(self.load_save().stored_data, {"a": 1}, "incomplete record not ignored")
+
+        # a full save made without the journal leaves the old journal behind, which must not be replayed
+        self.ctx.save_journal_enabled = False
+        self.ctx.stored_data.clear()
+        self.assertTrue(self.ctx._save())
+        self.assertEqual(self.load_save().stored_data, {})
+
+    def test_compaction(self) -> None:
+        self.assertTrue(self.ctx._save())
+        self.ctx.save_journal.size = self.ctx.save_journal.snapshot_size + 1
+        self.change(NetworkItem(1, 1, 1, 0), 1, "a")
+        self.assertTrue(self.ctx._save())
+        self.assertEqual(self.ctx.save_journal.size, 0)
+        with open(self.ctx.save_filename + ".journal", "rb") as f:
+            self.assertEqual(int.from_bytes(f.read(4), "big") + 4, os.path.getsize(f.name), "journal not emptied")
+        self.assertEqual(self.load_save().stored_data, {"a": 1})
+
+    def test_collect_copies(self) -> None:
+        """Tests that collected records don't share objects the event loop keeps changing while they're written."""
+        self.assertTrue(self.ctx._save())
+        self.ctx.stored_data["a"] = [1]
+        self.ctx.save_journal.add_stored_data_key("a")
+        self.ctx.client_game_state[0, 2] = 30
+        records = self.ctx.save_journal.collect(self.ctx)
+        self.ctx.stored_data["a"].append(2)
+        self.ctx.client_game_state[0, 2] = 0
+        self.assertIn(("stored_data", "a", [1]), records)
+        state = next(record[1] for record in records if record[0] == "state")
+        self.assertEqual(state["client_game_state"][0, 2], 30)
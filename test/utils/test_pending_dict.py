@@ -0,0 +1,53 @@
+# Tests for PendingDict in Utils.py
+
+import unittest
+
+from Utils import PendingDict
+
+
+class TestPendingDict(unittest.TestCase):
+    def setUp(self) -> None:
+        self.loads: list[str] = []
+        self.dct = PendingDict({"loaded": 0})
+        self.dct.pending["returned"] = lambda: self.load("returned", 1)
+        self.dct.pending["set"] = lambda: self.load("set", None)
+        self.dct.pending["missing"] = lambda: self.load("missing", None, set_key=False)
+
+    def load(self, key: str, value: object, set_key: bool = True) -> object:
+        self.loads.append(key)
+        if value is None and set_key:
+            dict.__setitem__(self.dct, key, 2)
+        return value
+
+    def test_lookup(self) -> None:
+        self.assertEqual(self.dct["loaded"], 0)
+        self.assertEqual(self.dct["returned"], 1)
+        self.assertIn("set", self.dct)
+        self.assertEqual(self.dct.get("set"), 2)
+        self.assertIsNone(self.dct.get("missing"))
+        with self.assertRaises(KeyError):
+            _ = self.dct["unknown"]
+        self.assertEqual(self.loads, ["returned", "set", "missing"])
+
+    def test_loads_once(self) -> None:
+        self.assertNotIn("missing", self.dct)
+        self.assertNotIn("missing", self.dct)
+        self.assertEqual(self.loads, ["missing"])
+
+    def test_loaded(self) -> None:
+        self.assertEqual(self.dct.loaded(), {"loaded": 0})
+        self.assertEqual(self.loads, [])
+
+    def test_iteration(self) -> None:
+        self.assertEqual(sorted(self.dct), ["loaded", "returned", "set"])
+        self.assertEqual(len(self.dct), 3)
+        self.assertEqual(sorted(self.loads), ["missing", "returned", "set"])
+
+    def test_prepare(self) -> None:
+        self.dct.prepare = lambda: self.loads.append("prepare")
+        self.assertEqual(self.dct["loaded"], 0)
+        self.assertEqual(self.loads, [])
+        self.assertIsNone(self.dct.get("unknown"))
+        self.assertIsNone(self.dct.get("unknown"))
+        self.assertEqual(self.loads, ["prepare"])
+        self.assertIsNone(self.dct.prepare)
@@ -66,3 +66,19 @@ class TestYaml(unittest.TestCase):
             parse_yaml(s)
         with self.assertRaises(Exception):
             next(parse_yamls(s))
+
+    def test_merge_key(self) -> None:
+        s = """
+        a: 1
+        +a: 2
+        """
+        with self.assertRaises(Exception):
+            parse_yaml(s)
+        self.assertEqual({"+a": 1, "b": 2}, parse_yaml("+a: 1\nb: 2\n"))
+
+    def test_libyaml(self) -> None:
+        import yaml
+        from Utils import UniqueKeyLoader
+        if not yaml.__with_libyaml__:
+            self.skipTest("libyaml not available")
+        self.assertTrue(issubclass(UniqueKeyLoader, yaml.CSafeLoader))
@@ -1,5 +1,7 @@
+import functools
 import importlib
 import importlib.util
+import json
 import logging
 import os
 import sys
@@ -7,10 +9,11 @@ import warnings
 import zipimport
 import time
 import dataclasses
-from typing import List
+from typing import Any, Dict, List, Optional
 
-from NetUtils import DataPackage
-from Utils import local_path, user_path
+from NetUtils import DataPackage, GamesPackage
+from Utils import __version__, cache_path, load_data_package_for_checksum, local_path, PendingDict, \
+    store_data_package_for_checksum, user_path
 
 local_folder = os.path.dirname(__file__)
 user_folder = user_path("worlds") if user_path() != local_path() else user_path("custom_worlds")
@@ -26,10 +29,17 @@ __all__ = {
     "local_folder",
     "user_folder",
     "failed_world_loads",
+    "lazy_loading",
+    "set_lazy_loading",
+    "load_worlds",
 }
 
 
 failed_world_loads: List[str] = []
+network_data_package: DataPackage
+# import worlds only when their game is looked up, using the manifest of the last full import to know which games exist
+lazy_loading = False
+manifest_path = cache_path("worlds_manifest.json")
 
 
 @dataclasses.dataclass(order=True)
@@ -38,6 +48,7 @@ class WorldSource:
     is_zip: bool = False
     relative: bool = True  # relative to regular world import folder
     time_taken: float = -1.0
+    loaded: Optional[bool] = dataclasses.field(default=None, compare=False)  # None until load is first called
 
     def __repr__(self) -> str:
         return f"{self.__class__.__name__}({self.path}, is_zip={self.is_zip}, relative={self.relative})"
@@ -48,7 +59,30 @@ class WorldSource:
             return os.path.join(local_folder, self.path)
         return self.path
 
+    @property
+    def module_name(self) -> str:
+        return os.path.basename(self.path).rsplit(".", 1)[0]
+
+    @property
+    def stamp(self) -> List[int]:
+        """Latest modification time and total size of the source's files, to tell if it changed."""
+        if self.is_zip:
+            stat = os.stat(self.resolved_path)
+            return [stat.st_mtime_ns, stat.st_size]
+        mtime = size = 0
+        for root, dirs, files in os.walk(self.resolved_path):
+            dirs[:] = [directory for directory in dirs if directory != "__pycache__"]
+            mtime = max(mtime, os.stat(root).st_mtime_ns)  # catches removed files
+            for file in files:
+                stat = os.stat(os.path.join(root, file))
+                mtime = max(mtime, stat.st_mtime_ns)
+                size += stat.st_size
+        return [mtime, size]
+
     def load(self) -> bool:
+        if self.loaded is not None:  # already loaded, failed or currently loading
+            return self.loaded
+        self.loaded = False
         try:
             start = time.perf_counter()
             if self.is_zip:
@@ -67,6 +101,7 @@ class WorldSource:
             else:
                 importlib.import_module(f".{self.path}", "worlds")
             self.time_taken = time.perf_counter()-start
+            self.loaded = True
             return True
 
         except Exception:
@@ -78,7 +113,7 @@ class WorldSource:
             traceback.print_exc(file=file_like)
             file_like.seek(0)
             logging.exception(file_like.read())
-            failed_world_loads.append(os.path.basename(self.path).rsplit(".", 1)[0])
+            failed_world_loads.append(self.module_name)
             return False
 
 
@@ -100,15 +135,155 @@ for folder in (folder for folder in (user_folder, local_folder) if folder):
             elif entry.is_file() and entry.name.endswith(".apworld"):
                 world_sources.append(WorldSource(file_name, is_zip=True, relative=relative))
 
-# import all submodules to trigger AutoWorldRegister
-world_sources.sort()
-for world_source in world_sources:
-    world_source.load()
 
-# Build the data package for each game.
-from .AutoWorld import AutoWorldRegister
+def build_manifest() -> Dict[str, Any]:
+    """Describes the games of the imported world sources, for lazy_loading to find them without importing them."""
+    from settings import world_settings_names
+    worlds_by_module: Dict[str, List[Any]] = {}
+    for world in AutoWorldRegister.world_types.loaded().values():
+        if world.__module__.startswith("worlds."):
+            worlds_by_module.setdefault(world.__module__.split(".")[1], []).append(world)
+    sources: Dict[str, Dict[str, Any]] = {}
+    for world_source in world_sources:
+        source_worlds = worlds_by_module.get(world_source.module_name, []) if world_source.loaded else []
+        sources[world_source.resolved_path] = {
+            "stamp": world_source.stamp,
+            "loaded": bool(world_source.loaded),
+            "games": {world.game: network_data_package["games"][world.game]["checksum"] for world in source_worlds},
+            "settings": world_settings_names(source_worlds),
+        }
+    return {"version": __version__, "sources": sources}
 
-network_data_package: DataPackage = {
-    "games": {world_name: world.get_data_package_data() for world_name, world in AutoWorldRegister.world_types.items()},
-}
 
+def store_manifest(manifest: Dict[str, Any]) -> None:
+    """Writes the manifest and the data packages of its games to the cache."""
+    for source in manifest["sources"].values():
+        for game in source["games"]:
+            store_data_package_for_checksum(game, network_data_package["games"][game])
+    try:
+        os.makedirs(os.path.dirname(manifest_path), exist_ok=True)
+        with open(manifest_path, "w", encoding="utf-8") as f:
+            json.dump(manifest, f, ensure_ascii=False)
+    except OSError as e:
+        logging.debug(f"Could not store worlds manifest: {e}")
+
+
+def load_manifest() -> Optional[Dict[str, Any]]:
+    """Returns the stored manifest if it still matches world_sources, else None."""
+    try:
+        with open(manifest_path, "r", encoding="utf-8") as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return None
+    sources = manifest.get("sources", {})
+    if manifest.get("version") != __version__ or \
+            len(sources) != len(world_sources) or \
+            any(sources.get(world_source.resolved_path, {}).get("stamp") != world_source.stamp
+                for world_source in world_sources):
+        return None
+    return manifest
+
+
+def _load_world_source(world_source: WorldSource) -> None:
+    world_source.load()  # registers its world types itself
+
+
+def _retry_world_source(world_source: WorldSource) -> bool:
+    """
+    Imports a world source that failed to import when the manifest was built, in case e.g. a missing dependency was
+    installed since. If it works now, its games are added like without lazy_loading and True is returned.
+    """
+    if world_source.module_name in failed_world_loads:
+        failed_world_loads.remove(world_source.module_name)
+    world_source.loaded = None
+    if not world_source.load():
+        return False
+    from settings import add_world_settings_names, world_settings_names
+
+    source_worlds = [world for world in AutoWorldRegister.world_types.loaded().values()
+                     if world.__module__.startswith("worlds.")
+                     and world.__module__.split(".")[1] == world_source.module_name]
+    for world in source_worlds:
+        network_data_package["games"][world.game] = world.get_data_package_data()
+    add_world_settings_names(world_settings_names(source_worlds))
+    return True
+
+
+def _load_game_package(game: str, checksum: str) -> GamesPackage:
+    data_package = load_data_package_for_checksum(game, checksum)
+    if data_package.get("checksum") == checksum:
+        return data_package
+    return AutoWorldRegister.world_types[game].get_data_package_data()
+
+
+def set_lazy_loading(enabled: bool = True) -> None:
+    """
+    Sets lazy_loading. It has to be called before the worlds are loaded, which happens the first time a game or
+    network_data_package is looked up, or load_worlds is called.
+    """
+    global lazy_loading
+    if AutoWorldRegister.world_types.prepare is None and enabled != lazy_loading:
+        raise RuntimeError("Worlds were already loaded.")
+    lazy_loading = enabled
+
+
+def _load_worlds() -> None:
+    global network_data_package
+    manifest = load_manifest() if lazy_loading else None
+    if manifest:
+        # register the games of each source as pending, to be imported and built on first lookup
+        from settings import add_world_settings_names
+
+        network_data_package = {"games": PendingDict()}
+        failed_sources: List[WorldSource] = []
+        for world_source in world_sources:
+            source = manifest["sources"][world_source.resolved_path]
+            if not source["loaded"]:
+                failed_sources.append(world_source)
+                continue
+            for game, checksum in source["games"].items():
+                AutoWorldRegister.world_types.pending[game] = functools.partial(_load_world_source, world_source)
+                network_data_package["games"].pending[game] = functools.partial(_load_game_package, game, checksum)
+            add_world_settings_names(source["settings"])
+        # failures aren't trusted from the manifest, their games aren't known without trying again
+        for world_source in failed_sources:
+            if _retry_world_source(world_source):
+                # the manifest is outdated now, so the next start imports everything and builds it again
+                try:
+                    os.remove(manifest_path)
+                except OSError:
+                    pass
+        del failed_sources
+        # the generic world is part of every multiworld
+        AutoWorldRegister.world_types.load("Archipelago")
+    else:
+        # import all submodules to trigger AutoWorldRegister
+        for world_source in world_sources:
+            world_source.load()
+
+        # Build the data package for each game.
+        network_data_package = {
+            "games": {world_name: world.get_data_package_data()
+                      for world_name, world in AutoWorldRegister.world_types.items()},
+        }
+        if lazy_loading:
+            store_manifest(build_manifest())
+
+
+def load_worlds() -> None:
+    """Loads the worlds now instead of on the first lookup, for what they register on import, like launcher components."""
+    AutoWorldRegister.world_types.ensure_prepared()
+
+
+def __getattr__(name: str) -> Any:
+    if name == "network_data_package" and AutoWorldRegister.world_types.prepare is not None:
+        load_worlds()
+        return network_data_package
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+world_sources.sort()
+from .AutoWorld import AutoWorldRegister
+
+# nothing is imported until the first lookup, so set_lazy_loading can be called after importing worlds
+AutoWorldRegister.world_types.prepare = _load_worlds
@@ -7,14 +7,18 @@ naively passed to BizHawk without validation or modification.
 
 import asyncio
 import base64
+import collections
 import enum
 import json
 import sys
+import time
 from typing import Any, Sequence
 
 
 BIZHAWK_SOCKET_PORT_RANGE_START = 43055
 BIZHAWK_SOCKET_PORT_RANGE_SIZE = 5
+PIPELINED_SCRIPT_VERSION = 2
+"""First connector script version that accepts tagged messages and `HASH_GUARD`"""
 
 
 class ConnectionStatus(enum.IntEnum):
@@ -44,49 +48,194 @@ class SyncError(Exception):
 
 
 class BizHawkContext:
+    """Connection to a connector script.
+
+    Requests are multiplexed: every request list sent during one event loop tick, from any number of coroutines, goes
+    out as one tagged message, and messages are pipelined instead of waiting for the previous response. Responses are
+    routed back to the awaiting coroutines by their message id.
+
+    Scripts older than `PIPELINED_SCRIPT_VERSION` don't understand tagged messages. Until `get_script_version` found a
+    newer script, every request list is sent as an untagged message of its own, one at a time."""
+
     streams: tuple[asyncio.StreamReader, asyncio.StreamWriter] | None
     connection_status: ConnectionStatus
+    script_version: int | None
+    """Version of the connected script, set by `get_script_version`"""
+    messages_sent: int
+    """Number of messages sent to the connector script, each holding one or more request lists"""
+    requests_sent: int
+    """Number of individual requests sent to the connector script"""
+    last_response_time: float
+    """`time.monotonic()` of the last response received from the connector script"""
+    read_digest: int
+    """Running hash over the results of reads, used to notice changes in memory between polls"""
+    expected_hash: str | None
+    """Hash of the ROM writes are meant for. If set, every write is guarded by it on the connector's side, since the
+    client may only re-check it every few seconds otherwise"""
+    hash_mismatch: bool
+    """Set when a write was refused because the loaded ROM no longer has `expected_hash`"""
     _lock: asyncio.Lock
+    """Held while an untagged message waits for its response"""
     _port: int | None
+    _next_message_id: int
+    _pending: list[tuple[list[dict[str, Any]], asyncio.Future[list[dict[str, Any]]]]]
+    """Request lists waiting to be sent at the end of this event loop tick"""
+    _waiting: dict[int, list[asyncio.Future[list[dict[str, Any]]]]]
+    """Message id -> futures of the request lists it holds, in order"""
+    _raw_waiting: collections.deque[asyncio.Future[Any]]
+    """Futures of the untagged messages, which are answered in the order they were sent"""
+    _reader_task: asyncio.Task[None] | None
+    _flush_task: asyncio.Task[None] | None
+    """Sends `_pending` once the current event loop tick is done queueing requests"""
+    _reader_streams: tuple[asyncio.StreamReader, asyncio.StreamWriter] | None
 
     def __init__(self) -> None:
         self.streams = None
         self.connection_status = ConnectionStatus.NOT_CONNECTED
+        self.script_version = None
+        self.messages_sent = 0
+        self.requests_sent = 0
+        self.last_response_time = 0.0
+        self.read_digest = 0
+        self.expected_hash = None
+        self.hash_mismatch = False
         self._lock = asyncio.Lock()
         self._port = None
-
-    async def _send_message(self, message: str):
+        self._next_message_id = 0
+        self._pending = []
+        self._waiting = {}
+        self._raw_waiting = collections.deque()
+        self._reader_task = None
+        self._reader_streams = None
+        self._flush_task = None
+
+    @property
+    def pipelined(self) -> bool:
+        return self.script_version is not None and self.script_version >= PIPELINED_SCRIPT_VERSION
+
+    async def _send_message(self, message: str) -> Any:
+        """Sends an untagged message such as `VERSION` and returns the decoded response once every earlier untagged
+        message was answered."""
         async with self._lock:
+            streams = self._get_streams()
+            future: asyncio.Future[Any] = asyncio.get_running_loop().create_future()
+            self._raw_waiting.append(future)
+            try:
+                streams[1].write(message.encode("utf-8") + b"\n")
+            except (ConnectionError, OSError) as exc:
+                self._close(RequestFailedError(f"Failed to send to BizHawk: {exc}"))
+            return await self._wait_for(future)
+
+    async def request(self, req_list: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """Queues a list of requests to be sent with every other list queued during this event loop tick and returns
+        their responses. A failed `GUARD` only skips the rest of its own list."""
+        self._get_streams()
+        if not self.pipelined:
+            self.messages_sent += 1
+            self.requests_sent += len(req_list)
+            return await self._send_message(json.dumps(req_list))
+
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future[list[dict[str, Any]]] = loop.create_future()
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = loop.create_task(self._flush(), name="BizHawkFlush")
+        self._pending.append((req_list, future))
+        self.requests_sent += len(req_list)
+        return await self._wait_for(future)
+
+    def _get_streams(self) -> tuple[asyncio.StreamReader, asyncio.StreamWriter]:
+        if self.streams is None:
+            raise NotConnectedError("You tried to send a request before a connection to BizHawk was made")
+        if self._reader_task is None or self._reader_task.done() or self._reader_streams is not self.streams:
+            if self._reader_task is not None:
+                self._reader_task.cancel()
+            self._reader_streams = self.streams
+            self._reader_task = asyncio.create_task(self._read_responses(self.streams), name="BizHawkReader")
+        return self.streams
+
+    async def _flush(self) -> None:
+        """Sends every request list queued so far as one message, then waits for the socket to drain before taking the
+        next batch. A failed write fails everything waiting on the connection right away."""
+        while self._pending:
+            pending, self._pending = self._pending, []
             if self.streams is None:
-                raise NotConnectedError("You tried to send a request before a connection to BizHawk was made")
-
+                for _, future in pending:
+                    if not future.done():
+                        future.set_exception(NotConnectedError("Connection to BizHawk was closed"))
+                continue
+
+            message_id = self._next_message_id
+            self._next_message_id += 1
+            self._waiting[message_id] = [future for _, future in pending]
+            self.messages_sent += 1
+            message = json.dumps({"id": message_id, "groups": [req_list for req_list, _ in pending]})
             try:
-                reader, writer = self.streams
-                writer.write(message.encode("utf-8") + b"\n")
-                await asyncio.wait_for(writer.drain(), timeout=5)
-
-                res = await asyncio.wait_for(reader.readline(), timeout=5)
+                self.streams[1].write(message.encode("utf-8") + b"\n")
+                await self.streams[1].drain()
+            except (ConnectionError, OSError) as exc:
+                self._close(RequestFailedError(f"Failed to send to BizHawk: {exc}"))
 
+    async def _wait_for(self, future: asyncio.Future[Any]) -> Any:
+        try:
+            return await asyncio.wait_for(asyncio.shield(future), timeout=5)
+        except asyncio.TimeoutError as exc:
+            future.cancel()
+            self._close(RequestFailedError("Connection timed out"))
+            raise RequestFailedError("Connection timed out") from exc
+
+    async def _read_responses(self, streams: tuple[asyncio.StreamReader, asyncio.StreamWriter]) -> None:
+        reader = streams[0]
+        try:
+            while True:
+                res = await reader.readline()
                 if res == b"":
-                    writer.close()
-                    self.streams = None
-                    self.connection_status = ConnectionStatus.NOT_CONNECTED
                     raise RequestFailedError("Connection closed")
 
                 if self.connection_status == ConnectionStatus.TENTATIVE:
                     self.connection_status = ConnectionStatus.CONNECTED
-
-                return res.decode("utf-8")
-            except asyncio.TimeoutError as exc:
-                writer.close()
-                self.streams = None
-                self.connection_status = ConnectionStatus.NOT_CONNECTED
-                raise RequestFailedError("Connection timed out") from exc
-            except ConnectionResetError as exc:
-                writer.close()
-                self.streams = None
-                self.connection_status = ConnectionStatus.NOT_CONNECTED
-                raise RequestFailedError("Connection reset") from exc
+                self.last_response_time = time.monotonic()
+
+                try:
+                    response = json.loads(res)
+                except ValueError as exc:
+                    raise RequestFailedError(f"Malformed response from BizHawk: {res!r}") from exc
+
+                if isinstance(response, dict):
+                    # tagged, answers the message with this id
+                    for future, group in zip(self._waiting.pop(response["id"], []), response["groups"]):
+                        if not future.done():
+                            future.set_result(group)
+                elif self._raw_waiting:
+                    future = self._raw_waiting.popleft()
+                    if not future.done():
+                        future.set_result(response)
+        except ConnectionResetError:
+            if self.streams is streams:
+                self._close(RequestFailedError("Connection reset"))
+        except RequestFailedError as exc:
+            if self.streams is streams:
+                self._close(exc)
+
+    def _close(self, exc: Exception) -> None:
+        """Closes the connection and fails everything still waiting for a response."""
+        if self.streams is not None:
+            self.streams[1].close()
+            self.streams = None
+        self.connection_status = ConnectionStatus.NOT_CONNECTED
+        self.script_version = None
+        futures = [future for _, future in self._pending]
+        futures.extend(future for waiting in self._waiting.values() for future in waiting)
+        futures.extend(self._raw_waiting)
+        self._pending = []
+        self._waiting.clear()
+        self._raw_waiting.clear()
+        for future in futures:
+            if not future.done():
+                future.set_exception(exc)
+        if self._reader_task is not None and self._reader_task is not asyncio.current_task():
+            self._reader_task.cancel()
+        self._reader_task = None
+        self._reader_streams = None
 
 
 async def connect(ctx: BizHawkContext) -> bool:
@@ -98,6 +247,7 @@ async def connect(ctx: BizHawkContext) -> bool:
     for port in ports:
         try:
             ctx.streams = await asyncio.open_connection("127.0.0.1", port)
+            ctx.script_version = None
             ctx.connection_status = ConnectionStatus.TENTATIVE
             ctx._port = port
             return True
@@ -112,21 +262,20 @@ async def connect(ctx: BizHawkContext) -> bool:
 
 def disconnect(ctx: BizHawkContext) -> None:
     """Closes the connection to the connector script."""
-    if ctx.streams is not None:
-        ctx.streams[1].close()
-        ctx.streams = None
-    ctx.connection_status = ConnectionStatus.NOT_CONNECTED
+    ctx._close(NotConnectedError("Disconnected from BizHawk"))
 
 
 async def get_script_version(ctx: BizHawkContext) -> int:
-    return int(await ctx._send_message("VERSION"))
+    ctx.script_version = int(await ctx._send_message("VERSION"))
+    return ctx.script_version
 
 
 async def send_requests(ctx: BizHawkContext, req_list: list[dict[str, Any]]) -> list[dict[str, Any]]:
     """Sends a list of requests to the BizHawk connector and returns their responses.
 
-    It's likely you want to use the wrapper functions instead of this."""
-    responses = json.loads(await ctx._send_message(json.dumps(req_list)))
+    Lists sent by other coroutines during the same event loop tick are sent to the connector together. It's likely you
+    want to use the wrapper functions instead of this."""
+    responses = await ctx.request(req_list)
     errors: list[ConnectorError] = []
 
     for response in responses:
@@ -271,6 +420,7 @@ async def guarded_read(ctx: BizHawkContext, read_list: Sequence[tuple[int, int,
             if item["type"] != "READ_RESPONSE":
                 raise SyncError(f"Expected response of type READ_RESPONSE or GUARD_RESPONSE but got {item['type']}")
 
+            ctx.read_digest = hash((ctx.read_digest, item["value"]))
             ret.append(base64.b64decode(item["value"]))
 
     return ret
@@ -302,8 +452,13 @@ async def guarded_write(ctx: BizHawkContext, write_list: Sequence[tuple[int, Seq
     - `expected_data` is the bytes that the data starting at this address is expected to match
     - `domain` is the name of the region of memory the address corresponds to
 
-    Returns False if any item in guard_list failed to validate. Otherwise returns True."""
-    res = await send_requests(ctx, [{
+    Returns False if any item in guard_list failed to validate, or if the loaded ROM isn't the one with
+    `ctx.expected_hash` anymore. Otherwise returns True."""
+    hash_guard: list[dict[str, Any]] = []
+    if ctx.expected_hash is not None and ctx.pipelined:
+        # older scripts don't know HASH_GUARD, their writes aren't guarded by the ROM hash
+        hash_guard.append({"type": "HASH_GUARD", "expected_hash": ctx.expected_hash})
+    res = await send_requests(ctx, hash_guard + [{
         "type": "GUARD",
         "address": address,
         "expected_data": base64.b64encode(bytes(expected_data)).decode("ascii"),
@@ -315,6 +470,10 @@ async def guarded_write(ctx: BizHawkContext, write_list: Sequence[tuple[int, Seq
         "domain": domain
     } for address, value, domain in write_list])
 
+    if hash_guard and not res[0]["value"]:
+        ctx.hash_mismatch = True
+        return False
+
     for item in res:
         if item["type"] == "GUARD_RESPONSE":
             if not item["value"]:
@@ -93,10 +93,19 @@ class BizHawkClient(abc.ABC, metaclass=AutoBizHawkClientRegister):
 
     @abc.abstractmethod
     async def game_watcher(self, ctx: "BizHawkClientContext") -> None:
-        """Runs on a loop with the approximate interval `ctx.watcher_timeout`. The currently loaded ROM is guaranteed
-        to have passed your validator when this function is called, and the emulator is very likely to be connected."""
+        """Runs on a loop with an approximate interval between `get_watcher_interval_bounds`, `ctx.watcher_timeout` by
+        default. The currently loaded ROM is guaranteed to have passed your validator when
+        this function is called, and the emulator is very likely to be connected."""
         ...
 
+    def get_watcher_interval_bounds(self, ctx: "BizHawkClientContext") -> tuple[float, float]:
+        """Should return the minimum and maximum time in seconds to wait between calls to `game_watcher`. The watcher
+        runs at the minimum interval after activity (memory read by this handler changed, items were received, or
+        `ctx.poll_scheduler.notify_activity()` was called) and backs off exponentially towards the maximum while idle.
+
+        By default, both are `ctx.watcher_timeout`, which polls at a fixed interval."""
+        return ctx.watcher_timeout, ctx.watcher_timeout
+
     def on_package(self, ctx: "BizHawkClientContext", cmd: str, args: dict) -> None:
         """For handling packages from the server. Called from `BizHawkClientContext.on_package`."""
         pass
@@ -4,9 +4,11 @@ checking or launching the client, otherwise it will probably cause circular impo
 """
 
 import asyncio
+import collections
 import copy
 import enum
 import subprocess
+import time
 from typing import Any
 
 import settings
@@ -19,7 +21,8 @@ from . import BizHawkContext, ConnectionStatus, NotConnectedError, RequestFailed
 from .client import BizHawkClient, AutoBizHawkClientRegister
 
 
-EXPECTED_SCRIPT_VERSION = 1
+EXPECTED_SCRIPT_VERSION = 2
+MINIMUM_SCRIPT_VERSION = 1
 
 
 class AuthStatus(enum.IntEnum):
@@ -39,6 +42,113 @@ class TextCategory(str, enum.Enum):
     SERVER = "server"
 
 
+class PollScheduler:
+    """Decides how long the game watcher waits between cycles, and which connection checks a cycle can skip.
+
+    The interval drops to the minimum whenever there was activity and doubles on every idle cycle up to the maximum.
+    While polling at a fixed interval, the ROM hash is requested every cycle. Otherwise, it is cached and only
+    re-requested every `hash_refresh_interval` seconds, and a ping is only sent if nothing else got a response from
+    the connector since the previous cycle."""
+
+    min_interval: float
+    max_interval: float
+    interval: float
+    """The current time in seconds to wait before the next cycle"""
+    backoff: float = 2
+    hash_refresh_interval: float = 5
+    """Maximum age in seconds of the cached ROM hash, limiting how long a changed ROM can go unnoticed by reads.
+    Writes re-check the hash themselves, see `BizHawkContext.expected_hash`."""
+    pings_skipped: int
+    hashes_skipped: int
+
+    _activity: bool
+    _last_read_digest: int
+    _hash_time: float | None
+    _cycle_start: float
+    _previous_cycle_start: float
+    _samples: collections.deque[tuple[float, int, int]]
+
+    def __init__(self, min_interval: float, max_interval: float) -> None:
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.interval = min_interval
+        self.pings_skipped = 0
+        self.hashes_skipped = 0
+        self._activity = False
+        self._last_read_digest = 0
+        self._hash_time = None
+        self._cycle_start = 0.0
+        self._previous_cycle_start = 0.0
+        self._samples = collections.deque()
+
+    def set_bounds(self, min_interval: float, max_interval: float) -> None:
+        self.min_interval = min_interval
+        self.max_interval = max(min_interval, max_interval)
+        self.interval = min(max(self.interval, self.min_interval), self.max_interval)
+
+    def reset(self, interval: float) -> None:
+        """Poll at a fixed interval, e.g. while there is no handler to decide the bounds."""
+        self.min_interval = self.max_interval = self.interval = interval
+
+    def begin_cycle(self, now: float) -> None:
+        self._previous_cycle_start = self._cycle_start
+        self._cycle_start = now
+
+    def notify_activity(self) -> None:
+        """Poll at the minimum interval again, starting with the next cycle."""
+        self._activity = True
+
+    def invalidate_hash(self) -> None:
+        self._hash_time = None
+
+    def hash_due(self, now: float) -> bool:
+        if self.min_interval == self.max_interval:
+            return True
+        if self._hash_time is None or now - self._hash_time >= self.hash_refresh_interval:
+            self._hash_time = now
+            return True
+        self.hashes_skipped += 1
+        return False
+
+    def ping_due(self, bizhawk_ctx: BizHawkContext) -> bool:
+        if bizhawk_ctx.last_response_time >= self._previous_cycle_start:
+            # something else already got a response from the connector since the previous cycle started
+            self.pings_skipped += 1
+            return False
+        return True
+
+    def end_cycle(self, bizhawk_ctx: BizHawkContext, now: float) -> None:
+        """Updates the interval for the next cycle and samples the request counters."""
+        if bizhawk_ctx.read_digest != self._last_read_digest:
+            self._activity = True
+        self._last_read_digest = bizhawk_ctx.read_digest
+
+        if self._activity:
+            self.interval = self.min_interval
+        else:
+            self.interval = min(self.interval * self.backoff, self.max_interval)
+        self._activity = False
+
+        self._samples.append((now, bizhawk_ctx.messages_sent, bizhawk_ctx.requests_sent))
+        while len(self._samples) > 2 and now - self._samples[1][0] >= 60:
+            self._samples.popleft()
+
+    def _per_minute(self, index: int) -> float:
+        if len(self._samples) < 2:
+            return 0.0
+        first, last = self._samples[0], self._samples[-1]
+        elapsed = last[0] - first[0]
+        return (last[index] - first[index]) * 60 / elapsed if elapsed else 0.0
+
+    @property
+    def messages_per_minute(self) -> float:
+        return self._per_minute(1)
+
+    @property
+    def requests_per_minute(self) -> float:
+        return self._per_minute(2)
+
+
 class BizHawkClientCommandProcessor(ClientCommandProcessor):
     def _cmd_bh(self):
         """Shows the current status of the client's connection to BizHawk"""
@@ -51,6 +161,12 @@ class BizHawkClientCommandProcessor(ClientCommandProcessor):
         elif self.ctx.bizhawk_ctx.connection_status == ConnectionStatus.CONNECTED:
             logger.info("BizHawk Connection Status: Connected")
 
+        scheduler = self.ctx.poll_scheduler
+        logger.info(f"Poll interval: {scheduler.interval:.3f}s ({scheduler.min_interval:.3f}s - "
+                    f"{scheduler.max_interval:.3f}s), {scheduler.messages_per_minute:.1f} messages and "
+                    f"{scheduler.requests_per_minute:.1f} requests per minute, "
+                    f"{scheduler.pings_skipped} pings and {scheduler.hashes_skipped} hash checks skipped")
+
     def _cmd_toggle_text(self, category: str | None = None, toggle: str | None = None):
         """Sets types of incoming messages to forward to the emulator"""
         assert isinstance(self.ctx, BizHawkClientContext)
@@ -127,9 +243,11 @@ class BizHawkClientContext(CommonContext):
     slot_data: dict[str, Any] | None = None
     rom_hash: str | None = None
     bizhawk_ctx: BizHawkContext
+    poll_scheduler: PollScheduler
 
     watcher_timeout: float
-    """The maximum amount of time the game watcher loop will wait for an update from the server before executing"""
+    """The maximum amount of time the game watcher loop will wait for an update from the server before executing, unless
+    the client handler chooses other bounds in `BizHawkClient.get_watcher_interval_bounds`"""
 
     def __init__(self, server_address: str | None, password: str | None):
         super().__init__(server_address, password)
@@ -139,6 +257,7 @@ class BizHawkClientContext(CommonContext):
         self.client_handler = None
         self.bizhawk_ctx = BizHawkContext()
         self.watcher_timeout = 0.5
+        self.poll_scheduler = PollScheduler(self.watcher_timeout, self.watcher_timeout)
 
     def _categorize_text(self, args: dict) -> TextCategory:
         if "type" not in args or args["type"] in {"Hint", "Join", "Part", "TagsChanged", "Goal", "Release", "Collect",
@@ -211,18 +330,25 @@ async def _game_watcher(ctx: BizHawkClientContext):
     showed_connecting_message = False
     showed_connected_message = False
     showed_no_handler_message = False
+    scheduler = ctx.poll_scheduler
 
     while not ctx.exit_event.is_set():
         try:
-            await asyncio.wait_for(ctx.watcher_event.wait(), ctx.watcher_timeout)
+            await asyncio.wait_for(ctx.watcher_event.wait(), scheduler.interval)
         except asyncio.TimeoutError:
             pass
 
+        if ctx.watcher_event.is_set():
+            scheduler.notify_activity()
         ctx.watcher_event.clear()
+        now = time.monotonic()
+        scheduler.begin_cycle(now)
 
         try:
             if ctx.bizhawk_ctx.connection_status == ConnectionStatus.NOT_CONNECTED:
                 showed_connected_message = False
+                scheduler.reset(ctx.watcher_timeout)
+                scheduler.invalidate_hash()
 
                 if not showed_connecting_message:
                     logger.info("Waiting to connect to BizHawk...")
@@ -246,33 +372,47 @@ async def _game_watcher(ctx: BizHawkClientContext):
 
                 script_version = await get_script_version(ctx.bizhawk_ctx)
 
-                if script_version != EXPECTED_SCRIPT_VERSION:
+                if not MINIMUM_SCRIPT_VERSION <= script_version <= EXPECTED_SCRIPT_VERSION:
                     logger.info(f"Connector script is incompatible. Expected version {EXPECTED_SCRIPT_VERSION} but "
                                 f"got {script_version}. Disconnecting.")
                     disconnect(ctx.bizhawk_ctx)
                     continue
 
+                if script_version < EXPECTED_SCRIPT_VERSION:
+                    logger.info(f"Connector script is outdated (version {script_version}), so requests are sent one "
+                                f"at a time. Load connector_bizhawk_generic.lua from the data/lua folder of this "
+                                f"Archipelago install for faster communication.")
+
             showed_connecting_message = False
 
-            await ping(ctx.bizhawk_ctx)
+            if ctx.bizhawk_ctx.hash_mismatch:
+                # a write noticed a different ROM, don't wait for the cached hash to expire
+                ctx.bizhawk_ctx.hash_mismatch = False
+                scheduler.invalidate_hash()
+
+            if scheduler.hash_due(now):
+                # also proves the connection is alive, so no ping is needed
+                rom_hash = await get_hash(ctx.bizhawk_ctx)
+                if ctx.rom_hash is not None and ctx.rom_hash != rom_hash:
+                    if ctx.server is not None and not ctx.server.socket.closed:
+                        logger.info(f"ROM changed. Disconnecting from server.")
+
+                    ctx.auth = None
+                    ctx.username = None
+                    ctx.client_handler = None
+                    ctx.finished_game = False
+                    await ctx.disconnect(False)
+                ctx.rom_hash = rom_hash
+                ctx.bizhawk_ctx.expected_hash = rom_hash
+            elif scheduler.ping_due(ctx.bizhawk_ctx):
+                await ping(ctx.bizhawk_ctx)
 
             if not showed_connected_message:
                 showed_connected_message = True
                 logger.info("Connected to BizHawk")
 
-            rom_hash = await get_hash(ctx.bizhawk_ctx)
-            if ctx.rom_hash is not None and ctx.rom_hash != rom_hash:
-                if ctx.server is not None and not ctx.server.socket.closed:
-                    logger.info(f"ROM changed. Disconnecting from server.")
-
-                ctx.auth = None
-                ctx.username = None
-                ctx.client_handler = None
-                ctx.finished_game = False
-                await ctx.disconnect(False)
-            ctx.rom_hash = rom_hash
-
             if ctx.client_handler is None:
+                scheduler.reset(ctx.watcher_timeout)
                 system = await get_system(ctx.bizhawk_ctx)
                 ctx.client_handler = await AutoBizHawkClientRegister.get_handler(ctx, system)
 
@@ -300,7 +440,10 @@ async def _game_watcher(ctx: BizHawkClientContext):
             ctx.auth_status = AuthStatus.NOT_AUTHENTICATED
 
         # Call the handler's game watcher
+        scheduler.set_bounds(*ctx.client_handler.get_watcher_interval_bounds(ctx))
+        ctx.bizhawk_ctx.read_digest = 0
         await ctx.client_handler.game_watcher(ctx)
+        scheduler.end_cycle(ctx.bizhawk_ctx, time.monotonic())
 
 
 async def _run_game(rom: str):
@@ -1,6 +1,7 @@
 from enum import IntEnum
-from typing import NamedTuple, List, Optional
-import random
+from types import MappingProxyType
+from random import Random
+from typing import NamedTuple, List, Optional, Mapping
 from BaseClasses import Item, ItemClassification # ItemClassification is used for internal logic, but not directly in MedievilItemData itself.
 
 
@@ -22,34 +23,39 @@ class VagrantStoryItemData(NamedTuple):
     progression: bool # Added 'progression' field to the raw data
 
 
+class VagrantStoryItemRecord(NamedTuple):
+    """Everything create_item needs to know about an item, resolved once at import."""
+    name: str
+    code: Optional[int] # Archipelago ID
+    v_code: Optional[int]
+    category: VagrantStoryItemCategory
+    classification: ItemClassification
+
+
 class VagrantStoryItem(Item):
     game: str = "Vagrant Story"
+    __slots__ = ("v_code", "category")
     category:VagrantStoryItemCategory
     v_code: Optional[int] # Make m_code an instance attribute for MedievilItem
 
-    def __init__(self, name: str, classification: ItemClassification, code: Optional[int], player: int):
+    def __init__(self, name: str, classification: ItemClassification, code: Optional[int], player: int,
+                 v_code: Optional[int] = None, category: VagrantStoryItemCategory = VagrantStoryItemCategory.FILLER):
         super().__init__(name, classification, code, player)
         # The 'advancement' attribute is automatically handled by the parent Item class
         # if ItemClassification.progression is passed to its constructor.
-        # You can explicitly set it here for clarity if you prefer, but BaseClasses.Item does this.
-        # self.advancement = classification == ItemClassification.progression
-
-        # Store game-specific data directly on the item instance
-        item_data = item_dictionary.get(name)
-        if item_data:
-            self.v_code = item_data.v_code
-            self.category = item_data.category
-        else:
-            self.v_code = None
-            self.category = VagrantStoryItemCategory.FILLER # Fallback for unknown items
 
+        # Store game-specific data directly on the item instance, unknown items fall back to filler
+        self.v_code = v_code
+        self.category = category
+
+    @classmethod
+    def from_record(cls, record: VagrantStoryItemRecord, player: int) -> "VagrantStoryItem":
+        return cls(record.name, record.classification, record.code, player, record.v_code, record.category)
 
     @staticmethod
     def get_name_to_id() -> dict:
-        base_id = 9901000 
         # Create a dictionary mapping item names to their unique Archipelago IDs.
-        return {item_data.name: (base_id + item_data.v_code) 
-                for item_data in _all_items if item_data.v_code is not None}
+        return {record.name: record.code for record in item_records.values() if record.code is not None}
 
 
 key_item_names = {
@@ -76,16 +82,53 @@ item_descriptions = {
 # Create a dictionary for quick lookup of item data by name
 item_dictionary: dict[str, VagrantStoryItemData] = {item_data.name: item_data for item_data in _all_items}
 
+# In-game code of each item by name, for slot_data
+item_name_to_v_code: Mapping[str, Optional[int]] = MappingProxyType({
+    item_data.name: item_data.v_code for item_data in _all_items
+})
+
+item_base_id = 9901000
+
+
+def get_item_classification(item_data: VagrantStoryItemData) -> ItemClassification:
+    if item_data.progression or item_data.category in (VagrantStoryItemCategory.KEYS, VagrantStoryItemCategory.SIGILS):
+        return ItemClassification.progression
+    if item_data.category in (VagrantStoryItemCategory.GRIMOIRE, VagrantStoryItemCategory.CHAIN_ABILITY,
+                              VagrantStoryItemCategory.DEFENCE_ABILITY):
+        return ItemClassification.useful
+    # Default for FILLER or other categories not explicitly useful/progression
+    return ItemClassification.filler
 
-def BuildItemPool(count: int, options) -> List[str]:
+
+# Read-only lookup of item records by name, so creating an item is a single dict hit
+item_records: Mapping[str, VagrantStoryItemRecord] = MappingProxyType({
+    item_data.name: VagrantStoryItemRecord(
+        item_data.name,
+        None if item_data.v_code is None else item_base_id + item_data.v_code,
+        item_data.v_code,
+        item_data.category,
+        get_item_classification(item_data),
+    ) for item_data in _all_items
+})
+
+
+# Items the rest of the pool is drawn from
+filler_item_names: List[str] = [
+    item_data.name for item_data in _all_items
+    if item_data.category in (VagrantStoryItemCategory.FILLER, VagrantStoryItemCategory.TRAP)
+]
+
+
+def BuildItemPool(count: int, options, random: Random) -> List[str]:
     """
     Generates a list of item names to be used for the item pool.
     This function does NOT create Archipelago Item objects; it only provides their names.
-    The actual Item objects are created in MedievilWorld.create_items.
+    The actual Item objects are created in VagrantStoryWorld.create_items.
 
     Args:
         count (int): The total number of item names to generate.
         options: The options object from the Archipelago multiworld, used for guaranteed items.
+        random (Random): The world's random, so the same seed always results in the same pool.
 
     Returns:
         List[str]: A shuffled list of item names.
@@ -110,19 +153,16 @@ def BuildItemPool(count: int, options) -> List[str]:
         if item_name not in item_pool_names and len(item_pool_names) < count:
                 item_pool_names.append(item_name)
     
-    # Populate the rest of the pool with random filler items
-    filler_item_names = [item_data.name for item_data in _all_items 
-                         if item_data.category == VagrantStoryItemCategory.FILLER or item_data.category == VagrantStoryItemCategory.TRAP]
-    
-
-    for _ in range(count - len(item_pool_names)):
+    # Populate the rest of the pool with random filler items in a single draw
+    filler_count = count - len(item_pool_names)
+    if filler_count > 0:
         if filler_item_names:
-            item_name_to_add = random.choice(filler_item_names)
-            item_pool_names.append(item_name_to_add)
+            item_pool_names.extend(random.choices(filler_item_names, k=filler_count))
         else:
-            print("Warning: Ran out of filler items for Medievil. Duplicating from all available items.")
-            # Fallback: if no specific filler items left, pick from any available item
-            item_pool_names.append(random.choice(list(item_dictionary.keys())))
+            print("Warning: Ran out of filler items for Vagrant Story. Duplicating from all available items.")
+            # Fallback: if there are no filler items, pick from any available item
+            item_pool_names.extend(random.choices(list(item_dictionary.keys()), k=filler_count))
 
     random.shuffle(item_pool_names) # Shuffle the final list of item names
-    return item_pool_names
\ No newline at end of file
+    return item_pool_names
+
@@ -1,7 +1,7 @@
 from enum import IntEnum
-from typing import Optional, NamedTuple, Dict
+from typing import Optional, NamedTuple, Dict, List, Iterable
 
-from BaseClasses import Location, Region
+from BaseClasses import Location, Region, MultiWorld
 from .Items import VagrantStoryItem
 
 class VagrantStoryLocationCategory(IntEnum):
@@ -18,6 +18,30 @@ class VagrantStoryLocationData(NamedTuple):
     category: VagrantStoryLocationCategory
 
 
+class VagrantStoryLocationIndex(NamedTuple):
+    # receiving player -> filled locations holding one of their items
+    received: Dict[int, List[Location]]
+    # sending player -> their own filled locations
+    sent: Dict[int, List[Location]]
+
+
+def build_location_index(multiworld: MultiWorld, players: Iterable[int]) -> VagrantStoryLocationIndex:
+    """
+    Walks every filled location of the multiworld exactly once and buckets it by receiving and sending player,
+    for the given players only. Relative location order matches multiworld.get_filled_locations().
+    """
+    received: Dict[int, List[Location]] = {player: [] for player in players}
+    sent: Dict[int, List[Location]] = {player: [] for player in players}
+    for location in multiworld.get_filled_locations():
+        receiver = received.get(location.item.player)
+        if receiver is not None:
+            receiver.append(location)
+        sender = sent.get(location.player)
+        if sender is not None:
+            sender.append(location)
+    return VagrantStoryLocationIndex(received, sent)
+
+
 class VagrantStoryLocation(Location):
     game: str = "Vagrant Story"
     category: VagrantStoryLocationCategory
@@ -40,4 +40,4 @@ class VagrantStoryOption(PerGameCommonOptions):
     goal: GoalOption
     progression_option: ProgressionOption
     deathlink: DeathLinkToggle
-    guaranteed_items: GuaranteedItemsOption
\ No newline at end of file
+    guaranteed_items: GuaranteedItemsOption
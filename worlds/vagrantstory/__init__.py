@@ -1,5 +1,6 @@
 # world/dc2/__init__.py
-from typing import Dict, Set, List
+import logging
+from typing import Dict, Set, List, Optional
 
 from BaseClasses import MultiWorld, Region, Item, Entrance, Tutorial, ItemClassification, CollectionState
 from Options import Toggle
@@ -7,8 +8,10 @@ from Options import Toggle
 from worlds.AutoWorld import World, WebWorld
 from worlds.generic.Rules import set_rule, add_rule, add_item_rule
 
-from .Items import VagrantStoryItem, VagrantStoryItemCategory, item_dictionary, key_item_names, item_descriptions, BuildItemPool
-from .Locations import VagrantStoryLocation, VagrantStoryLocationCategory, VagrantStoryLocationData, location_tables, location_dictionary
+from .Items import VagrantStoryItem, VagrantStoryItemCategory, item_dictionary, item_records, key_item_names, item_descriptions, BuildItemPool, \
+    item_name_to_v_code
+from .Locations import VagrantStoryLocation, VagrantStoryLocationCategory, VagrantStoryLocationData, location_tables, location_dictionary, \
+    VagrantStoryLocationIndex, build_location_index
 from .Options import VagrantStoryOption, GoalOptions
 
 class VagrantStoryWeb(WebWorld):
@@ -40,6 +43,7 @@ class VagrantStoryWorld(World):
     data_version = 0
     base_id = 1230000
     enabled_location_categories: Set[VagrantStoryLocationCategory]
+    location_index: Optional[VagrantStoryLocationIndex]
     required_client_version = (0, 5, 0)
     item_name_to_id = VagrantStoryItem.get_name_to_id()
     location_name_to_id = VagrantStoryLocation.get_name_to_id()
@@ -55,6 +59,7 @@ class VagrantStoryWorld(World):
         self.locked_locations = []
         self.main_path_locations = []
         self.enabled_location_categories = set()
+        self.location_index = None
 
 
     def generate_early(self):
@@ -138,40 +143,30 @@ class VagrantStoryWorld(World):
             if not location.locked and location.address is not None:
                 randomized_location_count += 1
         
-        print(f"Requesting itempool size for randomized locations: {randomized_location_count}")
+        logging.debug(f"Requesting itempool size for randomized locations: {randomized_location_count}")
         
         # Call BuildItemPool to get a list of item NAMES (strings)
-        item_names_to_add = BuildItemPool(randomized_location_count, self.options)
+        item_names_to_add = BuildItemPool(randomized_location_count, self.options, self.random)
         
         generated_items: List[Item] = []
         for item_name in item_names_to_add:
             new_item = self.create_item(item_name)
             generated_items.append(new_item)
             
-        print(f"Created item pool size: {len(generated_items)}")
+        logging.debug(f"Created item pool size: {len(generated_items)}")
 
         # Add the generated VagrantStoryItem objects to the multiworld's item pool
         self.multiworld.itempool.extend(generated_items)
 
     def create_item(self, name: str) -> Item:
-        item_data = item_dictionary.get(name)
+        record = item_records.get(name)
         
-        if not item_data:
+        if not record:
             # Fallback for unknown items. This indicates a data inconsistency.
-            print(f"Warning: Attempted to create unknown item: {name}. Falling back to filler.")
+            logging.warning(f"Attempted to create unknown item: {name}. Falling back to filler.")
             return VagrantStoryItem(name, ItemClassification.filler, None, self.player)
 
-        # Determine the Archipelago ItemClassification based on VagrantStoryItemData.
-        item_classification: ItemClassification
-
-        if item_data.progression or item_data.category == VagrantStoryItemCategory.KEYS or item_data.category == VagrantStoryItemCategory.SIGILS:
-            item_classification = ItemClassification.progression
-        elif item_data.category == VagrantStoryItemCategory.GRIMOIRE or item_data.category == VagrantStoryItemCategory.CHAIN_ABILITY or item_data.category == VagrantStoryItemCategory.DEFENCE_ABILITY:
-            item_classification = ItemClassification.useful
-        else: # Default for FILLER or other categories not explicitly useful/progression
-            item_classification = ItemClassification.filler
-
-        return VagrantStoryItem(name, item_classification, VagrantStoryItem.get_name_to_id()[name], self.player)
+        return VagrantStoryItem.from_record(record, self.player)
 
     def get_filler_item_name(self) -> str:
         return "Gil (50)" # this clearly needs looked into
@@ -221,32 +216,34 @@ class VagrantStoryWorld(World):
     def fill_slot_data(self) -> Dict[str, object]:
         slot_data: Dict[str, object] = {}
 
+        if self.location_index is None:
+            # the first Vagrant Story slot builds the index for all of them,
+            # so the whole multiworld is walked once instead of once per slot
+            worlds = self.multiworld.get_game_worlds(self.game)
+            index = build_location_index(self.multiworld, [world.player for world in worlds])
+            for world in worlds:
+                world.location_index = index
+        index = self.location_index
 
-        name_to_medievil_code = {item.name: item.v_code for item in item_dictionary.values()}
         # Create the mandatory lists to generate the player's output file
         items_id = []
         items_address = []
         locations_id = [] 
         locations_address = []
         locations_target = []
-        for location in self.multiworld.get_filled_locations():
-
-            if location.item is not None:
-                if location.item.player == self.player:
-                    #we are the receiver of the item
-                    items_id.append(location.item.code)
-                    items_address.append(name_to_medievil_code[location.item.name])
+        for location in index.received[self.player]:
+            #we are the receiver of the item
+            items_id.append(location.item.code)
+            items_address.append(item_name_to_v_code[location.item.name])
 
-
-            if location.player == self.player:
-                #we are the sender of the location check
-                locations_address.append(item_dictionary[location_dictionary[location.name].default_item].v_code)
-                locations_id.append(location.address)
-                if location.item is not None:
-                    if location.item.player == self.player:
-                        locations_target.append(name_to_medievil_code[location.item.name])
-                    else:
-                        locations_target.append(0)
+        for location in index.sent[self.player]:
+            #we are the sender of the location check
+            locations_address.append(item_dictionary[location_dictionary[location.name].default_item].v_code)
+            locations_id.append(location.address)
+            if location.item.player == self.player:
+                locations_target.append(item_name_to_v_code[location.item.name])
+            else:
+                locations_target.append(0)
 
         slot_data = {
             "options": {
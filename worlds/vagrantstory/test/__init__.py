@@ -0,0 +1,5 @@
+from test.bases import WorldTestBase
+
+
+class VagrantStoryTestBase(WorldTestBase):
+    game = "Vagrant Story"
@@ -0,0 +1,30 @@
+from collections import Counter
+from random import Random
+
+from . import VagrantStoryTestBase
+from ..Items import BuildItemPool, VagrantStoryItemCategory, filler_item_names, item_dictionary
+
+
+class TestItemPool(VagrantStoryTestBase):
+    def test_same_seed_same_pool(self) -> None:
+        """Tests that the item pool only depends on the random it is built with."""
+        for seed in (0, 1, 12345):
+            with self.subTest(seed=seed):
+                first = BuildItemPool(500, self.world.options, Random(seed))
+                second = BuildItemPool(500, self.world.options, Random(seed))
+                self.assertEqual(first, second)
+                self.assertEqual(len(first), 500)
+
+    def test_filler_draw(self) -> None:
+        """Tests that the rest of the pool is drawn from every filler item and nothing else."""
+        pool = BuildItemPool(500, self.world.options, Random(0))
+        self.assertEqual(Counter(item_dictionary[name].category for name in pool),
+                         {VagrantStoryItemCategory.FILLER: 500})
+        self.assertEqual(set(pool), set(filler_item_names))
+
+    def test_same_seed_same_generation(self) -> None:
+        """Tests that generating twice with the same seed results in identical pools."""
+        self.world_setup(42)
+        pool = [item.name for item in self.multiworld.itempool]
+        self.world_setup(42)
+        self.assertEqual(pool, [item.name for item in self.multiworld.itempool])